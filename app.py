@@ -2,6 +2,7 @@
 import streamlit as st
 from prompt_manager import PromptManager
 from user_manager import UserManager
+from src.views.cache import cached_read
 
 class App:
     def __init__(self):
@@ -19,17 +20,16 @@ class App:
         st.sidebar.title("사용자 관리")
         
         # 기존 사용자 선택
-        users = self.user_manager.get_all_users()
-        if not users.empty:
+        usernames = cached_read(self.user_manager.get_usernames, scopes=('users',))
+        if usernames:
             selected_user = st.sidebar.selectbox(
                 "기존 사용자 선택",
-                options=users['username'].tolist(),
+                options=usernames,
                 index=None
             )
             if selected_user:
-                user_info = users[users['username'] == selected_user].iloc[0]
                 st.session_state.current_user = {
-                    'username': user_info['username']
+                    'username': selected_user
                 }
         
         # 새 사용자 등록
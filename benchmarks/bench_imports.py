@@ -0,0 +1,137 @@
+"""시작 시 모듈 가져오기 시간 벤치마크 (-X importtime 요약)
+
+    python -m benchmarks.bench_imports
+    python -m benchmarks.bench_imports --save benchmarks/baselines/importtime.json
+    python -m benchmarks.bench_imports --baseline benchmarks/baselines/importtime.json
+
+main.py 와 명령줄 도구를 새 인터프리터에서 가져올 때의 누적 시간과 무거운 의존성
+로드 여부를 측정합니다. 기준 파일과 비교해 시간이 허용 범위를 넘거나 새 무거운
+의존성이 시작 경로에 들어오면 종료 코드 1 을 반환합니다.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = {
+    'app': 'import main',
+    'cli': 'import src.cli'
+}
+
+# 시작 경로에서 빠져 있어야 하는 무거운 의존성
+HEAVY_MODULES = ['pandas', 'numpy', 'altair', 'pyarrow', 'jinja2', 'requests', 'yaml', 'tenacity']
+
+
+def parse_importtime(stderr: str):
+    """-X importtime 출력에서 (모듈, 자체 시간, 누적 시간, 깊이) 목록 추출"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' '))) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+
+def measure(statement: str, repeat: int) -> dict:
+    """새 인터프리터에서 가져오기 시간 측정 (반복 중 최솟값)"""
+    runs = []
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', statement],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            env={**os.environ, 'PYTHONPATH': ROOT}
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+        runs.append(parse_importtime(completed.stderr))
+
+    module = statement.split()[-1]
+    entries = min(runs, key=lambda run: _target_entry(run, module)[2])
+    _, _, total_us, _ = _target_entry(entries, module)
+    loaded = {name.split('.')[0] for name, _, _, _ in entries}
+    return {
+        'total_ms': round(total_us / 1000, 1),
+        'modules': len(entries),
+        'heavy_modules': sorted(name for name in HEAVY_MODULES if name in loaded),
+        'top': [
+            {'module': name, 'cumulative_ms': round(cumulative / 1000, 1)}
+            for name, _, cumulative, _ in sorted(
+                _direct_imports(entries, module), key=lambda e: e[2], reverse=True
+            )[:10]
+        ]
+    }
+
+
+def _target_entry(entries, module: str):
+    """측정 대상 모듈 항목 (자식 모듈 시간 포함)"""
+    return next(e for e in entries if e[0] == module and e[3] == 0)
+
+
+def _direct_imports(entries, module: str):
+    """대상 모듈이 직접 가져온 모듈 (출력에서 대상 바로 앞의 한 단계 아래 항목)"""
+    index = entries.index(_target_entry(entries, module))
+    children = []
+    for entry in reversed(entries[:index]):
+        if entry[3] == 0:
+            break
+        if entry[3] == 1:
+            children.append(entry)
+    return children
+
+
+def compare(results: dict, baseline: dict, tolerance: float, min_delta_ms: float) -> list:
+    """기준 대비 회귀 항목 (작은 절대 차이는 측정 잡음으로 봄)"""
+    regressions = []
+    for target, result in results.items():
+        base = baseline.get(target)
+        if base is None:
+            continue
+        delta = result['total_ms'] - base['total_ms']
+        if delta > base['total_ms'] * tolerance and delta > min_delta_ms:
+            regressions.append(
+                f"{target}: {base['total_ms']}ms -> {result['total_ms']}ms"
+            )
+        added = sorted(set(result['heavy_modules']) - set(base['heavy_modules']))
+        if added:
+            regressions.append(f"{target}: 새 무거운 의존성 {', '.join(added)}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시작 시 가져오기 시간 벤치마크')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--save', help='결과를 기준 파일로 저장')
+    parser.add_argument('--baseline', help='비교할 기준 파일')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='허용 시간 증가율')
+    parser.add_argument('--min-delta-ms', type=float, default=50.0, help='회귀로 볼 최소 증가 시간')
+    args = parser.parse_args()
+
+    results = {target: measure(statement, args.repeat) for target, statement in TARGETS.items()}
+    output = {'results': results}
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            output['regressions'] = compare(
+                results, json.load(f), args.tolerance, args.min_delta_ms
+            )
+        status = 1 if output['regressions'] else 0
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    print(json.dumps(output, ensure_ascii=False, indent=2))
+    sys.exit(status)
+
+
+if __name__ == '__main__':
+    main()
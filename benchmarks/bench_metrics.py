@@ -0,0 +1,79 @@
+"""평가 지표 처리량 벤치마크
+
+    python -m benchmarks.bench_metrics --pairs 10000
+
+벡터화된 BatchMetrics 와 쌍별 파이썬 루프 구현의 초당 처리 쌍 수를 비교합니다.
+"""
+from collections import Counter
+import argparse
+import json
+import random
+import time
+from src.utils.metrics import BatchMetrics
+from src.utils.tokenizer import tokenize
+
+WORDS = (
+    "계약서 검토 위험 조항 금융 상품 요약 수익률 규정 결과 분석 고객 답변 "
+    "the model answer correct policy clause summary risk report customer"
+).split()
+
+
+def make_pairs(count: int, seed: int = 42):
+    """결정적 (답변, 기대결과) 쌍 생성"""
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(count):
+        expected = rng.choices(WORDS, k=rng.randint(5, 80))
+        response = [
+            word if rng.random() < 0.7 else rng.choice(WORDS)
+            for word in expected
+        ] + rng.choices(WORDS, k=rng.randint(0, 20))
+        pairs.append((' '.join(response), ' '.join(expected)))
+    return pairs
+
+
+def loop_metrics(response: str, expected: str):
+    """비교 기준: 쌍별 파이썬 루프 구현"""
+    a, b = tokenize(response), tokenize(expected)
+    common = sum((Counter(a) & Counter(b)).values())
+    previous = [0] * (len(b) + 1)
+    for x in a:
+        current = [0]
+        for j, y in enumerate(b):
+            current.append(previous[j] + 1 if x == y else max(previous[j + 1], current[j]))
+        previous = current
+    return common, previous[-1], a == b
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pairs', type=int, default=10000)
+    parser.add_argument('--baseline-sample', type=int, default=1000)
+    args = parser.parse_args()
+    
+    pairs = make_pairs(args.pairs)
+    responses = [r for r, _ in pairs]
+    expected = [e for _, e in pairs]
+    
+    start = time.perf_counter()
+    BatchMetrics().score(responses, expected)
+    vectorized = time.perf_counter() - start
+    
+    sample = pairs[:args.baseline_sample]
+    start = time.perf_counter()
+    for response, target in sample:
+        loop_metrics(response, target)
+    loop = time.perf_counter() - start
+    
+    print(json.dumps({
+        'pairs': args.pairs,
+        'vectorized_sec': round(vectorized, 3),
+        'vectorized_pairs_per_sec': round(args.pairs / vectorized),
+        'loop_sample': len(sample),
+        'loop_pairs_per_sec': round(len(sample) / loop),
+        'speedup': round((args.pairs / vectorized) / (len(sample) / loop), 1)
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
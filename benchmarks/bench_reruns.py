@@ -0,0 +1,107 @@
+"""Streamlit 재실행 지연 시간 벤치마크
+
+    python -m benchmarks.bench_reruns --prompts 5000 --reruns 5
+
+임시 디렉터리에 결정적 프롬프트 데이터를 만든 뒤 streamlit.testing 의 AppTest 로
+main.py 를 실행해 첫 화면 렌더링 시간과 메뉴별 재실행 시간을 측정합니다.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+from src.database.database import PromptDatabase
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MENUS = ["프롬프트 히스토리", "분석 대시보드", "변경 이력"]
+
+WORDS = (
+    "계약서 검토 위험 조항 금융 상품 요약 수익률 규정 결과 분석 고객 답변 "
+    "please explain the answer policy clause summary risk report customer example"
+).split()
+
+
+def make_database(path: str, count: int, seed: int = 42):
+    """결정적 프롬프트 데이터 생성"""
+    rng = random.Random(seed)
+    database = PromptDatabase(path)
+    with database.get_connection() as conn:
+        conn.executemany(
+            '''
+            INSERT INTO prompts
+            (title, model, version, category, prompt_content, chatbot_response,
+             expected_result, created_by, department)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''',
+            [
+                (
+                    ' '.join(rng.choices(WORDS, k=4)),
+                    rng.choice(['클로드', 'GPT-3.5', '기타']),
+                    f"1.0.{i % 10}",
+                    rng.choice(['법률', '사내규정', '금융', '기타']),
+                    ' '.join(rng.choices(WORDS, k=rng.randint(20, 200))),
+                    ' '.join(rng.choices(WORDS, k=rng.randint(10, 80))),
+                    ' '.join(rng.choices(WORDS, k=rng.randint(10, 80))),
+                    f"user{i % 20}",
+                    rng.choice(['개발팀', '법무팀', '재무팀'])
+                )
+                for i in range(count)
+            ]
+        )
+        conn.execute(
+            '''
+            INSERT INTO prompt_change_logs
+            (name, title, prompt_id, version_number, change_summary, changed_by)
+            SELECT 'Prompt_' || version, 'Version ' || version, id, version, 'Initial creation', created_by
+            FROM prompts
+            '''
+        )
+
+
+def timed(action) -> float:
+    start = time.perf_counter()
+    action()
+    return (time.perf_counter() - start) * 1000
+
+
+def run(prompts: int, reruns: int, settle: float = 0.0) -> dict:
+    from streamlit.testing.v1 import AppTest
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            make_database(os.path.join(workdir, 'prompts.db'), prompts)
+            app = AppTest.from_file(os.path.join(ROOT, 'main.py'), default_timeout=600)
+
+            results = {'prompts': prompts, 'first_paint_ms': round(timed(app.run), 1)}
+            # 백그라운드 예열이 끝난 뒤의 지연 시간만 보려면 대기
+            time.sleep(settle)
+            for menu in MENUS:
+                app.sidebar.selectbox[0].select(menu)
+                first = timed(app.run)
+                latencies = [timed(app.run) for _ in range(reruns)]
+                results[menu] = {
+                    'first_ms': round(first, 1),
+                    'rerun_median_ms': round(statistics.median(latencies), 1)
+                }
+            results['exceptions'] = [str(e.value) for e in app.exception]
+            return results
+        finally:
+            os.chdir(cwd)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Streamlit 재실행 지연 시간 벤치마크')
+    parser.add_argument('--prompts', type=int, default=5000)
+    parser.add_argument('--reruns', type=int, default=5)
+    parser.add_argument('--settle', type=float, default=0.0, help='첫 화면 후 대기 시간 (초)')
+    args = parser.parse_args()
+    print(json.dumps(run(args.prompts, args.reruns, args.settle), ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+"""데이터 규모별 시나리오 벤치마크
+
+    python -m benchmarks.bench_scenarios run --sizes 1k,10k --output results.json
+    python -m benchmarks.bench_scenarios run --sizes 100k --only history,search
+    python -m benchmarks.bench_scenarios compare results.json benchmarks/baselines/scenarios.json
+
+benchmarks.datagen 으로 만든 데이터베이스에서 히스토리 필터 조회, 검색, 분석 대시보드
+집계, 큰 본문의 버전 비교, 가져오기/내보내기 시간을 측정해 JSON 으로 저장합니다.
+compare 는 기준 결과보다 허용 범위 이상 느려진 시나리오가 있으면 종료 코드 1 을
+반환합니다.
+"""
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Tuple
+import argparse
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from benchmarks.datagen import DEFAULT_DATA_DIR, GENERATOR_VERSION, ensure_database, parse_size, size_label
+
+HISTORY_FILTERS = {'model': ['클로드', 'GPT-4'], 'category': ['법률', '금융']}
+SEARCH_TERMS = ['계약서 위험', '해지 조항', 'fund bonds', '출장비 정산', 'remote work approval']
+IMPORT_RECORDS = 500
+# 버전 비교는 문장 수의 제곱에 비례하므로 규모와 관계없이 같은 크기의 본문 사용
+COMPARE_SENTENCES = 150
+
+
+class ScenarioContext:
+    """데이터베이스 하나에 대한 매니저와 임시 디렉터리"""
+
+    def __init__(self, db_path: str, workdir: str):
+        from src.cli import BatchCLI
+        from src.database.database import PromptDatabase
+        from src.managers.analytics_manager import AnalyticsManager
+        from src.managers.history_manager import HistoryManager
+        from src.managers.test_manager import TestManager
+        from src.utils.config import Config
+
+        self.db_path = db_path
+        self.workdir = workdir
+        self.config = Config(os.path.join(workdir, 'missing-config.yaml'))
+        self.database = PromptDatabase(db_path)
+        self.history = HistoryManager(self.database)
+        self.analytics = AnalyticsManager(self.database)
+        self.tests = TestManager(self.config, self.database)
+        self.cli = BatchCLI(self.config, db_path)
+        self._texts = None
+
+    def large_texts(self) -> Tuple[str, str]:
+        """긴 답변 앞부분 COMPARE_SENTENCES 문장과, 문단 일부를 바꾸고 덧붙인 다음 버전"""
+        if self._texts is None:
+            with sqlite3.connect(self.db_path) as conn:
+                response = conn.execute(
+                    'SELECT chatbot_response FROM prompts WHERE id <= 1000 '
+                    'ORDER BY length(chatbot_response) DESC, id LIMIT 1'
+                ).fetchone()[0]
+            old = '.'.join(response.split('.')[:COMPARE_SENTENCES])
+            paragraphs = old.split('\n\n')
+            new = '\n\n'.join(
+                paragraph if i % 7 else paragraph.replace('.', '!', 1)
+                for i, paragraph in enumerate(paragraphs)
+            ) + '\n\n' + paragraphs[0]
+            self._texts = (old, new)
+        return self._texts
+
+
+def _export(context: ScenarioContext, format: str):
+    def run():
+        context.cli.export_prompts(SimpleNamespace(
+            model=None, category=None, created_by=None, format=format,
+            output=os.path.join(context.workdir, f"export.{format}")
+        ))
+    return run
+
+
+def _import(context: ScenarioContext):
+    """규모별 데이터베이스 복사본에 IMPORT_RECORDS 건 가져오기 (원본은 그대로 유지)"""
+    source = os.path.join(context.workdir, 'import.jsonl')
+    with open(source, 'w', encoding='utf-8') as f:
+        for i in range(IMPORT_RECORDS):
+            f.write(json.dumps({
+                'title': f"가져오기 #{i}",
+                'model': '클로드',
+                'category': '법률',
+                'prompt_content': f"다음 계약서를 검토해 주세요. 항목 {i} 의 위험을 설명하세요.",
+                'chatbot_response': 'The indemnification clause survives termination.'
+            }, ensure_ascii=False) + '\n')
+
+    def run():
+        copy_path = os.path.join(context.workdir, 'import-target.db')
+        shutil.copyfile(context.db_path, copy_path)
+        from src.cli import BatchCLI
+
+        cli = BatchCLI(context.config, copy_path)
+        start = time.perf_counter()
+        cli.import_prompts(SimpleNamespace(file=source, user='bench', department='개발팀'))
+        elapsed = (time.perf_counter() - start) * 1000
+        os.remove(copy_path)
+        return elapsed
+    return run
+
+
+def _search_build(context: ScenarioContext):
+    def run():
+        from src.utils.search_engine import SearchEngine
+
+        SearchEngine(context.database).sync()
+    return run
+
+
+def _search_query(context: ScenarioContext):
+    from src.utils.search_engine import SearchEngine
+
+    SearchEngine.for_database(context.database)
+
+    def run():
+        for term in SEARCH_TERMS:
+            context.database.search_ranked(term, 1, 20)
+    return run
+
+
+# (이름, 시나리오 생성 함수) - 생성 함수는 측정할 호출을 반환
+# 호출이 숫자를 반환하면 그 값을 측정 시간(ms)으로 사용 (준비 작업 제외용)
+SCENARIOS: List[Tuple[str, Callable]] = [
+    ('history.filtered', lambda c: lambda: c.history.get_history(HISTORY_FILTERS)),
+    ('history.filtered_page', lambda c: lambda: c.history.get_history_page(
+        HISTORY_FILTERS, 'created_at', False, 10, 50
+    )),
+    ('history.stats', lambda c: lambda: c.history.get_history_stats(HISTORY_FILTERS)),
+    ('search.index_build', _search_build),
+    ('search.query', _search_query),
+    ('analytics.get_creation_trends', lambda c: c.analytics.get_creation_trends),
+    ('analytics.get_model_usage_stats', lambda c: c.analytics.get_model_usage_stats),
+    ('analytics.get_category_stats', lambda c: c.analytics.get_category_stats),
+    ('analytics.get_user_contribution_stats', lambda c: c.analytics.get_user_contribution_stats),
+    ('analytics.get_top_keywords', lambda c: lambda: c.analytics.get_top_keywords('category')),
+    ('compare_versions.large', lambda c: lambda: c.tests.compare_versions(*c.large_texts())),
+    ('export.csv', lambda c: _export(c, 'csv')),
+    ('export.jsonl', lambda c: _export(c, 'jsonl')),
+    ('import.jsonl', _import)
+]
+
+
+def run_size(count: int, seed: int, data_dir: str, repeat: int, only: List[str]) -> Dict:
+    """한 규모의 전체 시나리오 측정"""
+    start = time.perf_counter()
+    db_path = ensure_database(count, seed, data_dir)
+    results = {'rows': count, 'generate_sec': round(time.perf_counter() - start, 1), 'scenarios': {}}
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # 검색/키워드 색인 등 쓰기가 있는 시나리오가 보관 파일을 바꾸지 않도록 복사본 사용
+        work_path = os.path.join(workdir, 'bench.db')
+        shutil.copyfile(db_path, work_path)
+        context = ScenarioContext(work_path, workdir)
+
+        for name, factory in SCENARIOS:
+            if only and not any(name.startswith(prefix) for prefix in only):
+                continue
+            action = factory(context)
+            runs = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                value = action()
+                elapsed = (time.perf_counter() - start) * 1000
+                runs.append(value if isinstance(value, float) else elapsed)
+            results['scenarios'][name] = {
+                'median_ms': round(statistics.median(runs), 2),
+                'min_ms': round(min(runs), 2),
+                'runs': len(runs)
+            }
+            print(f"[{size_label(count)}] {name}: {results['scenarios'][name]['median_ms']}ms",
+                  file=sys.stderr)
+    return results
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float, min_delta_ms: float) -> List[str]:
+    """기준 대비 느려진 시나리오 (작은 절대 차이는 측정 잡음으로 봄)"""
+    regressions = []
+    for size, result in results.get('results', {}).items():
+        base_size = baseline.get('results', {}).get(size)
+        if base_size is None:
+            continue
+        for name, scenario in result['scenarios'].items():
+            base = base_size['scenarios'].get(name)
+            if base is None:
+                continue
+            delta = scenario['median_ms'] - base['median_ms']
+            if delta > base['median_ms'] * tolerance and delta > min_delta_ms:
+                regressions.append(
+                    f"{size} {name}: {base['median_ms']}ms -> {scenario['median_ms']}ms "
+                    f"(+{delta / base['median_ms'] * 100:.0f}%)"
+                )
+    return regressions
+
+
+def environment() -> Dict:
+    return {
+        'generator_version': GENERATOR_VERSION,
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'platform': platform.platform(),
+        'recorded_at': time.strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='데이터 규모별 시나리오 벤치마크')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='시나리오 측정')
+    run_parser.add_argument('--sizes', default='1k,10k', help='쉼표로 구분한 행 수 (1k, 10k, 100k, 1m)')
+    run_parser.add_argument('--seed', type=int, default=42)
+    run_parser.add_argument('--repeat', type=int, default=3)
+    run_parser.add_argument('--only', default='', help='쉼표로 구분한 시나리오 이름 접두어')
+    run_parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR)
+    run_parser.add_argument('--output', help='결과 JSON 저장 경로')
+    run_parser.add_argument('--baseline', help='측정 후 비교할 기준 결과')
+
+    compare_parser = subparsers.add_parser('compare', help='기준 결과와 비교')
+    compare_parser.add_argument('results')
+    compare_parser.add_argument('baseline')
+
+    for sub in (run_parser, compare_parser):
+        sub.add_argument('--tolerance', type=float, default=0.25, help='허용 시간 증가율')
+        sub.add_argument('--min-delta-ms', type=float, default=20.0, help='회귀로 볼 최소 증가 시간')
+
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        only = [prefix for prefix in args.only.split(',') if prefix]
+        output = {'environment': environment(), 'results': {}}
+        for value in args.sizes.split(','):
+            count = parse_size(value)
+            output['results'][size_label(count)] = run_size(
+                count, args.seed, args.data_dir, args.repeat, only
+            )
+        if args.output:
+            os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(output, f, ensure_ascii=False, indent=2)
+        baseline_path = args.baseline
+    else:
+        with open(args.results, 'r', encoding='utf-8') as f:
+            output = json.load(f)
+        baseline_path = args.baseline
+
+    status = 0
+    if baseline_path:
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            output['regressions'] = compare(
+                output, json.load(f), args.tolerance, args.min_delta_ms
+            )
+        status = 1 if output['regressions'] else 0
+
+    print(json.dumps(output, ensure_ascii=False, indent=2))
+    sys.exit(status)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,332 @@
+"""벤치마크용 결정적 프롬프트 데이터베이스 생성기
+
+    python -m benchmarks.datagen --rows 100k
+    python -m benchmarks.datagen --rows 1k,10k,100k,1m --data-dir benchmarks/data
+
+같은 (행 수, 시드, 생성기 버전) 이면 항상 같은 데이터가 만들어지고, 생성한 파일은
+data-dir 에 보관해 다음 실행에서 재사용합니다. 프롬프트는 제목/카테고리/모델이 같은
+계열 안에서 1.0.0 부터 버전이 이어지고, 버전마다 본문 일부가 바뀌며 변경 이력이
+함께 기록됩니다. 답변 길이는 긴 꼬리 분포를 따릅니다. 저장 시 만들어지는 키워드
+색인(prompt_terms, term_stats)도 한꺼번에 채웁니다.
+"""
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Tuple
+import argparse
+import json
+import os
+import random
+import sqlite3
+import time
+from src.database.database import PromptDatabase
+from src.managers.keyword_manager import KEYWORD_FIELDS
+from src.utils.tokenizer import terms
+
+# 생성 규칙이 바뀌면 올려서 보관된 파일을 다시 만들게 함
+GENERATOR_VERSION = 1
+
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+SIZE_ALIASES = {'1k': 1_000, '10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+
+CATEGORIES = {
+    '법률': {
+        'subjects': ['계약서', '이용약관', '개인정보 처리방침', '위임장', '비밀유지 계약'],
+        'sentences': [
+            "계약 해지 조항은 상대방의 중대한 위반이 있는 경우에만 적용됩니다.",
+            "손해배상 책임의 범위는 직접 손해로 한정됩니다.",
+            "분쟁이 발생하면 서울중앙지방법원을 전속 관할로 합니다.",
+            "The indemnification clause survives termination of this agreement.",
+            "Confidential information excludes data that is publicly available.",
+            "자동 갱신 조항은 만료 30일 전까지 통지하지 않으면 효력이 발생합니다.",
+            "Liability is capped at the fees paid in the preceding twelve months.",
+        ]
+    },
+    '사내규정': {
+        'subjects': ['휴가 규정', '출장비 정산', '보안 정책', '재택근무 지침', '평가 제도'],
+        'sentences': [
+            "연차 휴가는 입사일 기준으로 매년 15일이 부여됩니다.",
+            "출장비는 귀임 후 7일 이내에 증빙과 함께 정산해야 합니다.",
+            "외부 저장 매체는 보안팀 승인 후에만 사용할 수 있습니다.",
+            "Remote work requests must be approved by the team lead in advance.",
+            "평가 결과에 이의가 있으면 2주 이내에 재심을 신청할 수 있습니다.",
+            "All employees must complete security training once per year.",
+        ]
+    },
+    '금융': {
+        'subjects': ['펀드 설명서', '대출 상품', '수익률 보고서', '투자 위험 고지', '보험 약관'],
+        'sentences': [
+            "이 상품은 원금 손실이 발생할 수 있으며 예금자 보호 대상이 아닙니다.",
+            "연 환산 수익률은 과거 실적을 기준으로 하며 미래 수익을 보장하지 않습니다.",
+            "중도 상환 시 잔액의 1.2퍼센트가 수수료로 부과됩니다.",
+            "The fund invests primarily in investment-grade corporate bonds.",
+            "Interest rates may change quarterly based on the reference rate.",
+            "변동금리 대출은 기준금리 변동에 따라 상환액이 달라집니다.",
+        ]
+    },
+    '기타': {
+        'subjects': ['고객 문의', '회의록', '보도자료', '제품 설명', 'FAQ'],
+        'sentences': [
+            "고객의 문의 내용을 세 문장 이내로 요약합니다.",
+            "회의에서 결정된 사항과 담당자를 정리합니다.",
+            "Please answer in a friendly and concise tone.",
+            "제품의 주요 기능을 초보자도 이해할 수 있게 설명합니다.",
+            "List the action items with owners and due dates.",
+        ]
+    }
+}
+
+INSTRUCTIONS = [
+    "다음 {subject}을(를) 검토하고 위험 요소를 정리해 주세요.",
+    "아래 {subject}의 핵심 내용을 요약해 주세요.",
+    "Summarize the key points of the following {subject}.",
+    "{subject}에서 고객에게 불리한 조항을 찾아 설명해 주세요.",
+    "Explain the {subject} to a new employee in plain language.",
+]
+
+EXAMPLE_LINES = [
+    "예시: 해지 조항 - 일방 해지 가능, 위험도 높음",
+    "Example: Clause 4.2 - auto renewal, risk medium",
+    "예시: 요약 - 세 줄 이내, 핵심 수치 포함",
+]
+
+FORMAT_LINES = [
+    "형식: 표로 정리하고 마지막에 결론을 한 문장으로 작성하세요.",
+    "Format: respond in JSON with keys summary and risks.",
+    "형식: 번호 목록으로 작성하세요.",
+]
+
+CHANGES = [
+    "예시 추가", "출력 형식 명시", "지시문 구체화", "불필요한 문장 제거",
+    "Added few-shot example", "Clarified tone", "역할 설명 추가", "토큰 수 축소"
+]
+
+MODELS = ['클로드', 'GPT-3.5', 'GPT-4', '기타']
+DEPARTMENTS = ['법무팀', '인사팀', '재무팀', '고객지원팀', '개발팀']
+TAGS = ['검토', '요약', '위험', '고객', '내부', 'draft', 'review', 'production']
+
+
+def parse_size(value: str) -> int:
+    """'10k', '1m', '2500' 같은 행 수 표기 해석"""
+    value = value.strip().lower()
+    if value in SIZE_ALIASES:
+        return SIZE_ALIASES[value]
+    return int(value)
+
+
+def size_label(rows: int) -> str:
+    for label, count in SIZE_ALIASES.items():
+        if count == rows:
+            return label
+    return str(rows)
+
+
+def _bump(version: Tuple[int, int, int], rng: random.Random) -> Tuple[int, int, int]:
+    major, minor, patch = version
+    roll = rng.random()
+    if roll < 0.7:
+        return major, minor, patch + 1
+    if roll < 0.95:
+        return major, minor + 1, 0
+    return major + 1, 0, 0
+
+
+def _paragraphs(rng: random.Random, sentences: List[str], count: int) -> str:
+    """문장 count 개를 3~6 문장 단위 문단으로 묶음"""
+    picked = rng.choices(sentences, k=count)
+    paragraphs, i = [], 0
+    while i < count:
+        size = rng.randint(3, 6)
+        paragraphs.append(' '.join(picked[i:i + size]))
+        i += size
+    return '\n\n'.join(paragraphs)
+
+
+def _response_length(rng: random.Random) -> int:
+    """답변 문장 수 (대부분 짧고 일부는 매우 긴 파레토 분포, 최대 400 문장)"""
+    return min(400, int(rng.paretovariate(1.3) * 6))
+
+
+def _prompt_lines(rng: random.Random, category: str, subject: str) -> List[str]:
+    lines = [
+        f"당신은 {category} 분야 전문가입니다.",
+        rng.choice(INSTRUCTIONS).format(subject=subject)
+    ]
+    lines += rng.choices(CATEGORIES[category]['sentences'], k=rng.randint(1, 4))
+    if rng.random() < 0.5:
+        lines.append(rng.choice(EXAMPLE_LINES))
+    if rng.random() < 0.6:
+        lines.append(rng.choice(FORMAT_LINES))
+    if rng.random() < 0.3:
+        lines.append("입력: {{document}}")
+    return lines
+
+
+def _mutate(rng: random.Random, lines: List[str], category: str) -> List[str]:
+    """다음 버전 본문 (문장 하나를 바꾸거나 추가/삭제)"""
+    lines = list(lines)
+    roll = rng.random()
+    if roll < 0.4 and len(lines) > 3:
+        lines[rng.randrange(2, len(lines))] = rng.choice(CATEGORIES[category]['sentences'])
+    elif roll < 0.8:
+        lines.insert(rng.randrange(2, len(lines) + 1), rng.choice(EXAMPLE_LINES + FORMAT_LINES))
+    elif len(lines) > 3:
+        del lines[rng.randrange(2, len(lines))]
+    return lines
+
+
+def iter_rows(count: int, seed: int = 42) -> Iterator[Tuple[Dict, Dict]]:
+    """(프롬프트, 변경 이력) 행을 id 순서로 생성"""
+    rng = random.Random(seed)
+    clock = datetime(2023, 1, 1, 9, 0, 0)
+    prompt_id = 0
+    family = 0
+
+    while prompt_id < count:
+        family += 1
+        category = rng.choice(list(CATEGORIES))
+        subject = rng.choice(CATEGORIES[category]['subjects'])
+        model = rng.choice(MODELS)
+        author = f"user{rng.randint(1, 200):03d}"
+        department = rng.choice(DEPARTMENTS)
+        tags = ','.join(sorted(set(rng.choices(TAGS, k=rng.randint(1, 3)))))
+        title = f"{subject} {rng.choice(['검토', '요약', '분석', 'review', 'QA'])} #{family}"
+        chain = min(count - prompt_id, 1 + int(rng.expovariate(0.5)))
+        sentences = CATEGORIES[category]['sentences']
+
+        version = (1, 0, 0)
+        lines = _prompt_lines(rng, category, subject)
+        for step in range(chain):
+            prompt_id += 1
+            clock += timedelta(minutes=rng.randint(1, 180))
+            version_text = '.'.join(map(str, version))
+            changes = None if step == 0 else rng.choice(CHANGES)
+            created_at = clock.strftime('%Y-%m-%d %H:%M:%S')
+
+            yield (
+                {
+                    'id': prompt_id,
+                    'title': title,
+                    'description': f"{subject} 처리용 프롬프트",
+                    'model': model,
+                    'version': version_text,
+                    'category': category,
+                    'tags': tags,
+                    'query': rng.choice(sentences),
+                    'prompt_content': '\n'.join(lines),
+                    'chatbot_response': _paragraphs(rng, sentences, max(1, _response_length(rng))),
+                    'expected_result': _paragraphs(rng, sentences, rng.randint(2, 8)),
+                    'is_best': int(step == chain - 1 and rng.random() < 0.3),
+                    'changes': changes,
+                    'created_by': author,
+                    'department': department,
+                    'user_role': rng.choice(['작성자', '검토자', '관리자']),
+                    'created_at': created_at
+                },
+                {
+                    'name': f"Prompt_{version_text}",
+                    'title': f"Version {version_text} {'Creation' if step == 0 else 'Update'}",
+                    'prompt_id': prompt_id,
+                    'version_number': version_text,
+                    'change_summary': changes or 'Initial creation',
+                    'changed_by': author,
+                    'changed_at': created_at
+                }
+            )
+
+            version = _bump(version, rng)
+            lines = _mutate(rng, lines, category)
+
+
+def build_database(path: str, count: int, seed: int = 42, batch_size: int = 5000):
+    """결정적 데이터로 데이터베이스 파일 생성"""
+    PromptDatabase(path)
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute('PRAGMA synchronous = OFF')
+        conn.execute('PRAGMA journal_mode = MEMORY')
+        prompts, logs = [], []
+        document_frequency = Counter()
+        with conn:
+            for prompt, log in iter_rows(count, seed):
+                prompts.append(prompt)
+                logs.append(log)
+                if len(prompts) >= batch_size:
+                    _insert(conn, prompts, logs, document_frequency)
+                    prompts, logs = [], []
+            if prompts:
+                _insert(conn, prompts, logs, document_frequency)
+            conn.executemany(
+                'INSERT INTO term_stats (term, df) VALUES (?, ?)',
+                document_frequency.items()
+            )
+        conn.execute('ANALYZE')
+    finally:
+        conn.close()
+
+
+def _insert(
+    conn: sqlite3.Connection,
+    prompts: List[Dict],
+    logs: List[Dict],
+    document_frequency: Counter
+):
+    columns = list(prompts[0])
+    conn.executemany(
+        f"INSERT INTO prompts ({', '.join(columns)}) "
+        f"VALUES ({', '.join(':' + column for column in columns)})",
+        prompts
+    )
+    columns = list(logs[0])
+    conn.executemany(
+        f"INSERT INTO prompt_change_logs ({', '.join(columns)}) "
+        f"VALUES ({', '.join(':' + column for column in columns)})",
+        logs
+    )
+
+    # KeywordManager.index_prompt 와 같은 단어 빈도
+    term_rows = []
+    for prompt in prompts:
+        counts = Counter(terms('\n'.join(prompt.get(field) or '' for field in KEYWORD_FIELDS)))
+        document_frequency.update(counts.keys())
+        term_rows.extend((prompt['id'], term, tf) for term, tf in counts.items())
+    conn.executemany('INSERT INTO prompt_terms (prompt_id, term, tf) VALUES (?, ?, ?)', term_rows)
+
+
+def ensure_database(count: int, seed: int = 42, data_dir: str = DEFAULT_DATA_DIR) -> str:
+    """보관된 파일이 있으면 재사용하고 없으면 생성 (생성 중 파일은 완료 후 교체)"""
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, f"prompts-{size_label(count)}-s{seed}-v{GENERATOR_VERSION}.db")
+    if os.path.exists(path):
+        return path
+
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+    build_database(temp_path, count, seed)
+    os.replace(temp_path, path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='벤치마크용 프롬프트 데이터베이스 생성')
+    parser.add_argument('--rows', default='10k', help='쉼표로 구분한 행 수 (1k, 10k, 100k, 1m)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR)
+    args = parser.parse_args()
+
+    output = {}
+    for value in args.rows.split(','):
+        count = parse_size(value)
+        start = time.perf_counter()
+        path = ensure_database(count, args.seed, args.data_dir)
+        output[size_label(count)] = {
+            'path': path,
+            'seconds': round(time.perf_counter() - start, 1),
+            'megabytes': round(os.path.getsize(path) / 2 ** 20, 1)
+        }
+    print(json.dumps(output, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,330 @@
+"""동시 사용자 부하 테스트 (Streamlit 없이 데이터베이스/매니저 계층만 실행)
+
+    python -m benchmarks.load_test --users 20 --duration 30
+    python -m benchmarks.load_test --users 40 --processes 4 --rows 100k
+    python -m benchmarks.load_test --db prompts.db --mix create=1,history=3,search=3,analytics=1
+
+가상 사용자 N 명을 프로세스 P 개에 나눠 스레드로 실행합니다. 같은 프로세스의 스레드는
+Streamlit 서버 한 대의 세션들처럼 매니저와 메모리 색인을 공유하고, 프로세스끼리는
+같은 데이터베이스 파일만 공유합니다. 작업 종류별 처리량, p50/p95/p99 지연 시간,
+잠금 오류(database is locked) 비율을 JSON 으로 출력합니다.
+
+--db 를 주지 않으면 benchmarks.datagen 으로 만든 데이터베이스의 복사본을 사용하므로
+원본 파일은 바뀌지 않습니다.
+"""
+from typing import Callable, Dict, List, Optional
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from benchmarks.datagen import (
+    CATEGORIES, DEFAULT_DATA_DIR, DEPARTMENTS, INSTRUCTIONS, MODELS, TAGS,
+    ensure_database, parse_size
+)
+
+DEFAULT_MIX = 'create=1,history=2,history_page=3,search=3,analytics=1'
+SEARCH_TERMS = ['계약서 위험', '해지 조항', 'fund bonds', '출장비 정산', 'remote work approval']
+LOCK_MESSAGES = ('database is locked', 'database table is locked', 'database is busy')
+
+
+class Operations:
+    """가상 사용자가 실행하는 작업 (프로세스마다 한 벌을 만들어 스레드가 공유)"""
+
+    def __init__(self, db_path: str):
+        from src.database.database import PromptDatabase
+        from src.managers.analytics_manager import AnalyticsManager
+        from src.managers.history_manager import HistoryManager
+        from src.managers.prompt_manager import PromptManager
+
+        self.database = PromptDatabase(db_path)
+        self.prompts = PromptManager(self.database)
+        self.history = HistoryManager(self.database)
+        self.analytics = AnalyticsManager(self.database)
+
+    def warm_up(self):
+        """첫 검색에서 색인을 만드는 시간이 측정에 섞이지 않도록 미리 생성"""
+        self.history.search_prompts(SEARCH_TERMS[0])
+
+    def create(self, rng: random.Random, user: str):
+        category = rng.choice(list(CATEGORIES))
+        subject = rng.choice(CATEGORIES[category]['subjects'])
+        sentences = CATEGORIES[category]['sentences']
+        self.prompts.create_prompt({
+            'title': f"{subject} 부하 테스트 {rng.randrange(10 ** 6)}",
+            'description': f"{subject} 처리용 프롬프트",
+            'model': rng.choice(MODELS),
+            'version': '1.0.0',
+            'category': category,
+            'tags': ','.join(rng.sample(TAGS, 2)),
+            'prompt_content': '\n'.join(
+                [rng.choice(INSTRUCTIONS).format(subject=subject)]
+                + rng.choices(sentences, k=rng.randint(2, 6))
+            ),
+            'chatbot_response': ' '.join(rng.choices(sentences, k=rng.randint(3, 30))),
+            'created_by': user,
+            'department': rng.choice(DEPARTMENTS),
+            'user_role': '일반'
+        })
+
+    def _filters(self, rng: random.Random) -> Dict:
+        filters = {}
+        if rng.random() < 0.7:
+            filters['model'] = rng.sample(MODELS, rng.randint(1, 2))
+        if rng.random() < 0.7:
+            filters['category'] = rng.sample(list(CATEGORIES), rng.randint(1, 2))
+        return filters
+
+    def history_full(self, rng: random.Random, user: str):
+        self.history.get_history(self._filters(rng))
+
+    def history_page(self, rng: random.Random, user: str):
+        self.history.get_history_page(self._filters(rng), 'created_at', False, rng.randint(1, 5), 20)
+
+    def search(self, rng: random.Random, user: str):
+        self.history.search_prompts(rng.choice(SEARCH_TERMS), 1, 20)
+
+    def analytics_call(self, rng: random.Random, user: str):
+        rng.choice([
+            self.analytics.get_creation_trends,
+            self.analytics.get_model_usage_stats,
+            self.analytics.get_category_stats,
+            self.analytics.get_user_contribution_stats,
+            lambda: self.analytics.get_top_keywords('category')
+        ])()
+
+
+OPERATIONS: Dict[str, Callable[[Operations], Callable]] = {
+    'create': lambda ops: ops.create,
+    'history': lambda ops: ops.history_full,
+    'history_page': lambda ops: ops.history_page,
+    'search': lambda ops: ops.search,
+    'analytics': lambda ops: ops.analytics_call
+}
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """'create=1,search=3' 형식의 작업 비중 해석"""
+    mix = {}
+    for item in value.split(','):
+        name, _, weight = item.partition('=')
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"알 수 없는 작업: {name} (가능: {', '.join(OPERATIONS)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def is_lock_error(error: Exception) -> bool:
+    message = str(error).lower()
+    return any(text in message for text in LOCK_MESSAGES)
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """정렬된 값의 q 분위수 (최근접 순위)"""
+    if not values:
+        return None
+    index = min(len(values) - 1, max(0, math.ceil(q * len(values)) - 1))
+    return round(values[index], 2)
+
+
+def _empty_sample() -> Dict:
+    return {'latencies': [], 'errors': 0, 'lock_errors': 0, 'messages': set()}
+
+
+def _empty_samples(mix: Dict[str, float]) -> Dict[str, Dict]:
+    return {name: _empty_sample() for name in mix}
+
+
+def _merge(into: Dict[str, Dict], samples: Dict[str, Dict]):
+    for name, sample in samples.items():
+        target = into.setdefault(name, _empty_sample())
+        target['latencies'].extend(sample['latencies'])
+        target['errors'] += sample['errors']
+        target['lock_errors'] += sample['lock_errors']
+        target['messages'].update(sample['messages'])
+
+
+def _virtual_user(
+    ops: Operations,
+    mix: Dict[str, float],
+    user_index: int,
+    seed: int,
+    deadline: float,
+    think: float,
+    samples: Dict
+):
+    """가상 사용자 한 명 (결과는 이 스레드 전용 samples 에 기록)"""
+    rng = random.Random(seed * 10_007 + user_index)
+    user = f"load{user_index:03d}"
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    actions = {name: OPERATIONS[name](ops) for name in names}
+
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights)[0]
+        start = time.perf_counter()
+        try:
+            actions[name](rng, user)
+            samples[name]['latencies'].append((time.perf_counter() - start) * 1000)
+        except Exception as e:
+            if is_lock_error(e):
+                samples[name]['lock_errors'] += 1
+            else:
+                samples[name]['errors'] += 1
+                samples[name]['messages'].add(str(e)[:200])
+        if think:
+            time.sleep(rng.uniform(0, 2 * think))
+
+
+def run_process(
+    db_path: str,
+    mix: Dict[str, float],
+    user_indexes: List[int],
+    seed: int,
+    duration: float,
+    think: float
+) -> Dict:
+    """프로세스 하나에서 가상 사용자 스레드 실행 (작업별 지연 시간과 오류 수 반환)"""
+    ops = Operations(db_path)
+    ops.warm_up()
+
+    thread_samples = [_empty_samples(mix) for _ in user_indexes]
+    start = time.perf_counter()
+    deadline = start + duration
+    threads = [
+        threading.Thread(
+            target=_virtual_user,
+            args=(ops, mix, index, seed, deadline, think, samples),
+            name=f"virtual-user-{index}",
+            daemon=True
+        )
+        for index, samples in zip(user_indexes, thread_samples)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    samples = _empty_samples(mix)
+    for sample in thread_samples:
+        _merge(samples, sample)
+    return {
+        'elapsed': time.perf_counter() - start,
+        'samples': {
+            name: {**sample, 'messages': sorted(sample['messages'])}
+            for name, sample in samples.items()
+        }
+    }
+
+
+def summarize(outputs: List[Dict], users: int, processes: int) -> Dict:
+    """프로세스별 결과를 합쳐 작업별/전체 통계 계산"""
+    elapsed = max(output['elapsed'] for output in outputs)
+    merged = {}
+    for output in outputs:
+        _merge(merged, output['samples'])
+
+    def stats(latencies: List[float], errors: int, lock_errors: int) -> Dict:
+        latencies = sorted(latencies)
+        attempts = len(latencies) + errors + lock_errors
+        return {
+            'ok': len(latencies),
+            'errors': errors,
+            'lock_errors': lock_errors,
+            'lock_error_rate': round(lock_errors / attempts, 4) if attempts else 0.0,
+            'throughput_per_sec': round(len(latencies) / elapsed, 2),
+            'p50_ms': percentile(latencies, 0.50),
+            'p95_ms': percentile(latencies, 0.95),
+            'p99_ms': percentile(latencies, 0.99),
+            'max_ms': round(latencies[-1], 2) if latencies else None
+        }
+
+    operations = {}
+    for name, sample in sorted(merged.items()):
+        operations[name] = stats(sample['latencies'], sample['errors'], sample['lock_errors'])
+        if sample['messages']:
+            operations[name]['error_messages'] = sorted(sample['messages'])[:5]
+
+    return {
+        'users': users,
+        'processes': processes,
+        'elapsed_sec': round(elapsed, 2),
+        'total': stats(
+            [latency for sample in merged.values() for latency in sample['latencies']],
+            sum(sample['errors'] for sample in merged.values()),
+            sum(sample['lock_errors'] for sample in merged.values())
+        ),
+        'operations': operations
+    }
+
+
+def run(
+    db_path: str,
+    users: int,
+    processes: int,
+    duration: float,
+    mix: Dict[str, float],
+    seed: int = 42,
+    think: float = 0.0
+) -> Dict:
+    """가상 사용자를 프로세스에 고르게 나눠 실행"""
+    processes = max(1, min(processes, users))
+    groups = [list(range(users))[i::processes] for i in range(processes)]
+    jobs = [(db_path, mix, group, seed, duration, think) for group in groups]
+
+    if processes == 1:
+        outputs = [run_process(*jobs[0])]
+    else:
+        # 포크한 프로세스가 부모의 연결/잠금 상태를 물려받지 않도록 spawn 사용
+        with multiprocessing.get_context('spawn').Pool(processes) as pool:
+            outputs = pool.starmap(run_process, jobs)
+    return summarize(outputs, users, processes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='동시 사용자 부하 테스트')
+    parser.add_argument('--users', type=int, default=10, help='가상 사용자 수')
+    parser.add_argument('--processes', type=int, default=1, help='사용자를 나눠 실행할 프로세스 수')
+    parser.add_argument('--duration', type=float, default=20.0, help='측정 시간 (초)')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f"작업 비중 (기본 {DEFAULT_MIX})")
+    parser.add_argument('--think-ms', type=float, default=0.0, help='작업 사이 평균 대기 시간')
+    parser.add_argument('--db', help='사용할 데이터베이스 파일 (직접 수정됨)')
+    parser.add_argument('--rows', default='10k', help='--db 가 없을 때 생성할 데이터 규모')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR)
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = args.db
+        if db_path is None:
+            db_path = os.path.join(workdir, 'load.db')
+            shutil.copyfile(ensure_database(parse_size(args.rows), args.seed, args.data_dir), db_path)
+
+        print(
+            f"{args.users} users / {args.processes} processes / {args.duration}s on {db_path}",
+            file=sys.stderr
+        )
+        result = run(
+            db_path, args.users, args.processes, args.duration, mix,
+            args.seed, args.think_ms / 1000
+        )
+        result['mix'] = mix
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
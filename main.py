@@ -1,27 +1,62 @@
+import threading
 import streamlit as st
+from src.database.compression import configure_compression
 from src.database.database import PromptDatabase
-from src.managers.prompt_manager import PromptManager
-from src.managers.history_manager import HistoryManager
-from src.managers.analytics_manager import AnalyticsManager
-from src.managers.test_manager import TestManager
-from src.views.prompt_view import PromptView
-from src.views.history_view import HistoryView
-from src.views.comparison_view import ComparisonView
-from src.views.analytics_view import AnalyticsView
+from src.database.query_tracer import configure_query_tracer
 from src.utils.config import Config
-from src.views.consistency_test_view import ConsistencyTestView
+from src.utils.instrumentation import configure_instrumentation
+from src.utils.memory import configure_memory, memory
+from src.views.registry import ADMIN_ROLE, can_view, create_manager, menu_labels, render_view, VIEWS
 
-def initialize_session_state():
-    """세션 상태 초기화"""
-    if 'database' not in st.session_state:
-        st.session_state.database = PromptDatabase()
-        st.session_state.database.create_tables()
+# 관리자가 이번 재실행 하나를 프로파일할 때 쓰는 주소 매개변수 (?profile=1)
+PROFILE_QUERY_PARAM = 'profile'
+
+@st.cache_resource
+def get_config() -> Config:
+    """프로세스 공용 설정 (계측 설정도 이때 한 번 적용)"""
+    config = Config()
+    configure_instrumentation(config)
+    configure_query_tracer(config)
+    configure_memory(config)
+    configure_compression(config)
+    return config
+
+@st.cache_resource
+def get_database(db_path: str) -> PromptDatabase:
+    """프로세스 공용 데이터베이스 (테이블 생성은 생성자에서 한 번)"""
+    database = PromptDatabase(db_path)
+    threading.Thread(
+        target=warm_up,
+        args=(database,),
+        name='warm-up',
+        daemon=True
+    ).start()
+    return database
+
+def warm_up(database: PromptDatabase):
+    """첫 검색/유사도 조회 전에 메모리 색인을 백그라운드에서 생성"""
+    from src.managers.similarity_manager import VectorIndex
+    from src.utils.search_engine import SearchEngine
     
-    if 'config' not in st.session_state:
-        st.session_state.config = Config()
+    SearchEngine.for_database(database)
+    VectorIndex.for_database(database).sync()
+
+@st.cache_resource
+def get_profiler():
+    """프로세스 공용 재실행 프로파일러"""
+    from src.utils.profiler import create_profiler
     
+    return create_profiler(get_config())
+
+@st.cache_resource
+def get_manager(name: str, db_path: str):
+    """프로세스 공용 매니저 (선택된 화면에 필요한 것만 처음 사용할 때 생성)"""
+    return create_manager(name, get_database(db_path), get_config())
+
+def initialize_session_state():
+    """세션 상태 초기화"""
     if 'current_version' not in st.session_state:
-        st.session_state.current_version = st.session_state.config.get(
+        st.session_state.current_version = get_config().get(
             'version.initial', 
             '1.0.0'
         )
@@ -57,14 +92,8 @@ def render_sidebar():
         # 메뉴 선택
         menu = st.selectbox(
             "메뉴 선택",
-            options=[
-                "프롬프트 작성",
-                "프롬프트 히스토리",
-                "버전 비교",
-                "일관성 테스트",
-                "분석 대시보드",
-                "변경 이력"
-            ]
+            options=menu_labels(st.session_state.current_user['role']),
+            key='menu'
         )
         
         st.markdown("---")
@@ -74,27 +103,6 @@ def render_sidebar():
         
         return menu
 
-def initialize_managers():
-    """매니저 객체 초기화"""
-    database = st.session_state.database
-    
-    return {
-        'prompt_manager': PromptManager(database),
-        'history_manager': HistoryManager(database),
-        'analytics_manager': AnalyticsManager(database),
-        'test_manager': TestManager()
-    }
-
-def initialize_views(managers):
-    """뷰 객체 초기화"""
-    return {
-        'prompt_view': PromptView(managers['prompt_manager']),
-        'history_view': HistoryView(managers['history_manager']),
-        'comparison_view': ComparisonView(managers['test_manager']),
-        'analytics_view': AnalyticsView(managers['analytics_manager']),
-        'consistency_test_view': ConsistencyTestView(managers['test_manager'])  
-    }
-
 def main():
     """메인 애플리케이션"""
     try:
@@ -104,43 +112,67 @@ def main():
         # 세션 상태 초기화
         initialize_session_state()
         
+        # 주기 백업 (프로세스당 스케줄러 하나, 이미 시작했으면 그대로)
+        get_manager('backup_manager', get_config().get('database.path', 'prompts.db')).start_scheduler()
+        
         # 사이드바 렌더링 및 메뉴 선택
         selected_menu = render_sidebar()
         
-        # 매니저 및 뷰 초기화
-        managers = initialize_managers()
-        views = initialize_views(managers)
+        if not can_view(selected_menu, st.session_state.current_user['role']):
+            st.error("접근 권한이 없습니다.")
+            return
         
-        # 선택된 메뉴에 따른 화면 렌더링
-        if selected_menu == "프롬프트 작성":
-            views['prompt_view'].render_creation_form()
-            
-        elif selected_menu == "프롬프트 히스토리":
-            views['history_view'].render_history()
-            
-        elif selected_menu == "버전 비교":
-            views['comparison_view'].render_comparison()
-            
-        elif selected_menu == "일관성 테스트":
-            st.header("프롬프트 일관성 테스트")
-            views['consistency_test_view'].render_test_form()
-            
-        elif selected_menu == "분석 대시보드":
-            views['analytics_view'].render_analytics()
-            
-        elif selected_menu == "변경 이력":
-            st.header("변경 이력")
-            history_data = managers['history_manager'].get_change_logs()
-            
-            if not history_data.empty:
-                st.dataframe(history_data)
-            else:
-                st.info("변경 이력이 없습니다.")
+        # 선택된 메뉴의 화면만 가져와 렌더링
+        manager = get_manager(
+            VIEWS[selected_menu].manager,
+            get_config().get('database.path', 'prompts.db')
+        )
+        render_view(selected_menu, manager)
         
     except Exception as e:
         st.error(f"오류가 발생했습니다: {str(e)}")
         if st.session_state.current_user['role'] == '관리자':
             st.exception(e)
 
+def is_admin() -> bool:
+    return st.session_state.current_user['role'] == ADMIN_ROLE
+
+def profile_requested() -> bool:
+    """이번 재실행을 프로파일할지 (설정으로 항상, 또는 관리자의 주소 매개변수로 한 번)"""
+    if get_config().get('profiling.enabled', False):
+        return True
+    if PROFILE_QUERY_PARAM not in st.query_params:
+        return False
+    # 다음 재실행부터는 다시 프로파일하지 않도록 매개변수 제거
+    del st.query_params[PROFILE_QUERY_PARAM]
+    return is_admin()
+
+def render_profile(result):
+    """프로파일 결과 표시 (관리자 전용)"""
+    if result is None:
+        st.caption("다른 세션의 프로파일이 진행 중이라 이번 재실행은 프로파일하지 않았습니다.")
+        return
+    
+    with st.expander(f"프로파일 결과 ({result.duration_ms}ms, 샘플 {result.samples}개)"):
+        if result.error:
+            st.error(f"프로파일 저장 실패: {result.error}")
+        st.caption(f"pstats: {result.pstats_path}")
+        st.caption(f"collapsed stacks: {result.collapsed_path}")
+        st.dataframe(result.top, hide_index=True)
+
+def run():
+    """재실행 진입점 (메모리 추적, 요청된 경우 프로파일러로 main 을 감쌈)"""
+    initialize_session_state()
+    with memory.rerun() as usage:
+        if not profile_requested():
+            main()
+        else:
+            with get_profiler().profile() as result:
+                main()
+            if is_admin():
+                render_profile(result)
+        if usage is not None:
+            usage.label = st.session_state.get('menu') or usage.label
+
 if __name__ == "__main__":
-    main()
+    run()
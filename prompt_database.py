@@ -2,17 +2,35 @@
 import pandas as pd
 from datetime import datetime
 import os
-import sqlite3
+from src.database.connection import ConnectionManager
+from src.database.database import PromptDatabase as SharedPromptDatabase
+from src.managers.duplicate_manager import DuplicateManager
+from src.managers.keyword_manager import KeywordManager
+from src.utils.instrumentation import instrument_methods
+from src.utils.memory import track_frames
+from src.utils.search_engine import SearchEngine
 
+@track_frames('legacy_database')
+@instrument_methods('legacy_database')
 class PromptDatabase:
     def __init__(self, db_path='prompts.db'):
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        # 세션마다 연결을 열지 않고 프로세스 공용 연결 관리자 사용
+        self.connections = ConnectionManager.for_path(db_path)
         self.create_tables()
+        # main.py 화면과 같은 검색 엔진 사용 (프로세스 시작 시 한 번 색인)
+        self.shared = SharedPromptDatabase(db_path)
+        self.search_engine = SearchEngine.for_database(self.shared)
+        # 새 화면과 같은 키워드/중복 색인을 저장 트랜잭션 안에서 갱신
+        self.duplicate_manager = DuplicateManager(self.shared)
         
     def create_tables(self):
         """데이터베이스 테이블 생성"""
-        self.conn.execute('''
+        with self.connections.write() as conn:
+            self._create_tables(conn)
+
+    def _create_tables(self, conn):
+        conn.execute('''
         CREATE TABLE IF NOT EXISTS prompts (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             title TEXT,
@@ -38,7 +56,7 @@ class PromptDatabase:
         )
         ''')
 
-        self.conn.execute('''
+        conn.execute('''
         CREATE TABLE IF NOT EXISTS prompt_change_logs (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
@@ -51,38 +69,38 @@ class PromptDatabase:
             FOREIGN KEY (prompt_id) REFERENCES prompts (id)
         )
         ''')
-        
-        self.conn.commit()
 
     def save_prompt(self, data):
-        """프롬프트 저장 및 변경 로그 생성"""
-        cursor = self.conn.cursor()
-        
-        # 프롬프트 데이터 저장
-        columns = ', '.join(data.keys())
-        placeholders = ', '.join(['?' for _ in data])
-        
-        cursor.execute(
-            f'INSERT INTO prompts ({columns}) VALUES ({placeholders})',
-            list(data.values())
-        )
-        
-        prompt_id = cursor.lastrowid
-        
-        # 변경 로그 생성
-        log_data = {
-            'name': f"Prompt_{data['version']}",
-            'title': f"Version {data['version']} Creation" if not data.get('changes') 
-                    else f"Version {data['version']} Update",
-            'prompt_id': prompt_id,
-            'version_number': data['version'],
-            'change_summary': data.get('changes', 'Initial creation'),
-            'changed_by': data['created_by']
-        }
-        
-        self.save_change_log(log_data)
+        """프롬프트 저장 및 변경 로그 생성 (키워드/MinHash 색인도 같은 트랜잭션에서 저장)"""
+        term_counts = KeywordManager.term_counts(data)
+        minhash = self.duplicate_manager.minhash(data.get('prompt_content') or '')
+        with self.connections.write() as conn:
+            # 프롬프트 데이터 저장
+            columns = ', '.join(data.keys())
+            placeholders = ', '.join(['?' for _ in data])
+            
+            cursor = conn.execute(
+                f'INSERT INTO prompts ({columns}) VALUES ({placeholders})',
+                list(data.values())
+            )
+            
+            prompt_id = cursor.lastrowid
+            self.shared.write_prompt_index(conn, prompt_id, term_counts, minhash)
+            
+            # 변경 로그 생성
+            log_data = {
+                'name': f"Prompt_{data['version']}",
+                'title': f"Version {data['version']} Creation" if not data.get('changes') 
+                        else f"Version {data['version']} Update",
+                'prompt_id': prompt_id,
+                'version_number': data['version'],
+                'change_summary': data.get('changes', 'Initial creation'),
+                'changed_by': data['created_by']
+            }
+            
+            self.save_change_log(log_data, conn)
         
-        self.conn.commit()
+        self.search_engine.add_document(prompt_id, data)
         return prompt_id
 
     def get_history(self):
@@ -91,33 +109,27 @@ class PromptDatabase:
         SELECT * FROM prompts 
         ORDER BY created_at DESC
         '''
-        return pd.read_sql_query(query, self.conn)
+        return self.shared.decode_texts(pd.read_sql_query(query, self.connections.read()))
 
-    def search(self, term):
-        """프롬프트 검색"""
-        if term:
-            query = '''
-            SELECT * FROM prompts 
-            WHERE prompt_content LIKE ? 
-            OR query LIKE ? 
-            OR chatbot_response LIKE ?
-            OR title LIKE ?
-            OR description LIKE ?
-            '''
-            search_term = f'%{term}%'
-            return pd.read_sql_query(
-                query, 
-                self.conn, 
-                params=(search_term, search_term, search_term, search_term, search_term)
-            )
-        return self.get_history()
+    def search(self, term, page=1, page_size=20):
+        """프롬프트 검색 (BM25 순위, 페이지 단위)"""
+        results, _ = self.search_ranked(term, page, page_size)
+        return results
+
+    def search_ranked(self, term, page=1, page_size=20):
+        """프롬프트 검색 결과 페이지와 전체 건수"""
+        return self.shared.search_ranked(term, page, page_size)
+
+    def save_change_log(self, log_data, conn=None):
+        """변경 로그 저장 (conn 을 주면 진행 중인 쓰기 트랜잭션에 포함)"""
+        if conn is None:
+            with self.connections.write() as conn:
+                return self.save_change_log(log_data, conn)
 
-    def save_change_log(self, log_data):
-        """변경 로그 저장"""
         columns = ', '.join(log_data.keys())
         placeholders = ', '.join(['?' for _ in log_data])
         
-        self.conn.execute(
+        conn.execute(
             f'INSERT INTO prompt_change_logs ({columns}) VALUES ({placeholders})',
             list(log_data.values())
         )
@@ -140,10 +152,10 @@ class PromptDatabase:
         
         if prompt_id:
             query += ' WHERE pcl.prompt_id = ?'
-            return pd.read_sql_query(query, self.conn, params=(prompt_id,))
+            return pd.read_sql_query(query, self.connections.read(), params=(prompt_id,))
         
         query += ' ORDER BY pcl.changed_at DESC'
-        return pd.read_sql_query(query, self.conn)
+        return pd.read_sql_query(query, self.connections.read())
 
     def get_prompts(self):
         """모든 프롬프트 기본 정보 조회"""
@@ -152,15 +164,8 @@ class PromptDatabase:
         FROM prompts
         ORDER BY created_at DESC
         '''
-        return pd.read_sql_query(query, self.conn).to_dict('records')
+        return pd.read_sql_query(query, self.connections.read()).to_dict('records')
 
     def close(self):
-        """데이터베이스 연결 종료"""
-        self.conn.close()
-
-    def __del__(self):
-        """소멸자에서 데이터베이스 연결 종료"""
-        try:
-            self.conn.close()
-        except:
-            pass
\ No newline at end of file
+        """현재 스레드의 읽기 연결 반환 (공용 쓰기 연결은 프로세스가 관리)"""
+        self.connections.release()
@@ -3,18 +3,20 @@ import streamlit as st
 import pandas as pd
 from text_analyzer import TextAnalyzer
 from prompt_database import PromptDatabase
+from src.managers.similarity_manager import SimilarityManager
+
+@st.cache_resource
+def get_database(db_path='prompts.db'):
+    """프로세스 공용 데이터베이스 어댑터 (세션마다 연결을 만들지 않음)"""
+    return PromptDatabase(db_path)
 
 class PromptManager:
     def __init__(self):
-        if 'database' not in st.session_state:
-            st.session_state.database = PromptDatabase()
-            st.session_state.database.create_tables()
-
         if 'current_version' not in st.session_state:
             st.session_state.current_version = "1.0.0"
         
         self.text_analyzer = TextAnalyzer()
-        self.database = st.session_state.database
+        self.database = get_database()
 
     def render_change_logs(self):
         """변경 이력 조회 화면 렌더링"""
@@ -392,8 +394,26 @@ class PromptManager:
         
         search_term = st.text_input("검색어 입력")
         if search_term:
-            results = self.database.search(search_term)
+            page = st.number_input("페이지", min_value=1, value=1, step=1)
+            results, total = self.database.search_ranked(search_term, page=int(page))
             if len(results) > 0:
+                st.caption(f"총 {total}건")
                 st.dataframe(results)
+                self._render_similar_prompts(results)
+            else:
+                st.info("검색 결과가 없습니다.")
+
+    def _render_similar_prompts(self, results):
+        """검색 결과 기준 유사 프롬프트 조회"""
+        selected = st.selectbox(
+            "유사 프롬프트 찾기",
+            options=results[['id', 'title']].to_dict('records'),
+            format_func=lambda p: p['title'],
+            index=None
+        )
+        if selected:
+            similar = SimilarityManager(self.database.shared).find_similar(selected['id'])
+            if similar:
+                st.dataframe(pd.DataFrame(similar))
             else:
-                st.info("검색 결과가 없습니다.")
\ No newline at end of file
+                st.info("유사한 프롬프트가 없습니다.")
\ No newline at end of file
@@ -0,0 +1,63 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+class BackendError(Exception):
+    """모델 백엔드 호출 예외"""
+    pass
+
+
+class RetryableBackendError(BackendError):
+    """재시도 가능한 백엔드 예외 (429, 5xx, 타임아웃 등)"""
+    pass
+
+
+@dataclass
+class ModelRequest:
+    """모델 호출 요청"""
+    model: str
+    prompt: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    test_index: int = 0
+    test_input: str = ''
+    repetition: int = 0
+
+
+@dataclass
+class ModelResponse:
+    """모델 호출 결과"""
+    model: str
+    text: str
+    latency_ms: float = 0.0
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+
+    def to_dict(self):
+        """데이터클래스를 딕셔너리로 변환"""
+        return {
+            'model': self.model,
+            'text': self.text,
+            'latency_ms': self.latency_ms,
+            'input_tokens': self.input_tokens,
+            'output_tokens': self.output_tokens
+        }
+
+
+class ModelBackend(ABC):
+    """모델 백엔드 인터페이스"""
+
+    def __init__(
+        self,
+        name: str,
+        concurrency: int = 4,
+        rate_per_second: float = 2.0
+    ):
+        self.name = name
+        self.concurrency = concurrency
+        self.rate_per_second = rate_per_second
+
+    @abstractmethod
+    async def generate(self, request: ModelRequest) -> ModelResponse:
+        """프롬프트에 대한 모델 응답 생성"""
+        raise NotImplementedError
@@ -0,0 +1,146 @@
+import asyncio
+import os
+import time
+from typing import Dict, Optional
+import requests
+from .base import (
+    BackendError,
+    ModelBackend,
+    ModelRequest,
+    ModelResponse,
+    RetryableBackendError
+)
+
+# 재시도 대상 HTTP 상태 코드
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+class HTTPBackend(ModelBackend):
+    """HTTP API 기반 모델 백엔드 공통 클래스"""
+
+    default_url = ''
+
+    def __init__(
+        self,
+        name: str,
+        model: str,
+        api_key_env: str,
+        url: Optional[str] = None,
+        timeout: float = 60.0,
+        **kwargs
+    ):
+        super().__init__(name, **kwargs)
+        self.model = model
+        self.api_key_env = api_key_env
+        self.url = url or self.default_url
+        self.timeout = timeout
+        self._session = requests.Session()
+
+    @property
+    def api_key(self) -> str:
+        api_key = os.environ.get(self.api_key_env)
+        if not api_key:
+            raise BackendError(f"{self.api_key_env} 환경 변수가 설정되지 않았습니다.")
+        return api_key
+
+    async def generate(self, request: ModelRequest) -> ModelResponse:
+        """블로킹 HTTP 호출을 스레드에서 실행"""
+        return await asyncio.to_thread(self._post, request)
+
+    def _post(self, request: ModelRequest) -> ModelResponse:
+        """API 호출 및 응답 변환"""
+        start = time.perf_counter()
+        try:
+            response = self._session.post(
+                self.url,
+                headers=self._headers(),
+                json=self._payload(request),
+                timeout=self.timeout
+            )
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise RetryableBackendError(f"{self.name} 연결 오류: {str(e)}")
+        
+        if response.status_code in RETRYABLE_STATUS:
+            raise RetryableBackendError(
+                f"{self.name} 응답 오류 {response.status_code}: {response.text[:200]}"
+            )
+        if response.status_code >= 400:
+            raise BackendError(
+                f"{self.name} 응답 오류 {response.status_code}: {response.text[:200]}"
+            )
+        
+        result = self._parse(response.json())
+        result.latency_ms = (time.perf_counter() - start) * 1000
+        return result
+
+    def _headers(self) -> Dict[str, str]:
+        raise NotImplementedError
+
+    def _payload(self, request: ModelRequest) -> Dict:
+        raise NotImplementedError
+
+    def _parse(self, body: Dict) -> ModelResponse:
+        raise NotImplementedError
+
+
+class OpenAIBackend(HTTPBackend):
+    """OpenAI Chat Completions 형식 백엔드"""
+
+    default_url = 'https://api.openai.com/v1/chat/completions'
+
+    def _headers(self) -> Dict[str, str]:
+        return {
+            'Authorization': f"Bearer {self.api_key}",
+            'Content-Type': 'application/json'
+        }
+
+    def _payload(self, request: ModelRequest) -> Dict:
+        return {
+            'model': self.model,
+            'messages': [{'role': 'user', 'content': request.prompt}],
+            **request.params
+        }
+
+    def _parse(self, body: Dict) -> ModelResponse:
+        usage = body.get('usage', {})
+        return ModelResponse(
+            model=self.name,
+            text=body['choices'][0]['message']['content'] or '',
+            input_tokens=usage.get('prompt_tokens'),
+            output_tokens=usage.get('completion_tokens')
+        )
+
+
+class ClaudeBackend(HTTPBackend):
+    """Anthropic Messages 형식 백엔드"""
+
+    default_url = 'https://api.anthropic.com/v1/messages'
+
+    def _headers(self) -> Dict[str, str]:
+        return {
+            'x-api-key': self.api_key,
+            'anthropic-version': '2023-06-01',
+            'Content-Type': 'application/json'
+        }
+
+    def _payload(self, request: ModelRequest) -> Dict:
+        params = {'max_tokens': 1024, **request.params}
+        return {
+            'model': self.model,
+            'messages': [{'role': 'user', 'content': request.prompt}],
+            **params
+        }
+
+    def _parse(self, body: Dict) -> ModelResponse:
+        usage = body.get('usage', {})
+        text = ''.join(
+            block.get('text', '')
+            for block in body.get('content', [])
+            if block.get('type') == 'text'
+        )
+        return ModelResponse(
+            model=self.name,
+            text=text,
+            input_tokens=usage.get('input_tokens'),
+            output_tokens=usage.get('output_tokens')
+        )
@@ -0,0 +1,30 @@
+from typing import Dict
+from .base import BackendError, ModelBackend
+from .http_backend import ClaudeBackend, OpenAIBackend
+from .stub_backend import StubBackend
+
+# 설정의 backend 값과 구현 클래스 매핑
+BACKEND_TYPES = {
+    'stub': StubBackend,
+    'openai': OpenAIBackend,
+    'claude': ClaudeBackend
+}
+
+
+def create_backend(name: str, settings: Dict) -> ModelBackend:
+    """설정으로부터 백엔드 생성"""
+    settings = dict(settings)
+    backend_type = settings.pop('backend', 'stub')
+    
+    if backend_type not in BACKEND_TYPES:
+        raise BackendError(f"지원하지 않는 백엔드입니다: {backend_type}")
+    
+    return BACKEND_TYPES[backend_type](name=name, **settings)
+
+
+def create_backends(models: Dict[str, Dict]) -> Dict[str, ModelBackend]:
+    """설정의 models 섹션 전체로부터 백엔드 생성"""
+    return {
+        name: create_backend(name, settings)
+        for name, settings in (models or {}).items()
+    }
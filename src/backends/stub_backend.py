@@ -0,0 +1,49 @@
+import asyncio
+import hashlib
+from .base import ModelBackend, ModelRequest, ModelResponse
+
+# 스텁 응답 문장 목록
+STUB_SENTENCES = [
+    "요청하신 내용을 검토했습니다.",
+    "주요 항목을 정리하면 다음과 같습니다.",
+    "추가 확인이 필요한 부분이 있습니다.",
+    "결론적으로 요구사항을 충족합니다.",
+    "관련 근거를 함께 제시합니다.",
+    "예외 상황에 대한 주의가 필요합니다."
+]
+
+
+class StubBackend(ModelBackend):
+    """오프라인 테스트용 결정적 스텁 백엔드
+    
+    같은 프롬프트와 파라미터에는 항상 같은 응답을 반환하며,
+    temperature 가 0 보다 크면 반복 번호에 따라 응답이 달라집니다.
+    """
+
+    def __init__(self, name: str = 'stub', latency_ms: float = 0.0, **kwargs):
+        super().__init__(name, **kwargs)
+        self.latency_ms = latency_ms
+
+    async def generate(self, request: ModelRequest) -> ModelResponse:
+        """결정적 응답 생성"""
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+        
+        seed = request.prompt
+        if (request.params.get('temperature') or 0) > 0:
+            seed += f"\x00{request.repetition}"
+        digest = hashlib.sha256(seed.encode('utf-8')).digest()
+        
+        sentences = [
+            STUB_SENTENCES[digest[i] % len(STUB_SENTENCES)]
+            for i in range(1 + digest[0] % 4)
+        ]
+        text = ' '.join(sentences)
+        
+        return ModelResponse(
+            model=self.name,
+            text=text,
+            latency_ms=self.latency_ms,
+            input_tokens=len(request.prompt.split()),
+            output_tokens=len(text.split())
+        )
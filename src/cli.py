@@ -0,0 +1,410 @@
+# src/cli.py
+"""Streamlit 없이 실행하는 배치 명령줄 도구
+
+    python -m src.cli import prompts.csv --user batch
+    python -m src.cli export --format jsonl --output prompts.jsonl
+    python -m src.cli consistency-test --prompt-file prompt.txt --cases-file cases.txt
+    python -m src.cli evaluate --min-score 0.6
+    python -m src.cli validate --fail-on has_instruction
+    python -m src.cli rebuild-index --target duplicates similarity
+    python -m src.cli recompress --train-dictionary
+    python -m src.cli backup
+    python -m src.cli restore backups/prompts-20240101-030000.db --force
+
+결과는 표준 출력에 JSON 한 개로 출력합니다.
+종료 코드: 0 성공, 1 검사 실패 (오류 응답, 점수 미달 등), 2 실행 오류
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.database.compression import configure_compression
+from src.database.database import DatabaseError, PromptDatabase
+from src.utils.config import Config
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_ERROR = 2
+
+# 가져오기 시 반드시 있어야 하는 컬럼
+REQUIRED_IMPORT_FIELDS = ['title', 'model', 'category', 'prompt_content']
+
+INDEX_TARGETS = ['duplicates', 'similarity', 'keywords']
+
+
+class CommandError(Exception):
+    """명령 실행 불가 (잘못된 입력 파일 등)"""
+    pass
+
+
+def _json_default(value):
+    """numpy/pandas/datetime 값을 JSON 으로 변환"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+def _dumps(data) -> str:
+    return json.dumps(data, ensure_ascii=False, default=_json_default)
+
+
+def _read_text(path: str) -> str:
+    """텍스트 파일 읽기 ('-' 이면 표준 입력)"""
+    if path == '-':
+        return sys.stdin.read()
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _iter_records(path: str) -> Iterator[Tuple[int, Dict]]:
+    """CSV/JSONL/JSON 파일의 레코드를 (줄 번호, 레코드) 로 순회"""
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        if extension == '.csv':
+            for line_number, row in enumerate(csv.DictReader(f), start=2):
+                yield line_number, row
+        elif extension == '.jsonl':
+            for line_number, line in enumerate(f, start=1):
+                if line.strip():
+                    yield line_number, json.loads(line)
+        elif extension == '.json':
+            records = json.load(f)
+            if not isinstance(records, list):
+                raise CommandError("JSON 파일은 레코드 배열이어야 합니다.")
+            for index, record in enumerate(records, start=1):
+                yield index, record
+        else:
+            raise CommandError(f"지원하지 않는 형식입니다: {extension or path}")
+
+
+class BatchCLI:
+    """명령줄 하위 명령 실행기"""
+
+    def __init__(self, config: Config, db_path: Optional[str] = None):
+        self.config = config
+        configure_compression(config)
+        self.database = PromptDatabase(db_path or config.get('database.path', 'prompts.db'))
+
+    def import_prompts(self, args) -> Tuple[int, Dict]:
+        """CSV/JSONL/JSON 프롬프트 가져오기"""
+        from src.managers.prompt_manager import PromptManager
+
+        manager = PromptManager(self.database)
+        defaults = {
+            'version': self.config.get('version.initial', '1.0.0'),
+            'created_by': args.user,
+            'department': args.department
+        }
+
+        imported, failed = 0, []
+        for line_number, record in _iter_records(args.file):
+            data = {**defaults, **{k: v for k, v in record.items() if v not in (None, '')}}
+            missing = [field for field in REQUIRED_IMPORT_FIELDS if not data.get(field)]
+            if missing:
+                failed.append({'line': line_number, 'error': f"필수 항목 누락: {', '.join(missing)}"})
+                continue
+
+            try:
+                manager.create_prompt(data)
+                imported += 1
+            except DatabaseError as e:
+                failed.append({'line': line_number, 'error': str(e)})
+
+        status = EXIT_FAILED if failed else EXIT_OK
+        return status, {'imported': imported, 'failed': len(failed), 'errors': failed[:100]}
+
+    def export_prompts(self, args) -> Tuple[int, Dict]:
+        """프롬프트 히스토리 내보내기"""
+        from src.managers.history_manager import HistoryManager
+
+        manager = HistoryManager(self.database)
+        filters = {
+            'model': args.model,
+            'category': args.category,
+            'created_by': args.created_by
+        }
+        history = manager.get_history({k: v for k, v in filters.items() if v})
+
+        if args.format == 'jsonl':
+            data = history.to_json(
+                orient='records', lines=True, force_ascii=False, date_format='iso'
+            ).encode('utf-8')
+        else:
+            data = manager.export_history(history, args.format)
+
+        with open(args.output, 'wb') as f:
+            f.write(data)
+
+        return EXIT_OK, {'exported': len(history), 'format': args.format, 'output': args.output}
+
+    def consistency_test(self, args) -> Tuple[int, Dict]:
+        """일관성 테스트 실행"""
+        from src.managers.test_manager import TestManager
+
+        manager = TestManager(self.config, self.database)
+        prompt = _read_text(args.prompt_file) if args.prompt_file else args.prompt
+        if not prompt:
+            raise CommandError("--prompt 또는 --prompt-file 이 필요합니다.")
+
+        models = args.models or ['stub']
+        unknown = [model for model in models if model not in manager.available_models()]
+        if unknown:
+            raise CommandError(f"설정에 없는 모델입니다: {', '.join(unknown)}")
+
+        params = {'temperature': args.temperature}
+        use_cache = not args.no_cache
+
+        if args.matrix:
+            from src.utils.template_matrix import TestMatrix
+
+            extension = os.path.splitext(args.matrix)[1].lower()
+            if extension in ('.csv', '.jsonl'):
+                matrix = TestMatrix.from_file(args.matrix)
+            elif extension == '.json':
+                matrix = manager.create_test_matrix(_read_text(args.matrix))
+            else:
+                matrix = manager.create_test_matrix(args.matrix)
+            stream = manager.iter_matrix_test(
+                prompt, matrix, models, args.repetitions, params,
+                sample=args.sample, seed=args.seed, use_cache=use_cache
+            )
+        elif args.cases_file:
+            cases = [line.strip() for line in _read_text(args.cases_file).splitlines() if line.strip()]
+            stream = manager.iter_consistency_test(
+                prompt, cases, models, args.repetitions, params, use_cache
+            )
+        else:
+            raise CommandError("--cases-file 또는 --matrix 가 필요합니다.")
+
+        output = open(args.output, 'w', encoding='utf-8') if args.output else None
+        results, errors = [], 0
+        try:
+            for result in stream:
+                if result['error']:
+                    errors += 1
+                if output is not None:
+                    output.write(_dumps(result) + '\n')
+                # 일관성 통계 계산에 필요한 항목만 보관
+                results.append({
+                    key: result[key]
+                    for key in ('test_index', 'model', 'repetition', 'response', 'error', 'cached')
+                })
+        finally:
+            if output is not None:
+                output.close()
+
+        summary = {
+            'results': len(results),
+            'errors': errors,
+            'cache': manager.get_cache_summary(results) if use_cache else None
+        }
+        if args.repetitions > 1:
+            summary['consistency'] = [
+                {key: value for key, value in item.items() if key != 'matrix'}
+                for item in manager.summarize_consistency(results)
+            ]
+            min_similarity = min(
+                (item['min_similarity'] for item in summary['consistency']),
+                default=1.0
+            )
+            if args.min_similarity is not None and min_similarity < args.min_similarity:
+                summary['below_min_similarity'] = True
+                return EXIT_FAILED, summary
+
+        return (EXIT_FAILED if errors else EXIT_OK), summary
+
+    def evaluate(self, args) -> Tuple[int, Dict]:
+        """저장된 답변 회귀 평가"""
+        from src.managers.evaluation_manager import EvaluationManager
+
+        manager = EvaluationManager(self.database)
+        summary = manager.evaluate_library(
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            force=args.force
+        )
+
+        scores = manager.get_results()['score'].dropna()
+        summary['evaluated'] = int(len(scores))
+        summary['mean_score'] = round(float(scores.mean()), 4) if len(scores) else None
+
+        if args.min_score is not None and summary['mean_score'] is not None \
+                and summary['mean_score'] < args.min_score:
+            return EXIT_FAILED, summary
+        return EXIT_OK, summary
+
+    def validate(self, args) -> Tuple[int, Dict]:
+        """전체 라이브러리 구조 규칙 검사"""
+        from src.managers.validation_manager import ValidationManager
+
+        manager = ValidationManager(self.database, self.config.get('validation.rules'))
+        summary = manager.validate_library(force=args.force)
+        summary['rules'] = manager.get_summary().to_dict('records')
+
+        failing = [
+            rule for rule in summary['rules']
+            if rule['rule_name'] in (args.fail_on or []) and rule['failed']
+        ]
+        return (EXIT_FAILED if failing else EXIT_OK), summary
+
+    def rebuild_index(self, args) -> Tuple[int, Dict]:
+        """검색/중복/유사도 인덱스 재생성"""
+        counts = {}
+        for target in args.target or INDEX_TARGETS:
+            start = time.perf_counter()
+            if target == 'duplicates':
+                from src.managers.duplicate_manager import DuplicateManager
+                count = DuplicateManager(self.database).rebuild_index()
+            elif target == 'similarity':
+                from src.managers.similarity_manager import SimilarityManager
+                count = SimilarityManager(self.database).rebuild_index()
+            else:
+                from src.managers.keyword_manager import KeywordManager
+                count = KeywordManager(self.database).rebuild_index()
+            counts[target] = {
+                'indexed': count,
+                'duration_sec': round(time.perf_counter() - start, 3)
+            }
+        return EXIT_OK, counts
+
+    def cluster_duplicates(self, args) -> Tuple[int, Dict]:
+        """기존 중복 프롬프트 군집"""
+        from src.managers.duplicate_manager import DuplicateManager
+
+        clusters = DuplicateManager(self.database).cluster_duplicates(args.threshold)
+        return EXIT_OK, {'clusters': len(clusters), 'groups': clusters}
+
+    def recompress(self, args) -> Tuple[int, Dict]:
+        """기존 본문을 현재 압축 설정으로 다시 저장 (설정이 꺼져 있으면 압축 해제)"""
+        from src.managers.compression_manager import CompressionManager
+
+        manager = CompressionManager(self.database)
+        result = {}
+        if args.train_dictionary:
+            result['dictionary_id'] = manager.train_dictionary(args.sample_size)
+        result.update(manager.recompress(args.batch_size, pause_sec=0))
+        result['stats'] = manager.get_stats().to_dict('records')
+        return EXIT_OK, result
+
+    def backup(self, args) -> Tuple[int, Dict]:
+        """데이터베이스 스냅숏 생성 (database.backup_* 설정)"""
+        from src.database.backup import create_backup_service
+
+        service = create_backup_service(self.config, self.database.db_path)
+        result = vars(service.backup())
+        result['backups'] = [backup['name'] for backup in service.list_backups()]
+        return EXIT_OK, result
+
+    def restore(self, args) -> Tuple[int, Dict]:
+        """스냅숏을 현재 데이터베이스에 복원 (앱을 멈춘 상태에서 실행)"""
+        from src.database.backup import create_backup_service
+
+        if not args.force:
+            raise CommandError("현재 데이터베이스를 덮어씁니다. 앱을 멈춘 뒤 --force 와 함께 실행하세요.")
+        service = create_backup_service(self.config, self.database.db_path)
+        return EXIT_OK, service.restore(args.file)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m src.cli',
+        description='프롬프트 관리 도구 배치 명령'
+    )
+    parser.add_argument('--config', default='config.yaml', help='설정 파일 경로')
+    parser.add_argument('--db', help='데이터베이스 경로 (기본값: 설정의 database.path)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = subparsers.add_parser('import', help='CSV/JSONL/JSON 프롬프트 가져오기')
+    import_parser.add_argument('file')
+    import_parser.add_argument('--user', default='batch', help='created_by 기본값')
+    import_parser.add_argument('--department', default=None)
+    import_parser.set_defaults(handler=BatchCLI.import_prompts)
+
+    export_parser = subparsers.add_parser('export', help='프롬프트 히스토리 내보내기')
+    export_parser.add_argument('--format', choices=['csv', 'json', 'jsonl'], default='csv')
+    export_parser.add_argument('--output', required=True, help='출력 파일')
+    export_parser.add_argument('--model', nargs='*')
+    export_parser.add_argument('--category', nargs='*')
+    export_parser.add_argument('--created-by')
+    export_parser.set_defaults(handler=BatchCLI.export_prompts)
+
+    test_parser = subparsers.add_parser('consistency-test', help='일관성 테스트 실행')
+    test_parser.add_argument('--prompt')
+    test_parser.add_argument('--prompt-file', help="프롬프트 파일 ('-' 이면 표준 입력)")
+    test_parser.add_argument('--cases-file', help='줄 단위 테스트 케이스 파일')
+    test_parser.add_argument('--matrix', help='템플릿 변수 JSON 또는 JSON/CSV/JSONL 파일')
+    test_parser.add_argument('--models', nargs='*')
+    test_parser.add_argument('--repetitions', type=int, default=1)
+    test_parser.add_argument('--temperature', type=float, default=0.0)
+    test_parser.add_argument('--sample', type=int, help='매트릭스 조합 표본 크기')
+    test_parser.add_argument('--seed', type=int, default=0)
+    test_parser.add_argument('--no-cache', action='store_true')
+    test_parser.add_argument('--output', help='개별 결과 JSONL 파일')
+    test_parser.add_argument('--min-similarity', type=float, help='최소 유사도 미달 시 종료 코드 1')
+    test_parser.set_defaults(handler=BatchCLI.consistency_test)
+
+    evaluate_parser = subparsers.add_parser('evaluate', help='저장된 답변 증분 회귀 평가')
+    evaluate_parser.add_argument('--workers', type=int)
+    evaluate_parser.add_argument('--chunk-size', type=int, default=500)
+    evaluate_parser.add_argument('--force', action='store_true', help='변경 여부와 관계없이 전체 재평가')
+    evaluate_parser.add_argument('--min-score', type=float, help='평균 점수 미달 시 종료 코드 1')
+    evaluate_parser.set_defaults(handler=BatchCLI.evaluate)
+
+    validate_parser = subparsers.add_parser('validate', help='구조 규칙 일괄 검사')
+    validate_parser.add_argument('--force', action='store_true', help='변경 여부와 관계없이 전체 재검사')
+    validate_parser.add_argument('--fail-on', nargs='*', help='위반 시 종료 코드 1 로 처리할 규칙')
+    validate_parser.set_defaults(handler=BatchCLI.validate)
+
+    rebuild_parser = subparsers.add_parser('rebuild-index', help='인덱스 재생성')
+    rebuild_parser.add_argument('--target', nargs='*', choices=INDEX_TARGETS)
+    rebuild_parser.set_defaults(handler=BatchCLI.rebuild_index)
+
+    cluster_parser = subparsers.add_parser('cluster-duplicates', help='중복 프롬프트 군집')
+    cluster_parser.add_argument('--threshold', type=float)
+    cluster_parser.set_defaults(handler=BatchCLI.cluster_duplicates)
+
+    recompress_parser = subparsers.add_parser('recompress', help='본문 압축 설정을 기존 행에 적용')
+    recompress_parser.add_argument('--train-dictionary', action='store_true', help='먼저 새 압축 사전 학습')
+    recompress_parser.add_argument('--sample-size', type=int, default=500)
+    recompress_parser.add_argument('--batch-size', type=int, default=500)
+    recompress_parser.set_defaults(handler=BatchCLI.recompress)
+
+    backup_parser = subparsers.add_parser('backup', help='데이터베이스 스냅숏 생성')
+    backup_parser.set_defaults(handler=BatchCLI.backup)
+
+    restore_parser = subparsers.add_parser('restore', help='스냅숏을 현재 데이터베이스에 복원')
+    restore_parser.add_argument('file', help='복원할 스냅숏 파일')
+    restore_parser.add_argument('--force', action='store_true', help='현재 데이터베이스 덮어쓰기 확인')
+    restore_parser.set_defaults(handler=BatchCLI.restore)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    start = time.perf_counter()
+
+    try:
+        cli = BatchCLI(Config(args.config), args.db)
+        status, result = args.handler(cli, args)
+    except (CommandError, DatabaseError, OSError, ValueError) as e:
+        print(_dumps({'command': args.command, 'status': 'error', 'error': str(e)}))
+        return EXIT_ERROR
+
+    print(_dumps({
+        'command': args.command,
+        'status': 'ok' if status == EXIT_OK else 'failed',
+        'duration_sec': round(time.perf_counter() - start, 3),
+        'result': result
+    }))
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,320 @@
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+import glob
+import os
+import sqlite3
+import threading
+import time
+from .database import DatabaseError
+
+# 스냅숏 검사 방식: quick 은 PRAGMA quick_check, integrity 는 PRAGMA integrity_check
+VERIFY_MODES = ('quick', 'integrity', 'none')
+
+# 다른 프로세스가 남기고 죽은 잠금 파일로 보는 시간 (초)
+STALE_LOCK_SECONDS = 6 * 3600
+
+
+class BackupError(DatabaseError):
+    """백업/복원 실패"""
+    pass
+
+
+@dataclass
+class BackupResult:
+    """스냅숏 한 번의 결과"""
+    path: Optional[str] = None
+    started_at: float = field(default_factory=time.time)
+    duration_sec: float = 0.0
+    pages: int = 0
+    restarts: int = 0
+    bytes: int = 0
+    integrity: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BackupService:
+    """SQLite 온라인 백업 API 로 데이터베이스 스냅숏을 만들고 보관/검사/복원
+
+    step_pages 페이지씩 나눠 복사하고 단계 사이에 step_sleep 초 쉬므로 한 번에 잠금을
+    오래 잡지 않습니다. WAL 모드(PromptDatabase 기본값)에서는 복사하는 동안 원본 연결이
+    읽기 트랜잭션을 열어 둬 복사 시작 시점의 스냅숏을 끝까지 복사하고, 그동안 다른 연결의
+    쓰기는 막히지 않습니다. 대신 이 읽기 트랜잭션이 끝날 때까지 체크포인트가 WAL 을
+    되감지 못하므로, 오래 걸리는 백업 중에는 쓰기량만큼 -wal 파일이 커집니다.
+    롤백 저널 모드에서는 읽기 트랜잭션이 쓰기를 막으므로 단계마다 잠금을 풀고, 그 사이
+    다른 연결이 쓰면 SQLite 가 처음부터 다시 복사합니다. max_restarts 번을 넘으면 쓰기를
+    막는 통째 복사 대신 이번 백업을 포기하고 스케줄러의 다음 확인 때 다시 시도합니다.
+    매번 전체 스냅숏이며 변경분만 복사하는 증분 백업은 아닙니다.
+
+    완성된 스냅숏은 검사를 통과해야 최종 이름으로 바뀌고, 보관 디렉터리에는 최근
+    keep 개만 남습니다.
+    """
+
+    _running = threading.Lock()
+
+    def __init__(
+        self,
+        db_path: str,
+        directory: str = 'backups/',
+        step_pages: int = 1024,
+        step_sleep: float = 0.05,
+        keep: int = 7,
+        verify: str = 'quick',
+        max_restarts: int = 3
+    ):
+        if verify not in VERIFY_MODES:
+            raise ValueError(f"verify 는 {', '.join(VERIFY_MODES)} 중 하나여야 합니다: {verify}")
+        self.db_path = db_path
+        self.directory = directory
+        self.step_pages = step_pages
+        self.step_sleep = step_sleep
+        self.keep = keep
+        self.verify_mode = verify
+        self.max_restarts = max_restarts
+        self.stem = os.path.splitext(os.path.basename(db_path))[0]
+        self.last_result: Optional[BackupResult] = None
+        self._scheduler = None
+
+    def backup(self, label: str = '', protect: Optional[str] = None) -> BackupResult:
+        """스냅숏 생성 (다른 백업이 진행 중이면 BackupError, protect 는 보관 개수를 넘어도 지우지 않음)"""
+        if not self._running.acquire(blocking=False):
+            raise BackupError("다른 백업이 진행 중입니다.")
+        try:
+            with self._process_lock():
+                return self._backup(label, protect)
+        finally:
+            self._running.release()
+
+    def _backup(self, label: str, protect: Optional[str]) -> BackupResult:
+        os.makedirs(self.directory, exist_ok=True)
+        base = f"{self.stem}-{datetime.now():%Y%m%d-%H%M%S}{'-' + label if label else ''}"
+        path = os.path.join(self.directory, f"{base}.db")
+        # 같은 초에 두 번 만들면 번호를 붙임
+        number = 1
+        while os.path.exists(path):
+            path = os.path.join(self.directory, f"{base}-{number}.db")
+            number += 1
+        partial = path + '.partial'
+
+        result = BackupResult()
+        start = time.perf_counter()
+        try:
+            result.pages, result.restarts = self._copy(partial)
+            result.integrity = self.verify(partial)
+            if result.integrity != 'ok':
+                raise BackupError(f"스냅숏 검사 실패: {result.integrity}")
+            os.replace(partial, path)
+            result.path = path
+            result.bytes = os.path.getsize(path)
+            self._rotate(protect)
+        except Exception as e:
+            result.error = str(e)
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise BackupError(f"백업 실패: {e}") from e
+        finally:
+            result.duration_sec = round(time.perf_counter() - start, 3)
+            self.last_result = result
+        return result
+
+    def _copy(self, dest_path: str):
+        """단계별 복사 (복사한 전체 페이지 수, 다시 시작한 횟수)"""
+        state = {'remaining': None, 'total': 0, 'restarts': 0}
+
+        def progress(status, remaining, total):
+            if state['remaining'] is not None and remaining >= state['remaining']:
+                state['restarts'] += 1
+                if state['restarts'] > self.max_restarts:
+                    raise BackupError(f"쓰기가 잦아 복사를 {self.max_restarts}번 다시 시작했습니다. 나중에 다시 시도합니다.")
+            state['remaining'] = remaining
+            state['total'] = total
+            if remaining and self.step_sleep:
+                time.sleep(self.step_sleep)
+
+        source = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        dest = sqlite3.connect(dest_path)
+        try:
+            snapshot = source.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+            if snapshot:
+                source.execute('BEGIN')
+                source.execute('SELECT COUNT(*) FROM sqlite_master').fetchone()
+            source.backup(dest, pages=self.step_pages, progress=progress)
+            if snapshot:
+                source.execute('COMMIT')
+            # 스냅숏은 -wal/-shm 파일 없이 파일 하나로 보관
+            dest.execute('PRAGMA journal_mode=DELETE')
+            return state['total'], state['restarts']
+        finally:
+            dest.close()
+            source.close()
+
+    def verify(self, path: str, mode: Optional[str] = None) -> str:
+        """스냅숏 검사 ('ok' 또는 첫 번째 오류 내용)"""
+        mode = mode or self.verify_mode
+        if mode == 'none':
+            return 'ok'
+
+        pragma = 'integrity_check' if mode == 'integrity' else 'quick_check'
+        conn = sqlite3.connect(f"file:{os.path.abspath(path)}?mode=ro", uri=True)
+        try:
+            rows = conn.execute(f'PRAGMA {pragma}').fetchall()
+            if rows != [('ok',)]:
+                return '; '.join(str(row[0]) for row in rows[:5])
+            conn.execute('SELECT COUNT(*) FROM prompts').fetchone()
+            return 'ok'
+        except sqlite3.Error as e:
+            return str(e)
+        finally:
+            conn.close()
+
+    def list_backups(self) -> List[Dict]:
+        """보관 중인 스냅숏 (최신순)"""
+        backups = []
+        for path in glob.glob(os.path.join(self.directory, f"{self.stem}-*.db")):
+            stat = os.stat(path)
+            backups.append({
+                'path': path,
+                'name': os.path.basename(path),
+                'size_mb': round(stat.st_size / 2 ** 20, 1),
+                'created_at': datetime.fromtimestamp(stat.st_mtime)
+            })
+        return sorted(backups, key=lambda backup: backup['created_at'], reverse=True)
+
+    def _rotate(self, protect: Optional[str] = None):
+        """오래된 스냅숏 삭제"""
+        protected = os.path.abspath(protect) if protect else None
+        for backup in self.list_backups()[self.keep:]:
+            if os.path.abspath(backup['path']) == protected:
+                continue
+            try:
+                os.remove(backup['path'])
+            except OSError:
+                pass
+
+    def restore(self, backup_path: str) -> Dict:
+        """스냅숏을 현재 데이터베이스에 복원
+
+        전체 검사를 통과한 스냅숏만 복원하고, 복원 전 현재 상태를 pre-restore 스냅숏으로
+        남깁니다. 복사는 백업 API 로 한 번에 하므로 그동안 다른 쓰기는 기다립니다.
+        실행 중인 앱의 메모리 색인(검색/유사도)은 복원 내용을 모르므로 복원 후 앱을 다시
+        시작해야 합니다.
+        """
+        if not os.path.exists(backup_path):
+            raise BackupError(f"백업 파일이 없습니다: {backup_path}")
+        integrity = self.verify(backup_path, 'integrity')
+        if integrity != 'ok':
+            raise BackupError(f"백업 파일 검사 실패: {integrity}")
+
+        safety = None
+        if os.path.exists(self.db_path):
+            safety = self.backup('pre-restore', protect=backup_path).path
+        versions = self._data_versions(self.db_path)
+        journal_mode = self._journal_mode(self.db_path)
+
+        source = sqlite3.connect(f"file:{os.path.abspath(backup_path)}?mode=ro", uri=True)
+        dest = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            source.backup(dest)
+            # 복원한 파일의 데이터 버전이 더 낮으면 예전 읽기 캐시가 다시 맞을 수 있으므로
+            # 복원 전 값보다 크게 올림
+            with dest:
+                dest.executemany(
+                    'UPDATE data_versions SET version = MAX(version, ?) + 1 WHERE scope = ?',
+                    [(version, scope) for scope, version in versions.items()]
+                )
+            # 스냅숏은 롤백 저널 모드로 보관되므로 원래 모드로 되돌림
+            if journal_mode:
+                dest.execute(f'PRAGMA journal_mode={journal_mode}')
+        except sqlite3.Error as e:
+            raise BackupError(f"복원 실패: {e}") from e
+        finally:
+            dest.close()
+            source.close()
+
+        return {'restored_from': backup_path, 'pre_restore_backup': safety}
+
+    @staticmethod
+    def _data_versions(path: str) -> Dict[str, int]:
+        if not os.path.exists(path):
+            return {}
+        conn = sqlite3.connect(path, timeout=30)
+        try:
+            return dict(conn.execute('SELECT scope, version FROM data_versions').fetchall())
+        except sqlite3.Error:
+            return {}
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _journal_mode(path: str) -> Optional[str]:
+        if not os.path.exists(path):
+            return None
+        conn = sqlite3.connect(path, timeout=30)
+        try:
+            return conn.execute('PRAGMA journal_mode').fetchone()[0]
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _process_lock(self):
+        """같은 보관 디렉터리를 쓰는 다른 프로세스와 동시에 백업하지 않도록 잠금 파일 사용"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f".{self.stem}.lock")
+        try:
+            if time.time() - os.path.getmtime(path) > STALE_LOCK_SECONDS:
+                os.remove(path)
+        except OSError:
+            pass
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            raise BackupError("다른 프로세스가 백업 중입니다.")
+        os.write(fd, str(os.getpid()).encode())
+        os.close(fd)
+        try:
+            yield
+        finally:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def is_due(self, interval_hours: float) -> bool:
+        """가장 최근 스냅숏이 주기보다 오래되었는지"""
+        backups = self.list_backups()
+        if not backups:
+            return True
+        age = time.time() - backups[0]['created_at'].timestamp()
+        return age >= interval_hours * 3600
+
+    def start_scheduler(self, interval_hours: float, check_sec: float = 60.0) -> threading.Thread:
+        """주기마다 스냅숏을 만드는 백그라운드 스레드 시작 (이미 시작했으면 그 스레드)"""
+        if self._scheduler is not None and self._scheduler.is_alive():
+            return self._scheduler
+
+        def loop():
+            while True:
+                if self.is_due(interval_hours):
+                    try:
+                        self.backup()
+                    except BackupError:
+                        # 실패/충돌은 last_result 에 남기고 다음 확인 때 다시 시도
+                        pass
+                time.sleep(check_sec)
+
+        self._scheduler = threading.Thread(target=loop, name='backup-scheduler', daemon=True)
+        self._scheduler.start()
+        return self._scheduler
+
+
+def create_backup_service(config, db_path: Optional[str] = None) -> BackupService:
+    """설정의 database.backup_* 값으로 백업 서비스 생성"""
+    return BackupService(
+        db_path or config.get('database.path', 'prompts.db'),
+        directory=config.get('database.backup_path', 'backups/'),
+        step_pages=config.get('database.backup_step_pages', 1024),
+        step_sleep=config.get('database.backup_step_sleep_ms', 50) / 1000,
+        keep=config.get('database.backup_keep', 7),
+        verify=config.get('database.backup_verify', 'quick')
+    )
@@ -0,0 +1,163 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional
+import re
+import struct
+import threading
+import zlib
+
+# 압축해서 저장할 수 있는 큰 본문 컬럼
+COMPRESSED_COLUMNS = ['prompt_content', 'chatbot_response', 'expected_result']
+
+# 압축 값 머리말: 표식 3바이트 + 사전 ID(0 이면 사전 없음) + 원문 바이트 수
+MAGIC = b'\x1fPZ'
+HEADER = struct.Struct('>3sHI')
+
+# zlib 미리 정의된 사전(zdict)의 최대 크기 (압축 창 크기)
+MAX_DICTIONARY_BYTES = 32 * 1024
+
+_SEGMENT_SPLIT = re.compile(r'(?<=[.!?。])\s+|\n+')
+
+
+@dataclass
+class CompressionSettings:
+    """본문 압축 설정 (enabled 가 False 여도 이미 압축된 값은 읽을 수 있음)"""
+    enabled: bool = False
+    min_bytes: int = 4096
+    level: int = 6
+    use_dictionary: bool = True
+    dictionary_bytes: int = MAX_DICTIONARY_BYTES
+    # 원문 대비 이 비율보다 작아질 때만 압축한 값을 저장
+    max_ratio: float = 0.9
+
+
+settings = CompressionSettings()
+
+
+def is_compressed(value) -> bool:
+    return isinstance(value, bytes) and value[:3] == MAGIC
+
+
+def raw_length(value) -> Optional[int]:
+    """저장된 값의 원문 UTF-8 바이트 수 (압축 값은 풀지 않고 머리말에서 읽음)"""
+    if value is None:
+        return None
+    if is_compressed(value):
+        return HEADER.unpack_from(value)[2]
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    return len(value)
+
+
+def raw_length_sql(column: str) -> str:
+    """raw_length 와 같은 값을 내는 SQL 식 (압축 값에만 파이썬 함수 raw_length 를 호출)
+
+    행마다 파이썬 함수를 부르면 집계가 크게 느려지므로 압축되지 않은 텍스트는
+    SQLite 의 length(CAST(... AS BLOB)) 로 바이트 수를 셉니다.
+    """
+    return (
+        f"CASE typeof({column}) WHEN 'blob' THEN raw_length({column}) "
+        f"ELSE length(CAST({column} AS BLOB)) END"
+    )
+
+
+def dictionary_id(value) -> Optional[int]:
+    """압축 값에 쓰인 사전 ID (압축 값이 아니면 None)"""
+    if not is_compressed(value):
+        return None
+    return HEADER.unpack_from(value)[1]
+
+
+def train_dictionary(samples: Iterable[str], size: int = MAX_DICTIONARY_BYTES) -> bytes:
+    """표본 본문에서 자주 반복되는 문장/줄로 zlib 사전 생성
+
+    zlib 은 사전 끝쪽 문자열을 더 짧은 거리로 참조하므로 가장 쓸모 있는 조각을 끝에
+    둡니다.
+    """
+    counts = Counter()
+    for text in samples:
+        for segment in set(_SEGMENT_SPLIT.split(text or '')):
+            segment = segment.strip()
+            if len(segment) >= 8:
+                counts[segment] += 1
+
+    # 두 번 이상 나온 조각을 (등장 횟수 x 길이) 순으로 사전 크기까지 선택
+    chosen, used = [], 0
+    for segment, count in sorted(counts.items(), key=lambda item: item[1] * len(item[0]), reverse=True):
+        if count < 2:
+            break
+        encoded = segment.encode('utf-8') + b'\n'
+        if used + len(encoded) > size:
+            continue
+        chosen.append(encoded)
+        used += len(encoded)
+    return b''.join(reversed(chosen))
+
+
+class TextCodec:
+    """큰 본문 컬럼 값의 압축/해제
+
+    사전은 데이터베이스의 compression_dictionaries 테이블에 저장되고 ID 로 참조됩니다.
+    값마다 사전 ID 를 머리말에 남기므로 사전을 새로 만들어도 예전 값을 풀 수 있습니다.
+    """
+
+    def __init__(self, load_dictionary: Callable[[int], Optional[bytes]]):
+        self._load_dictionary = load_dictionary
+        self._dictionaries: Dict[int, bytes] = {}
+        self._lock = threading.Lock()
+
+    def dictionary(self, dict_id: int) -> bytes:
+        if dict_id == 0:
+            return b''
+        data = self._dictionaries.get(dict_id)
+        if data is None:
+            data = self._load_dictionary(dict_id)
+            if data is None:
+                raise ValueError(f"압축 사전을 찾을 수 없습니다: {dict_id}")
+            with self._lock:
+                self._dictionaries[dict_id] = data
+        return data
+
+    def remember(self, dict_id: int, data: bytes):
+        with self._lock:
+            self._dictionaries[dict_id] = data
+
+    def encode(self, text, dict_id: int = 0):
+        """설정 기준보다 크고 충분히 줄어드는 본문만 압축 (그 밖에는 원문 그대로)"""
+        if not isinstance(text, str):
+            return text
+        raw = text.encode('utf-8')
+        if len(raw) < settings.min_bytes:
+            return text
+        compressed = self.compress(raw, dict_id)
+        if len(compressed) > len(raw) * settings.max_ratio:
+            return text
+        return compressed
+
+    def compress(self, raw: bytes, dict_id: int = 0) -> bytes:
+        zdict = self.dictionary(dict_id)
+        compressor = zlib.compressobj(settings.level, zdict=zdict) if zdict else zlib.compressobj(settings.level)
+        return HEADER.pack(MAGIC, dict_id, len(raw)) + compressor.compress(raw) + compressor.flush()
+
+    def decode(self, value):
+        """압축 값이면 풀어서 문자열로, 아니면 그대로"""
+        if not is_compressed(value):
+            return value
+        _, dict_id, _ = HEADER.unpack_from(value)
+        zdict = self.dictionary(dict_id)
+        decompressor = zlib.decompressobj(zdict=zdict) if zdict else zlib.decompressobj()
+        data = decompressor.decompress(value[HEADER.size:]) + decompressor.flush()
+        return data.decode('utf-8')
+
+
+def configure_compression(config) -> CompressionSettings:
+    """설정의 compression 값 적용"""
+    settings.enabled = config.get('compression.enabled', False)
+    settings.min_bytes = config.get('compression.min_bytes', 4096)
+    settings.level = config.get('compression.level', 6)
+    settings.use_dictionary = config.get('compression.use_dictionary', True)
+    settings.dictionary_bytes = min(
+        config.get('compression.dictionary_kb', 32) * 1024,
+        MAX_DICTIONARY_BYTES
+    )
+    return settings
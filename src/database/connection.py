@@ -0,0 +1,101 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Tuple
+from .query_tracer import connect
+
+
+class ConnectionManager:
+    """데이터베이스 파일별 프로세스 공용 연결 관리 클래스
+
+    쓰기는 잠금으로 보호되는 연결 하나를 공유하고, 읽기는 스레드마다 연결을 하나씩
+    둡니다. 세션 수와 관계없이 열린 파일 핸들과 페이지 캐시는 (쓰기 1 + 살아 있는
+    스레드 수) 개로 제한됩니다.
+    """
+
+    _instances: Dict[str, 'ConnectionManager'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, db_path: str, timeout: float = 30.0):
+        self.db_path = db_path
+        self.timeout = timeout
+        self._write_lock = threading.RLock()
+        self._writer = None
+        self._readers_lock = threading.Lock()
+        # thread ident -> (thread, connection)
+        self._readers: Dict[int, Tuple[threading.Thread, sqlite3.Connection]] = {}
+
+    @classmethod
+    def for_path(cls, db_path: str) -> 'ConnectionManager':
+        """데이터베이스 파일별 공유 연결 관리자 반환"""
+        with cls._instances_lock:
+            manager = cls._instances.get(db_path)
+            if manager is None:
+                manager = cls(db_path)
+                cls._instances[db_path] = manager
+            return manager
+
+    def _connect(self) -> sqlite3.Connection:
+        # 연결은 한 스레드에서만 쓰지만 종료는 정리하는 스레드에서 할 수 있도록 허용
+        conn = connect(self.db_path, timeout=self.timeout, check_same_thread=False)
+        # 읽기 연결이 쓰기를 막지 않도록 WAL 사용
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    @contextmanager
+    def write(self):
+        """공유 쓰기 연결 (트랜잭션 단위로 잠금, 성공 시 커밋/실패 시 롤백)"""
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self._connect()
+            try:
+                yield self._writer
+                self._writer.commit()
+            except Exception:
+                self._writer.rollback()
+                raise
+
+    def read(self) -> sqlite3.Connection:
+        """현재 스레드의 읽기 연결"""
+        current = threading.current_thread()
+        entry = self._readers.get(current.ident)
+        if entry is not None and entry[0] is current:
+            return entry[1]
+
+        conn = self._connect()
+        conn.execute('PRAGMA query_only=ON')
+        with self._readers_lock:
+            self._prune_readers()
+            self._readers[current.ident] = (current, conn)
+        return conn
+
+    def _prune_readers(self):
+        """종료된 스레드의 읽기 연결 닫기 (Streamlit 은 재실행마다 스레드를 바꿈)"""
+        for ident, (thread, conn) in list(self._readers.items()):
+            if not thread.is_alive():
+                conn.close()
+                del self._readers[ident]
+
+    def release(self):
+        """현재 스레드의 읽기 연결 닫기"""
+        with self._readers_lock:
+            entry = self._readers.pop(threading.get_ident(), None)
+        if entry is not None:
+            entry[1].close()
+
+    @property
+    def open_connections(self) -> int:
+        with self._readers_lock:
+            self._prune_readers()
+            return len(self._readers) + (self._writer is not None)
+
+    def close_all(self):
+        """모든 연결 닫기 (프로세스 종료 시)"""
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        with self._readers_lock:
+            for _, conn in self._readers.values():
+                conn.close()
+            self._readers.clear()
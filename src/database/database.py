@@ -1,26 +1,86 @@
 # src/database/database.py
 import sqlite3
-import pandas as pd
 from datetime import datetime
-from typing import List, Dict, Optional, Union
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple, Union
 from contextlib import contextmanager
+from .compression import COMPRESSED_COLUMNS, TextCodec, is_compressed, raw_length, raw_length_sql, settings as compression
 from .models import Prompt, ChangeLog
+from .query_tracer import connect, tracer
+from ..utils.instrumentation import instrument_methods
+from ..utils.memory import ReadPlan, memory, track_frames
+from ..utils.search_engine import SearchEngine
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# 본문 순회/검색 대상 텍스트 컬럼
+TEXT_COLUMNS = [
+    'title', 'description', 'query', 'prompt_content',
+    'chatbot_response', 'expected_result'
+]
+
+# 프롬프트 테이블 컬럼 (SELECT * 순서)
+PROMPT_COLUMNS = [
+    'id', 'title', 'description', 'model', 'version', 'category', 'tags',
+    'query', 'prompt_content', 'chatbot_response', 'expected_result', 'is_best',
+    'changes', 'improvements', 'pros', 'cons', 'stats', 'created_by',
+    'department', 'user_role', 'created_at'
+]
+
+# 읽기 예산을 넘으면 먼저 빼는 큰 본문 컬럼
+LARGE_TEXT_COLUMNS = [
+    'description', 'query', 'prompt_content', 'chatbot_response', 'expected_result',
+    'changes', 'improvements', 'pros', 'cons', 'stats'
+]
+
+# 변경 이력 조회 컬럼
+CHANGE_LOG_COLUMNS = [
+    'pcl.id', 'pcl.name', 'pcl.title', 'pcl.prompt_id', 'pcl.version_number',
+    'pcl.change_summary', 'pcl.changed_by', 'pcl.changed_at', 'p.title AS prompt_title'
+]
+
+# 키워드 집계를 허용하는 그룹 컬럼
+KEYWORD_GROUP_COLUMNS = ['category', 'model', 'department']
+
+# 히스토리 표에 표시/정렬할 수 있는 컬럼
+HISTORY_COLUMNS = [
+    'id', 'title', 'model', 'version', 'category', 'tags',
+    'created_by', 'department', 'created_at', 'is_best'
+]
+
+# 읽기 캐시 무효화 단위
+DATA_SCOPES = ['prompts', 'rules', 'users']
+
+# prompt_changes 에 보관하는 최근 변경 건수
+CHANGE_JOURNAL_KEEP = 10000
+
+# 내용이 같은 쓰기(silent_writes 표식이 있는 트랜잭션)에서는 건너뛰는 수정 트리거
+SILENT_WRITE_TRIGGERS = ['trg_prompts_version_update', 'trg_prompts_changes_update']
+SILENT_WRITE_GUARD = 'WHEN NOT EXISTS (SELECT 1 FROM silent_writes)'
 
 class DatabaseError(Exception):
     """데이터베이스 관련 커스텀 예외"""
     pass
 
+class ReadBudgetExceeded(DatabaseError):
+    """읽기 예산(memory.max_read_rows / max_read_mb)을 넘는 조회"""
+    pass
+
+@track_frames('database', exclude=('get_connection', 'decode_texts'))
+@instrument_methods('database', exclude=('get_connection',))
 class PromptDatabase:
     """프롬프트 데이터베이스 관리 클래스"""
     
     def __init__(self, db_path: str = 'prompts.db'):
         self.db_path = db_path
+        self.codec = TextCodec(self._load_compression_dictionary)
+        self._dictionary_id = None
         self.create_tables()
 
     @contextmanager
     def get_connection(self):
         """데이터베이스 연결 컨텍스트 매니저"""
-        conn = sqlite3.connect(self.db_path)
+        conn = connect(self.db_path)
         conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 결과 반환
         try:
             yield conn
@@ -30,10 +90,43 @@ class PromptDatabase:
             raise DatabaseError(f"Database error: {str(e)}")
         finally:
             conn.close()
+            if tracer.has_pending(self.db_path):
+                self._save_slow_queries()
+
+    def _save_slow_queries(self):
+        """추적기에 쌓인 느린 쿼리를 저장 (추적하지 않는 별도 연결, 보관 건수 초과분 삭제)"""
+        entries = tracer.drain(self.db_path)
+        if not entries:
+            return
+        
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                conn.executemany(
+                    '''
+                    INSERT INTO slow_queries
+                    (shape, sql_text, param_count, duration_ms, rows, plan, full_scan, recorded_at)
+                    VALUES (:shape, :sql_text, :param_count, :duration_ms, :rows, :plan,
+                            :full_scan, :recorded_at)
+                    ''',
+                    entries
+                )
+                conn.execute(
+                    'DELETE FROM slow_queries WHERE id <= '
+                    '(SELECT MAX(id) FROM slow_queries) - ?',
+                    (tracer.retention,)
+                )
+        except sqlite3.Error:
+            # 기록 저장 실패로 요청을 실패시키지 않음
+            pass
+        finally:
+            conn.close()
 
     def create_tables(self):
         """데이터베이스 테이블 생성"""
         with self.get_connection() as conn:
+            # 읽기(백업 포함)가 쓰기를 막지 않도록 WAL 사용 (파일에 유지되는 설정)
+            conn.execute('PRAGMA journal_mode=WAL')
             # 프롬프트 테이블
             conn.execute('''
             CREATE TABLE IF NOT EXISTS prompts (
@@ -76,15 +169,245 @@ class PromptDatabase:
             )
             ''')
 
-    def save_prompt(self, data: Dict) -> int:
-        """프롬프트 저장"""
+            # MinHash 시그니처 테이블
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS prompt_minhash (
+                prompt_id INTEGER PRIMARY KEY,
+                signature BLOB NOT NULL,
+                FOREIGN KEY (prompt_id) REFERENCES prompts (id)
+            )
+            ''')
+
+            # LSH 밴드 버킷 테이블
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS prompt_lsh_buckets (
+                band INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                prompt_id INTEGER NOT NULL,
+                PRIMARY KEY (band, bucket, prompt_id)
+            ) WITHOUT ROWID
+            ''')
+            conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_lsh_buckets_prompt
+            ON prompt_lsh_buckets (prompt_id)
+            ''')
+
+            # 유사도 검색용 해시 TF 벡터 테이블
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS prompt_vectors (
+                prompt_id INTEGER PRIMARY KEY,
+                vector BLOB NOT NULL,
+                updated_at REAL NOT NULL,
+                FOREIGN KEY (prompt_id) REFERENCES prompts (id)
+            )
+            ''')
+            conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_prompt_vectors_updated
+            ON prompt_vectors (updated_at)
+            ''')
+
+            # 키워드 색인 테이블 (프롬프트별 단어 빈도, 말뭉치 문서 빈도)
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS prompt_terms (
+                prompt_id INTEGER NOT NULL,
+                term TEXT NOT NULL,
+                tf INTEGER NOT NULL,
+                PRIMARY KEY (prompt_id, term)
+            ) WITHOUT ROWID
+            ''')
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS term_stats (
+                term TEXT PRIMARY KEY,
+                df INTEGER NOT NULL
+            ) WITHOUT ROWID
+            ''')
+
+            # 모델 응답 캐시 테이블
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS response_cache (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                params TEXT,
+                response TEXT NOT NULL,
+                input_tokens INTEGER,
+                output_tokens INTEGER,
+                size_bytes INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL
+            )
+            ''')
+            conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_response_cache_accessed
+            ON response_cache (last_accessed)
+            ''')
+
+            # 회귀 평가 결과 테이블
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS prompt_evaluations (
+                prompt_id INTEGER NOT NULL,
+                evaluator_version TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                score REAL,
+                metrics TEXT,
+                evaluated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (prompt_id, evaluator_version)
+            )
+            ''')
+
+            # 구조 규칙 검사 결과 테이블
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS prompt_rule_results (
+                prompt_id INTEGER NOT NULL,
+                rule_name TEXT NOT NULL,
+                passed INTEGER NOT NULL,
+                ruleset_version TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                validated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (prompt_id, rule_name)
+            )
+            ''')
+            conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_prompt_rule_results_rule
+            ON prompt_rule_results (rule_name, passed)
+            ''')
+
+            # 사용자 테이블 (이름 중복은 고유 인덱스로 차단)
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS users (
+                user_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                username TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            ''')
+            conn.execute(
+                'CREATE UNIQUE INDEX IF NOT EXISTS idx_users_username ON users (username)'
+            )
+
+            # 기준 시간을 넘은 쿼리와 실행 계획
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS slow_queries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                shape TEXT NOT NULL,
+                sql_text TEXT NOT NULL,
+                param_count INTEGER,
+                duration_ms REAL NOT NULL,
+                rows INTEGER,
+                plan TEXT,
+                full_scan INTEGER NOT NULL DEFAULT 0,
+                recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            ''')
+            conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_slow_queries_shape ON slow_queries (shape)'
+            )
+
+            # 본문 압축용 zlib 사전 (압축 값 머리말의 사전 ID 로 참조)
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS compression_dictionaries (
+                dict_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                data BLOB NOT NULL,
+                sample_count INTEGER NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            ''')
+
+            # 화면 읽기 캐시 무효화용 데이터 버전 (쓰기 시 증가)
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS data_versions (
+                scope TEXT PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+            ''')
+            conn.executemany(
+                'INSERT OR IGNORE INTO data_versions (scope, version) VALUES (?, 0)',
+                [(scope,) for scope in DATA_SCOPES]
+            )
+            # 재압축처럼 내용이 같은 쓰기에서 아래 수정 트리거를 건너뛰기 위한 표식
+            # (쓰기 트랜잭션 안에서 넣고 지우므로 다른 연결에는 보이지 않음)
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS silent_writes (
+                reason TEXT PRIMARY KEY
+            )
+            ''')
+            self._drop_unguarded_triggers(conn)
+
+            # 레거시 화면/명령줄 도구 등 모든 경로의 프롬프트 쓰기를 반영
+            for event in ('INSERT', 'UPDATE', 'DELETE'):
+                conn.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS trg_prompts_version_{event.lower()}
+                AFTER {event} ON prompts
+                {SILENT_WRITE_GUARD if event == 'UPDATE' else ''}
+                BEGIN
+                    UPDATE data_versions SET version = version + 1 WHERE scope = 'prompts';
+                END
+                ''')
+
+            # 다른 프로세스의 프롬프트 수정/삭제를 메모리 색인에 반영하기 위한 변경 기록
+            # (추가는 id 로 알 수 있으므로 기록하지 않음, 최근 CHANGE_JOURNAL_KEEP 건만 보관)
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS prompt_changes (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                prompt_id INTEGER NOT NULL
+            )
+            ''')
+            for event, row in (('UPDATE', 'NEW'), ('DELETE', 'OLD')):
+                conn.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS trg_prompts_changes_{event.lower()}
+                AFTER {event} ON prompts
+                {SILENT_WRITE_GUARD if event == 'UPDATE' else ''}
+                BEGIN
+                    INSERT INTO prompt_changes (prompt_id) VALUES ({row}.id);
+                    DELETE FROM prompt_changes
+                    WHERE seq <= (SELECT MAX(seq) FROM prompt_changes) - {CHANGE_JOURNAL_KEEP};
+                END
+                ''')
+
+            # 히스토리 정렬/페이지 조회용 인덱스
+            conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_prompts_created_at ON prompts (created_at)'
+            )
+
+            # 그룹별 집계용 인덱스
+            for column in KEYWORD_GROUP_COLUMNS:
+                conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS idx_prompts_{column} ON prompts ({column})'
+                )
+
+    def _drop_unguarded_triggers(self, conn):
+        """silent_writes 조건이 없던 예전 수정 트리거 삭제 (create_tables 에서 다시 생성)"""
+        rows = conn.execute(
+            f"SELECT name, sql FROM sqlite_master WHERE type = 'trigger' "
+            f"AND name IN ({', '.join('?' for _ in SILENT_WRITE_TRIGGERS)})",
+            SILENT_WRITE_TRIGGERS
+        ).fetchall()
+        for name, sql in rows:
+            if 'silent_writes' not in sql:
+                conn.execute(f'DROP TRIGGER {name}')
+
+    def get_data_versions(self) -> Dict[str, int]:
+        """읽기 캐시 키로 쓰는 범위별 데이터 버전 조회"""
+        with self.get_connection() as conn:
+            return {
+                row['scope']: row['version']
+                for row in conn.execute('SELECT scope, version FROM data_versions')
+            }
+
+    def _bump_data_version(self, conn: sqlite3.Connection, scope: str):
+        """쓰기 트랜잭션 안에서 데이터 버전 증가"""
+        conn.execute(
+            'UPDATE data_versions SET version = version + 1 WHERE scope = ?',
+            (scope,)
+        )
+
+    def save_prompt(self, data: Dict, minhash: Optional[Tuple[bytes, List[Tuple[int, int]]]] = None) -> int:
+        """프롬프트 저장 (큰 본문은 압축 설정에 따라 압축, minhash 가 있으면 같은 트랜잭션에서 색인)"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
             # 컬럼과 값 준비
             columns = ', '.join(data.keys())
             placeholders = ', '.join(['?' for _ in data])
-            values = list(data.values())
+            values = list(self._encode_texts(data).values())
             
             # 프롬프트 저장
             cursor.execute(
@@ -93,6 +416,8 @@ class PromptDatabase:
             )
             
             prompt_id = cursor.lastrowid
+            if minhash is not None:
+                self._write_minhash(conn, prompt_id, *minhash)
             
             # 변경 이력 저장
             log_data = {
@@ -127,59 +452,193 @@ class PromptDatabase:
                 (prompt_id,)
             )
             result = cursor.fetchone()
-            return dict(result) if result else None
+            return self._decode_row(dict(result)) if result else None
 
-    def get_history(self, filters: Optional[Dict] = None) -> pd.DataFrame:
-        """프롬프트 히스토리 조회"""
-        query = 'SELECT * FROM prompts'
-        params = []
+    def get_history(
+        self,
+        filters: Optional[Dict] = None,
+        columns: Optional[List[str]] = None
+    ) -> 'pd.DataFrame':
+        """프롬프트 히스토리 조회 (읽기 예산을 넘으면 본문 컬럼 제외/앞부분만/거부)"""
+        import pandas as pd
+
+        selected = [column for column in (columns or PROMPT_COLUMNS) if column in PROMPT_COLUMNS]
+        where, params = self._history_where(filters)
+        plan = self._plan_read('prompts', where, params, selected, LARGE_TEXT_COLUMNS)
+        query = f"SELECT {', '.join(plan.columns)} FROM prompts{where} ORDER BY created_at DESC"
+        if plan.limit is not None:
+            query += f' LIMIT {plan.limit}'
+        
+        with self.get_connection() as conn:
+            history = self.decode_texts(pd.read_sql_query(query, conn, params=params))
+        if plan.action:
+            history.attrs['budget'] = plan.describe()
+        return history
+
+    def get_history_page(
+        self,
+        filters: Optional[Dict] = None,
+        sort_by: str = 'created_at',
+        ascending: bool = False,
+        page: int = 1,
+        page_size: int = 50,
+        columns: Optional[List[str]] = None
+    ) -> 'pd.DataFrame':
+        """정렬/페이지를 SQL 에서 적용한 히스토리 한 페이지 조회"""
+        import pandas as pd
+
+        if sort_by not in HISTORY_COLUMNS:
+            raise DatabaseError(f"정렬할 수 없는 컬럼입니다: {sort_by}")
+        selected = [column for column in (columns or HISTORY_COLUMNS) if column in HISTORY_COLUMNS]
+        select_list = ['id'] + [column for column in selected if column != 'id']
         
-        if filters:
-            conditions = []
-            if 'model' in filters:
-                conditions.append('model IN (' + ','.join(['?']*len(filters['model'])) + ')')
-                params.extend(filters['model'])
-            if 'category' in filters:
-                conditions.append('category IN (' + ','.join(['?']*len(filters['category'])) + ')')
-                params.extend(filters['category'])
-            if 'date_range' in filters:
-                conditions.append('DATE(created_at) BETWEEN ? AND ?')
-                params.extend(filters['date_range'])
-            
-            if conditions:
-                query += ' WHERE ' + ' AND '.join(conditions)
-        
-        query += ' ORDER BY created_at DESC'
-        
-        with self.get_connection() as conn:
-            return pd.read_sql_query(query, conn, params=params)
-
-    def get_change_logs(self, prompt_id: Optional[int] = None) -> pd.DataFrame:
-        """변경 이력 조회"""
-        query = '''
-        SELECT 
-            pcl.*,
-            p.title as prompt_title
-        FROM prompt_change_logs pcl
-        JOIN prompts p ON pcl.prompt_id = p.id
+        where, params = self._history_where(filters)
+        direction = 'ASC' if ascending else 'DESC'
+        query = f'''
+        SELECT {', '.join(select_list)}
+        FROM prompts{where}
+        ORDER BY {sort_by} {direction}, id {direction}
+        LIMIT ? OFFSET ?
         '''
         
-        params = []
+        with self.get_connection() as conn:
+            return pd.read_sql_query(
+                query,
+                conn,
+                params=params + [page_size, (max(page, 1) - 1) * page_size]
+            )
+
+    def count_history(self, filters: Optional[Dict] = None) -> int:
+        """필터 조건의 프롬프트 수"""
+        where, params = self._history_where(filters)
+        with self.get_connection() as conn:
+            return conn.execute(f'SELECT COUNT(*) FROM prompts{where}', params).fetchone()[0]
+
+    def get_history_stats(self, filters: Optional[Dict] = None) -> Dict:
+        """필터 조건의 집계 통계 (건수, 베스트 수, 모델/카테고리 분포)"""
+        where, params = self._history_where(filters)
+        
+        with self.get_connection() as conn:
+            row = conn.execute(
+                f'SELECT COUNT(*) AS total, COALESCE(SUM(is_best), 0) AS best FROM prompts{where}',
+                params
+            ).fetchone()
+            stats = {'total': row['total'], 'best': row['best']}
+            
+            for column in ('model', 'category'):
+                stats[column] = {
+                    value: count for value, count in conn.execute(
+                        f'''
+                        SELECT {column}, COUNT(*) FROM prompts{where}
+                        GROUP BY {column}
+                        ORDER BY COUNT(*) DESC
+                        ''',
+                        params
+                    ).fetchall()
+                }
+            return stats
+
+    def _plan_read(
+        self,
+        source: str,
+        where: str,
+        params: List,
+        columns: List[str],
+        large_columns: List[str]
+    ) -> ReadPlan:
+        """읽기 전에 행 수와 본문 글자 수를 세어 예산에 맞는 읽기 계획 결정"""
+        budget = memory.budget
+        if not budget.limited:
+            return ReadPlan(columns=columns)
+        
+        text_columns = [column for column in columns if column in large_columns]
+        # 압축된 컬럼은 저장 크기가 아니라 원문 크기로 계산
+        sums = ''.join(
+            f", COALESCE(SUM({raw_length_sql(column) if column in COMPRESSED_COLUMNS else f'length({column})'}), 0)"
+            for column in text_columns
+        )
+        with self.get_connection() as conn:
+            conn.create_function('raw_length', 1, raw_length, deterministic=True)
+            row = conn.execute(f'SELECT COUNT(*){sums} FROM {source}{where}', params).fetchone()
+        
+        plan = budget.plan(columns, large_columns, row[0], dict(zip(text_columns, row[1:])))
+        if plan.refused:
+            raise ReadBudgetExceeded(
+                f"조회 결과가 읽기 예산을 넘습니다: {plan.total_rows}행, "
+                f"약 {plan.estimated_bytes / 2 ** 20:.1f}MB. 필터로 범위를 좁혀 주세요."
+            )
+        return plan
+
+    def _history_where(self, filters: Optional[Dict]) -> Tuple[str, List]:
+        """히스토리 필터를 WHERE 절과 매개변수로 변환"""
+        if not filters:
+            return '', []
+        
+        conditions, params = [], []
+        for column in ('model', 'category', 'version'):
+            values = filters.get(column)
+            if values:
+                values = [values] if isinstance(values, str) else list(values)
+                conditions.append(f"{column} IN ({', '.join('?' for _ in values)})")
+                params.extend(values)
+        
+        if filters.get('tags'):
+            conditions.append('(' + ' OR '.join('tags LIKE ?' for _ in filters['tags']) + ')')
+            params.extend(f"%{tag}%" for tag in filters['tags'])
+        
+        if filters.get('date_range') and len(filters['date_range']) == 2:
+            conditions.append('DATE(created_at) BETWEEN ? AND ?')
+            params.extend(str(date) for date in filters['date_range'])
+        
+        if filters.get('created_by'):
+            conditions.append('created_by LIKE ?')
+            params.append(f"%{filters['created_by']}%")
+        
+        if filters.get('failed_rules'):
+            conditions.append(
+                f'''id IN (
+                    SELECT prompt_id FROM prompt_rule_results
+                    WHERE passed = 0 AND rule_name IN ({', '.join('?' for _ in filters['failed_rules'])})
+                )'''
+            )
+            params.extend(filters['failed_rules'])
+        
+        if not conditions:
+            return '', []
+        return ' WHERE ' + ' AND '.join(conditions), params
+
+    def get_change_logs(self, prompt_id: Optional[int] = None) -> 'pd.DataFrame':
+        """변경 이력 조회 (읽기 예산을 넘으면 최근 이력만/거부)"""
+        import pandas as pd
+
+        source = 'prompt_change_logs pcl JOIN prompts p ON pcl.prompt_id = p.id'
+        where, params = '', []
         if prompt_id:
-            query += ' WHERE pcl.prompt_id = ?'
+            where = ' WHERE pcl.prompt_id = ?'
             params.append(prompt_id)
-            
-        query += ' ORDER BY pcl.changed_at DESC'
+        
+        plan = self._plan_read(source, where, params, CHANGE_LOG_COLUMNS, [])
+        query = f"SELECT {', '.join(plan.columns)} FROM {source}{where} ORDER BY pcl.changed_at DESC"
+        if plan.limit is not None:
+            query += f' LIMIT {plan.limit}'
         
         with self.get_connection() as conn:
-            return pd.read_sql_query(query, conn, params=params)
+            logs = pd.read_sql_query(query, conn, params=params)
+        if plan.action:
+            logs.attrs['budget'] = plan.describe()
+        return logs
 
-    def update_prompt(self, prompt_id: int, data: Dict) -> bool:
-        """프롬프트 업데이트"""
+    def update_prompt(
+        self,
+        prompt_id: int,
+        data: Dict,
+        minhash: Optional[Tuple[bytes, List[Tuple[int, int]]]] = None
+    ) -> bool:
+        """프롬프트 업데이트 (minhash 가 있으면 같은 트랜잭션에서 색인)"""
         with self.get_connection() as conn:
             # 업데이트할 필드 준비
             update_fields = [f"{key} = ?" for key in data.keys()]
-            values = list(data.values())
+            values = list(self._encode_texts(data).values())
             values.append(prompt_id)
             
             cursor = conn.execute(
@@ -194,6 +653,8 @@ class PromptDatabase:
             success = cursor.rowcount > 0
             
             if success:
+                if minhash is not None:
+                    self._write_minhash(conn, prompt_id, *minhash)
                 # 변경 이력 기록
                 log_data = {
                     'name': f"Prompt_{data['version']}",
@@ -207,26 +668,66 @@ class PromptDatabase:
             
             return success
 
-    def search(self, term: str) -> pd.DataFrame:
-        """프롬프트 검색"""
-        with self.get_connection() as conn:
-            search_term = f"%{term}%"
-            query = '''
-            SELECT * FROM prompts 
-            WHERE title LIKE ? 
-            OR description LIKE ? 
-            OR prompt_content LIKE ? 
-            OR query LIKE ? 
-            OR chatbot_response LIKE ?
-            ORDER BY created_at DESC
-            '''
-            
-            return pd.read_sql_query(
-                query, 
-                conn, 
-                params=(search_term, search_term, search_term, 
-                       search_term, search_term)
+    def search(self, term: str, page: int = 1, page_size: int = 20) -> 'pd.DataFrame':
+        """프롬프트 검색 (BM25 순위)"""
+        results, _ = self.search_ranked(term, page, page_size)
+        return results
+
+    def search_ranked(
+        self,
+        term: str,
+        page: int = 1,
+        page_size: int = 20
+    ) -> Tuple['pd.DataFrame', int]:
+        """BM25 순위 검색 결과 페이지와 전체 건수 조회 (검색어가 비면 최근 프롬프트, 점수는 NaN)"""
+        if not term or not term.strip():
+            recent = self.get_recent_prompts(page, page_size)
+            recent.insert(0, 'score', float('nan'))
+            return recent, self.count_prompts()
+        
+        total, matches = SearchEngine.for_database(self).search(term, page, page_size)
+        results = self.get_prompts_by_ids([prompt_id for prompt_id, _ in matches])
+        
+        if not results.empty:
+            # 색인 후 다른 경로로 삭제된 행은 결과에 없으므로 순서가 아니라 ID 로 점수를 붙임
+            results.insert(0, 'score', results['id'].map(dict(matches)))
+        
+        return results, total
+
+    def get_recent_prompts(self, page: int = 1, page_size: int = 20) -> 'pd.DataFrame':
+        """최근 프롬프트 페이지 조회"""
+        import pandas as pd
+
+        with self.get_connection() as conn:
+            return self.decode_texts(pd.read_sql_query(
+                'SELECT * FROM prompts ORDER BY created_at DESC LIMIT ? OFFSET ?',
+                conn,
+                params=(page_size, (max(page, 1) - 1) * page_size)
+            ))
+
+    def get_prompts_by_ids(self, prompt_ids: List[int]) -> 'pd.DataFrame':
+        """ID 목록 순서대로 프롬프트 조회"""
+        import pandas as pd
+
+        if not prompt_ids:
+            return pd.DataFrame()
+        
+        placeholders = ','.join(['?'] * len(prompt_ids))
+        with self.get_connection() as conn:
+            results = pd.read_sql_query(
+                f'SELECT * FROM prompts WHERE id IN ({placeholders})',
+                conn,
+                params=list(prompt_ids)
             )
+        
+        order = {prompt_id: i for i, prompt_id in enumerate(prompt_ids)}
+        return (
+            self.decode_texts(results)
+            .assign(_order=results['id'].map(order))
+            .sort_values('_order')
+            .drop(columns='_order')
+            .reset_index(drop=True)
+        )
 
     def get_prompts(self) -> List[Dict]:
         """모든 프롬프트 기본 정보 조회"""
@@ -238,4 +739,782 @@ class PromptDatabase:
                 ORDER BY created_at DESC
                 '''
             )
-            return [dict(row) for row in cursor.fetchall()]
\ No newline at end of file
+            return [dict(row) for row in cursor.fetchall()]
+
+    def save_minhash(
+        self,
+        prompt_id: int,
+        signature: bytes,
+        buckets: List[Tuple[int, int]]
+    ):
+        """MinHash 시그니처 및 LSH 버킷 저장"""
+        with self.get_connection() as conn:
+            self._write_minhash(conn, prompt_id, signature, buckets)
+
+    def _write_minhash(
+        self,
+        conn: sqlite3.Connection,
+        prompt_id: int,
+        signature: bytes,
+        buckets: List[Tuple[int, int]]
+    ):
+        """열린 트랜잭션 안에서 시그니처와 버킷 교체"""
+        conn.execute(
+            'INSERT OR REPLACE INTO prompt_minhash (prompt_id, signature) VALUES (?, ?)',
+            (prompt_id, signature)
+        )
+        conn.execute(
+            'DELETE FROM prompt_lsh_buckets WHERE prompt_id = ?',
+            (prompt_id,)
+        )
+        conn.executemany(
+            'INSERT OR IGNORE INTO prompt_lsh_buckets (band, bucket, prompt_id) VALUES (?, ?, ?)',
+            [(band, bucket, prompt_id) for band, bucket in buckets]
+        )
+
+    def get_lsh_candidates(self, buckets: List[Tuple[int, int]]) -> List[int]:
+        """같은 LSH 버킷을 공유하는 프롬프트 ID 조회"""
+        if not buckets:
+            return []
+
+        conditions = ' OR '.join(['(band = ? AND bucket = ?)'] * len(buckets))
+        params = [value for pair in buckets for value in pair]
+        
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                f'SELECT DISTINCT prompt_id FROM prompt_lsh_buckets WHERE {conditions}',
+                params
+            )
+            return [row['prompt_id'] for row in cursor.fetchall()]
+
+    def get_minhash_signatures(
+        self,
+        prompt_ids: Optional[List[int]] = None
+    ) -> Dict[int, bytes]:
+        """MinHash 시그니처 조회"""
+        query = 'SELECT prompt_id, signature FROM prompt_minhash'
+        params = []
+        
+        if prompt_ids is not None:
+            if not prompt_ids:
+                return {}
+            query += ' WHERE prompt_id IN (' + ','.join(['?'] * len(prompt_ids)) + ')'
+            params.extend(prompt_ids)
+        
+        with self.get_connection() as conn:
+            cursor = conn.execute(query, params)
+            return {row['prompt_id']: row['signature'] for row in cursor.fetchall()}
+
+    def get_lsh_collisions(self) -> List[List[int]]:
+        """두 개 이상의 프롬프트가 모인 LSH 버킷 목록"""
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                '''
+                SELECT GROUP_CONCAT(prompt_id) AS prompt_ids
+                FROM prompt_lsh_buckets
+                GROUP BY band, bucket
+                HAVING COUNT(*) > 1
+                '''
+            )
+            return [
+                [int(pid) for pid in row['prompt_ids'].split(',')]
+                for row in cursor.fetchall()
+            ]
+
+    def iter_prompt_texts(
+        self,
+        batch_size: int = 1000,
+        after_id: int = 0,
+        fields: Optional[List[str]] = None
+    ):
+        """전체 프롬프트 본문을 배치 단위로 순회"""
+        fields = fields or ['title', 'description', 'query', 'prompt_content']
+        invalid = [field for field in fields if field not in TEXT_COLUMNS]
+        if invalid:
+            raise DatabaseError(f"Unsupported text columns: {invalid}")
+        
+        last_id = after_id
+        while True:
+            with self.get_connection() as conn:
+                rows = conn.execute(
+                    f'''
+                    SELECT id, {', '.join(fields)}
+                    FROM prompts
+                    WHERE id > ?
+                    ORDER BY id
+                    LIMIT ?
+                    ''',
+                    (last_id, batch_size)
+                ).fetchall()
+            
+            if not rows:
+                break
+            
+            for row in rows:
+                yield self._decode_row(dict(row))
+            last_id = rows[-1]['id']
+
+    def get_prompt_texts(self, prompt_ids: List[int], fields: List[str]) -> Dict[int, Dict]:
+        """프롬프트 ID 목록의 본문 조회 (없는 ID 는 빠짐)"""
+        invalid = [field for field in fields if field not in TEXT_COLUMNS]
+        if invalid:
+            raise DatabaseError(f"Unsupported text columns: {invalid}")
+        if not prompt_ids:
+            return {}
+        
+        placeholders = ','.join(['?'] * len(prompt_ids))
+        with self.get_connection() as conn:
+            rows = conn.execute(
+                f'SELECT id, {", ".join(fields)} FROM prompts WHERE id IN ({placeholders})',
+                list(prompt_ids)
+            ).fetchall()
+        return {row['id']: self._decode_row(dict(row)) for row in rows}
+
+    def get_prompt_changes(self, after_seq: int) -> Tuple[Optional[int], int, List[int]]:
+        """after_seq 이후 수정/삭제된 프롬프트 ID
+
+        (보관 중인 가장 오래된 seq, 마지막 seq, 변경된 ID 목록) 을 반환합니다. 가장 오래된 seq 가
+        after_seq + 1 보다 크면 그 사이 기록이 정리되어 변경을 빠뜨렸을 수 있습니다.
+        """
+        with self.get_connection() as conn:
+            oldest, latest = conn.execute(
+                'SELECT MIN(seq), MAX(seq) FROM prompt_changes'
+            ).fetchone()
+            ids = [
+                row['prompt_id']
+                for row in conn.execute(
+                    'SELECT DISTINCT prompt_id FROM prompt_changes WHERE seq > ?',
+                    (after_seq,)
+                )
+            ]
+        return oldest, latest or 0, ids
+
+    def get_prompt_summaries(self, prompt_ids: List[int]) -> Dict[int, Dict]:
+        """프롬프트 ID 목록의 기본 정보 조회"""
+        if not prompt_ids:
+            return {}
+        
+        placeholders = ','.join(['?'] * len(prompt_ids))
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                f'''
+                SELECT id, title, version, model, category, created_by, created_at
+                FROM prompts
+                WHERE id IN ({placeholders})
+                ''',
+                list(prompt_ids)
+            )
+            return {row['id']: dict(row) for row in cursor.fetchall()}
+
+    def save_vectors(self, vectors: List[Tuple[int, bytes]]):
+        """유사도 검색용 벡터 저장"""
+        updated_at = datetime.now().timestamp()
+        with self.get_connection() as conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO prompt_vectors (prompt_id, vector, updated_at) VALUES (?, ?, ?)',
+                [(prompt_id, vector, updated_at) for prompt_id, vector in vectors]
+            )
+
+    def get_vectors(self, updated_since: float = 0.0) -> List[Tuple[int, bytes, float]]:
+        """지정 시각 이후 갱신된 벡터 조회 (삭제된 프롬프트의 벡터는 제외)"""
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                '''
+                SELECT v.prompt_id, v.vector, v.updated_at
+                FROM prompt_vectors v
+                JOIN prompts p ON p.id = v.prompt_id
+                WHERE v.updated_at > ?
+                ORDER BY v.updated_at
+                ''',
+                (updated_since,)
+            )
+            return [
+                (row['prompt_id'], row['vector'], row['updated_at'])
+                for row in cursor.fetchall()
+            ]
+
+    def get_max_prompt_id(self) -> int:
+        """가장 최근 프롬프트 ID 조회"""
+        with self.get_connection() as conn:
+            row = conn.execute('SELECT MAX(id) AS max_id FROM prompts').fetchone()
+            return row['max_id'] or 0
+
+    def get_prompts_without_vectors(self, after_id: int = 0) -> List[Dict]:
+        """벡터가 저장되지 않은 프롬프트 본문 조회"""
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                '''
+                SELECT p.id, p.title, p.description, p.query, p.prompt_content
+                FROM prompts p
+                LEFT JOIN prompt_vectors v ON v.prompt_id = p.id
+                WHERE p.id > ? AND v.prompt_id IS NULL
+                ORDER BY p.id
+                ''',
+                (after_id,)
+            )
+            return [self._decode_row(dict(row)) for row in cursor.fetchall()]
+
+    def replace_prompt_terms(self, prompt_id: int, term_counts: Dict[str, int]):
+        """프롬프트 단어 빈도 교체 및 문서 빈도 증분 갱신"""
+        with self.get_connection() as conn:
+            self._write_prompt_terms(conn, prompt_id, term_counts)
+            self._bump_data_version(conn, 'prompts')
+
+    def write_prompt_index(
+        self,
+        conn: sqlite3.Connection,
+        prompt_id: int,
+        term_counts: Optional[Dict[str, int]] = None,
+        minhash: Optional[Tuple[bytes, List[Tuple[int, int]]]] = None
+    ):
+        """열린 쓰기 트랜잭션 안에서 키워드 빈도와 MinHash 색인 저장
+        
+        레거시 화면처럼 다른 연결 관리자로 프롬프트를 저장하는 경로가 같은 트랜잭션에서
+        색인하도록 연결을 받습니다.
+        """
+        if term_counts is not None:
+            self._write_prompt_terms(conn, prompt_id, term_counts)
+        if minhash is not None:
+            self._write_minhash(conn, prompt_id, *minhash)
+
+    def _write_prompt_terms(self, conn: sqlite3.Connection, prompt_id: int, term_counts: Dict[str, int]):
+        """열린 트랜잭션 안에서 단어 빈도 교체 (row_factory 가 없는 연결에서도 동작)"""
+        old_terms = [
+            row[0] for row in conn.execute(
+                'SELECT term FROM prompt_terms WHERE prompt_id = ?',
+                (prompt_id,)
+            ).fetchall()
+        ]
+        
+        conn.executemany(
+            'UPDATE term_stats SET df = df - 1 WHERE term = ?',
+            [(term,) for term in old_terms]
+        )
+        conn.execute('DELETE FROM prompt_terms WHERE prompt_id = ?', (prompt_id,))
+        
+        conn.executemany(
+            'INSERT INTO prompt_terms (prompt_id, term, tf) VALUES (?, ?, ?)',
+            [(prompt_id, term, tf) for term, tf in term_counts.items()]
+        )
+        conn.executemany(
+            '''
+            INSERT INTO term_stats (term, df) VALUES (?, 1)
+            ON CONFLICT(term) DO UPDATE SET df = df + 1
+            ''',
+            [(term,) for term in term_counts]
+        )
+        if old_terms:
+            conn.execute('DELETE FROM term_stats WHERE df <= 0')
+
+    def get_prompt_terms(self, prompt_id: int) -> List[Dict]:
+        """프롬프트 단어 빈도와 문서 빈도 조회"""
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                '''
+                SELECT t.term, t.tf, s.df
+                FROM prompt_terms t
+                JOIN term_stats s ON s.term = t.term
+                WHERE t.prompt_id = ?
+                ''',
+                (prompt_id,)
+            )
+            return [dict(row) for row in cursor.fetchall()]
+
+    def get_group_terms(self, column: str) -> 'pd.DataFrame':
+        """카테고리/모델/부서 그룹별 단어 빈도 합계 (단어가 없는 그룹은 term 이 None 인 행 하나)
+
+        문서 빈도는 단어별로 묶은 뒤 한 번씩만 조회합니다 (행마다 조인하면 두 배 가까이 느림).
+        """
+        import pandas as pd
+
+        if column not in KEYWORD_GROUP_COLUMNS:
+            raise DatabaseError(f"Unsupported group column: {column}")
+        
+        with self.get_connection() as conn:
+            return pd.read_sql_query(
+                f'''
+                SELECT
+                    p.{column} AS value,
+                    t.term,
+                    SUM(t.tf) AS tf,
+                    (SELECT s.df FROM term_stats s WHERE s.term = t.term) AS df
+                FROM prompts p
+                LEFT JOIN prompt_terms t ON t.prompt_id = p.id
+                WHERE p.{column} IS NOT NULL
+                GROUP BY t.term, p.{column}
+                ''',
+                conn
+            )
+
+    def get_group_values(self, column: str) -> List[str]:
+        """그룹 컬럼의 고유값 조회"""
+        if column not in KEYWORD_GROUP_COLUMNS:
+            raise DatabaseError(f"Unsupported group column: {column}")
+        
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                f'''
+                SELECT DISTINCT {column} AS value
+                FROM prompts
+                WHERE {column} IS NOT NULL
+                ORDER BY {column}
+                '''
+            )
+            return [row['value'] for row in cursor.fetchall()]
+
+    def count_prompts(self) -> int:
+        """전체 프롬프트 수 조회"""
+        with self.get_connection() as conn:
+            return conn.execute('SELECT COUNT(*) AS cnt FROM prompts').fetchone()['cnt']
+
+    def get_cached_response(self, cache_key: str, created_after: float) -> Optional[Dict]:
+        """만료되지 않은 캐시 응답 조회 (조회 시각 갱신)"""
+        with self.get_connection() as conn:
+            row = conn.execute(
+                '''
+                SELECT * FROM response_cache
+                WHERE cache_key = ? AND created_at > ?
+                ''',
+                (cache_key, created_after)
+            ).fetchone()
+            
+            if row is None:
+                return None
+            
+            conn.execute(
+                'UPDATE response_cache SET last_accessed = ? WHERE cache_key = ?',
+                (datetime.now().timestamp(), cache_key)
+            )
+            return dict(row)
+
+    def save_cached_response(self, data: Dict):
+        """캐시 응답 저장"""
+        now = datetime.now().timestamp()
+        data = {
+            **data,
+            'size_bytes': len(data['response'].encode('utf-8')),
+            'created_at': now,
+            'last_accessed': now
+        }
+        columns = ', '.join(data.keys())
+        placeholders = ', '.join(['?' for _ in data])
+        
+        with self.get_connection() as conn:
+            conn.execute(
+                f'INSERT OR REPLACE INTO response_cache ({columns}) VALUES ({placeholders})',
+                list(data.values())
+            )
+
+    def evict_response_cache(self, expire_before: float, max_bytes: int) -> int:
+        """만료된 캐시 및 용량 초과분(오래 조회되지 않은 순) 삭제"""
+        with self.get_connection() as conn:
+            removed = conn.execute(
+                'DELETE FROM response_cache WHERE created_at <= ?',
+                (expire_before,)
+            ).rowcount
+            
+            total = conn.execute(
+                'SELECT COALESCE(SUM(size_bytes), 0) AS total FROM response_cache'
+            ).fetchone()['total']
+            
+            if total > max_bytes:
+                excess = total - max_bytes
+                victims = []
+                cursor = conn.execute(
+                    'SELECT cache_key, size_bytes FROM response_cache ORDER BY last_accessed'
+                )
+                for row in cursor:
+                    victims.append((row['cache_key'],))
+                    excess -= row['size_bytes']
+                    if excess <= 0:
+                        break
+                
+                conn.executemany('DELETE FROM response_cache WHERE cache_key = ?', victims)
+                removed += len(victims)
+            
+            return removed
+
+    def get_response_cache_stats(self) -> Dict:
+        """응답 캐시 항목 수 및 용량 조회"""
+        with self.get_connection() as conn:
+            row = conn.execute(
+                '''
+                SELECT COUNT(*) AS entries, COALESCE(SUM(size_bytes), 0) AS size_bytes
+                FROM response_cache
+                '''
+            ).fetchone()
+            return dict(row)
+
+    def get_evaluation_hashes(self, evaluator_version: str) -> Dict[int, str]:
+        """평가기 버전별 평가 시점 내용 해시 조회"""
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                '''
+                SELECT prompt_id, content_hash
+                FROM prompt_evaluations
+                WHERE evaluator_version = ?
+                ''',
+                (evaluator_version,)
+            )
+            return {row['prompt_id']: row['content_hash'] for row in cursor.fetchall()}
+
+    def save_evaluations(self, evaluator_version: str, results: List[Dict]):
+        """평가 결과 일괄 저장"""
+        with self.get_connection() as conn:
+            conn.executemany(
+                '''
+                INSERT OR REPLACE INTO prompt_evaluations
+                (prompt_id, evaluator_version, content_hash, score, metrics, evaluated_at)
+                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ''',
+                [
+                    (
+                        result['prompt_id'],
+                        evaluator_version,
+                        result['content_hash'],
+                        result['score'],
+                        result['metrics']
+                    )
+                    for result in results
+                ]
+            )
+
+    def get_evaluations(self, evaluator_version: str) -> 'pd.DataFrame':
+        """평가기 버전별 평가 결과 조회"""
+        import pandas as pd
+
+        with self.get_connection() as conn:
+            return pd.read_sql_query(
+                '''
+                SELECT e.prompt_id, p.title, p.model, p.version, p.category,
+                       e.score, e.metrics, e.evaluated_at
+                FROM prompt_evaluations e
+                JOIN prompts p ON p.id = e.prompt_id
+                WHERE e.evaluator_version = ?
+                ORDER BY e.score
+                ''',
+                conn,
+                params=(evaluator_version,)
+            )
+
+    def get_rule_hashes(self, ruleset_version: str) -> Dict[int, str]:
+        """규칙 집합 버전별 검사 시점 내용 해시 조회"""
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                '''
+                SELECT DISTINCT prompt_id, content_hash
+                FROM prompt_rule_results
+                WHERE ruleset_version = ?
+                ''',
+                (ruleset_version,)
+            )
+            return {row['prompt_id']: row['content_hash'] for row in cursor.fetchall()}
+
+    def save_rule_results(self, ruleset_version: str, results: List[Dict]):
+        """프롬프트별 규칙 검사 결과 일괄 교체"""
+        with self.get_connection() as conn:
+            conn.executemany(
+                'DELETE FROM prompt_rule_results WHERE prompt_id = ?',
+                [(result['prompt_id'],) for result in results]
+            )
+            conn.executemany(
+                '''
+                INSERT INTO prompt_rule_results
+                (prompt_id, rule_name, passed, ruleset_version, content_hash)
+                VALUES (?, ?, ?, ?, ?)
+                ''',
+                [
+                    (
+                        result['prompt_id'],
+                        rule_name,
+                        int(passed),
+                        ruleset_version,
+                        result['content_hash']
+                    )
+                    for result in results
+                    for rule_name, passed in result['rules'].items()
+                ]
+            )
+            self._bump_data_version(conn, 'rules')
+
+    def get_rule_names(self) -> List[str]:
+        """검사 결과가 저장된 규칙 이름 목록"""
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                'SELECT DISTINCT rule_name FROM prompt_rule_results ORDER BY rule_name'
+            )
+            return [row['rule_name'] for row in cursor.fetchall()]
+
+    def get_prompt_ids_failing(self, rule_names: List[str]) -> List[int]:
+        """지정한 규칙 중 하나라도 위반한 프롬프트 ID"""
+        if not rule_names:
+            return []
+        
+        placeholders = ', '.join('?' for _ in rule_names)
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                f'''
+                SELECT DISTINCT prompt_id
+                FROM prompt_rule_results
+                WHERE passed = 0 AND rule_name IN ({placeholders})
+                ''',
+                list(rule_names)
+            )
+            return [row['prompt_id'] for row in cursor.fetchall()]
+
+    def get_rule_summary(self) -> 'pd.DataFrame':
+        """규칙별 통과/위반 건수"""
+        import pandas as pd
+
+        with self.get_connection() as conn:
+            return pd.read_sql_query(
+                '''
+                SELECT rule_name,
+                       SUM(passed) AS passed,
+                       SUM(1 - passed) AS failed
+                FROM prompt_rule_results
+                GROUP BY rule_name
+                ORDER BY failed DESC
+                ''',
+                conn
+            )
+
+    def create_user(self, username: str) -> Optional[int]:
+        """사용자 등록 (이미 있는 이름이면 None)"""
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                'INSERT OR IGNORE INTO users (username) VALUES (?)',
+                (username,)
+            )
+            if cursor.rowcount == 0:
+                return None
+            self._bump_data_version(conn, 'users')
+            return cursor.lastrowid
+
+    def import_users(self, users: List[Dict]) -> int:
+        """사용자 일괄 등록 (이미 있는 이름은 건너뜀, 등록 건수 반환)"""
+        with self.get_connection() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                '''
+                INSERT OR IGNORE INTO users (username, created_at)
+                VALUES (?, COALESCE(?, CURRENT_TIMESTAMP))
+                ''',
+                [(user['username'], user.get('created_at')) for user in users]
+            )
+            inserted = conn.total_changes - before
+            if inserted:
+                self._bump_data_version(conn, 'users')
+            return inserted
+
+    def user_exists(self, username: str) -> bool:
+        """사용자 존재 여부 (고유 인덱스 조회)"""
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                'SELECT 1 FROM users WHERE username = ?',
+                (username,)
+            )
+            return cursor.fetchone() is not None
+
+    def get_usernames(self) -> List[str]:
+        """등록 순서대로 사용자 이름 목록"""
+        with self.get_connection() as conn:
+            cursor = conn.execute('SELECT username FROM users ORDER BY user_id')
+            return [row['username'] for row in cursor.fetchall()]
+
+    def get_users(self) -> 'pd.DataFrame':
+        """전체 사용자 목록"""
+        import pandas as pd
+
+        with self.get_connection() as conn:
+            return pd.read_sql_query(
+                'SELECT user_id, username, created_at FROM users ORDER BY user_id',
+                conn
+            )
+
+    def get_slow_queries(self, full_scan_only: bool = False, limit: int = 200) -> 'pd.DataFrame':
+        """최근 느린 쿼리 목록"""
+        import pandas as pd
+
+        where = 'WHERE full_scan = 1' if full_scan_only else ''
+        with self.get_connection() as conn:
+            return pd.read_sql_query(
+                f'''
+                SELECT id, recorded_at, duration_ms, rows, param_count, full_scan,
+                       shape, sql_text, plan
+                FROM slow_queries
+                {where}
+                ORDER BY id DESC
+                LIMIT ?
+                ''',
+                conn,
+                params=(limit,)
+            )
+
+    def get_slow_query_summary(self) -> 'pd.DataFrame':
+        """SQL 모양별 느린 쿼리 집계"""
+        import pandas as pd
+
+        with self.get_connection() as conn:
+            return pd.read_sql_query(
+                '''
+                SELECT shape,
+                       COUNT(*) AS occurrences,
+                       MAX(duration_ms) AS max_ms,
+                       ROUND(AVG(duration_ms), 3) AS mean_ms,
+                       MAX(full_scan) AS full_scan,
+                       MAX(recorded_at) AS last_seen
+                FROM slow_queries
+                GROUP BY shape
+                ORDER BY max_ms DESC
+                ''',
+                conn
+            )
+
+    def clear_slow_queries(self) -> int:
+        """느린 쿼리 기록 삭제"""
+        with self.get_connection() as conn:
+            return conn.execute('DELETE FROM slow_queries').rowcount
+
+    def _encode_texts(self, data: Dict) -> Dict:
+        """저장할 값의 큰 본문 압축 (압축이 꺼져 있으면 그대로)"""
+        if not compression.enabled or not any(column in data for column in COMPRESSED_COLUMNS):
+            return data
+        
+        dict_id = self.get_compression_dictionary_id()
+        return {
+            key: self.codec.encode(value, dict_id) if key in COMPRESSED_COLUMNS else value
+            for key, value in data.items()
+        }
+
+    def _decode_row(self, row: Dict) -> Dict:
+        for column in COMPRESSED_COLUMNS:
+            if is_compressed(row.get(column)):
+                row[column] = self.codec.decode(row[column])
+        return row
+
+    def decode_texts(self, frame: 'pd.DataFrame') -> 'pd.DataFrame':
+        """DataFrame 의 압축된 본문 컬럼을 문자열로 복원"""
+        for column in COMPRESSED_COLUMNS:
+            # 압축 값(bytes)이 섞이면 object 컬럼이 됨
+            if column in frame and frame[column].dtype == object:
+                frame[column] = frame[column].map(self.codec.decode)
+        return frame
+
+    def _load_compression_dictionary(self, dict_id: int) -> Optional[bytes]:
+        with self.get_connection() as conn:
+            row = conn.execute(
+                'SELECT data FROM compression_dictionaries WHERE dict_id = ?',
+                (dict_id,)
+            ).fetchone()
+            return row['data'] if row else None
+
+    def get_compression_dictionary_id(self) -> int:
+        """새로 압축할 때 쓸 사전 ID (사전을 쓰지 않거나 없으면 0)"""
+        if not compression.use_dictionary:
+            return 0
+        if self._dictionary_id is None:
+            with self.get_connection() as conn:
+                row = conn.execute('SELECT MAX(dict_id) FROM compression_dictionaries').fetchone()
+            self._dictionary_id = row[0] or 0
+        return self._dictionary_id
+
+    def save_compression_dictionary(self, data: bytes, sample_count: int) -> int:
+        """새 압축 사전 저장 (이후 압축부터 사용)"""
+        with self.get_connection() as conn:
+            dict_id = conn.execute(
+                'INSERT INTO compression_dictionaries (data, sample_count) VALUES (?, ?)',
+                (data, sample_count)
+            ).lastrowid
+        self.codec.remember(dict_id, data)
+        self._dictionary_id = dict_id
+        return dict_id
+
+    def get_compression_dictionaries(self) -> 'pd.DataFrame':
+        """저장된 압축 사전 목록"""
+        import pandas as pd
+
+        with self.get_connection() as conn:
+            return pd.read_sql_query(
+                '''
+                SELECT dict_id, length(data) AS bytes, sample_count, created_at
+                FROM compression_dictionaries
+                ORDER BY dict_id DESC
+                ''',
+                conn
+            )
+
+    def get_text_sample(self, limit: int = 500) -> List[str]:
+        """사전 학습용 무작위 본문 표본"""
+        texts = []
+        with self.get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT {', '.join(COMPRESSED_COLUMNS)} FROM prompts ORDER BY RANDOM() LIMIT ?",
+                (limit,)
+            ).fetchall()
+        for row in rows:
+            row = self._decode_row(dict(row))
+            texts.extend(row[column] for column in COMPRESSED_COLUMNS if row[column])
+        return texts
+
+    def get_stored_texts(self, after_id: int = 0, batch_size: int = 200) -> List[Dict]:
+        """압축 작업용 저장된 그대로의 본문 값 (압축을 풀지 않음)"""
+        with self.get_connection() as conn:
+            rows = conn.execute(
+                f'''
+                SELECT id, {', '.join(COMPRESSED_COLUMNS)}
+                FROM prompts
+                WHERE id > ?
+                ORDER BY id
+                LIMIT ?
+                ''',
+                (after_id, batch_size)
+            ).fetchall()
+            return [dict(row) for row in rows]
+
+    def save_stored_texts(self, updates: Dict[str, List[Tuple[int, object, object]]]):
+        """다시 압축한 본문 값 저장
+
+        updates 는 컬럼별 (id, 읽었을 때 값, 새 값) 목록입니다. 그 사이 수정된 행은
+        덮어쓰지 않고, 내용은 같으므로 silent_writes 표식으로 수정 트리거를 건너뛰어
+        변경 기록/데이터 버전은 그대로 둡니다.
+        """
+        if not any(updates.values()):
+            return
+        
+        with self.get_connection() as conn:
+            conn.execute("INSERT OR IGNORE INTO silent_writes (reason) VALUES ('recompress')")
+            for column, rows in updates.items():
+                if column not in COMPRESSED_COLUMNS:
+                    raise DatabaseError(f"Unsupported text column: {column}")
+                conn.executemany(
+                    f'UPDATE prompts SET {column} = ? WHERE id = ? AND {column} IS ?',
+                    [(new, prompt_id, old) for prompt_id, old, new in rows]
+                )
+            conn.execute("DELETE FROM silent_writes WHERE reason = 'recompress'")
+
+    def get_compression_stats(self) -> 'pd.DataFrame':
+        """본문 컬럼별 압축 건수와 원문/저장 크기"""
+        import pandas as pd
+
+        stats = []
+        with self.get_connection() as conn:
+            conn.create_function('raw_length', 1, raw_length, deterministic=True)
+            for column in COMPRESSED_COLUMNS:
+                row = conn.execute(
+                    f'''
+                    SELECT COUNT({column}) AS values_count,
+                           COALESCE(SUM(typeof({column}) = 'blob'), 0) AS compressed,
+                           COALESCE(SUM({raw_length_sql(column)}), 0) AS raw_bytes,
+                           COALESCE(SUM(length(CAST({column} AS BLOB))), 0) AS stored_bytes
+                    FROM prompts
+                    '''
+                ).fetchone()
+                stats.append({'column': column, **dict(row)})
+        
+        frame = pd.DataFrame(
+            stats,
+            columns=['column', 'values_count', 'compressed', 'raw_bytes', 'stored_bytes']
+        )
+        frame['ratio'] = (frame['stored_bytes'] / frame['raw_bytes'].where(frame['raw_bytes'] > 0)).round(3)
+        return frame
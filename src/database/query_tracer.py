@@ -0,0 +1,301 @@
+from collections import deque
+from functools import lru_cache
+from time import perf_counter
+from typing import Dict, List, Optional
+import re
+import sqlite3
+import threading
+import time
+
+_COMMENT = re.compile(r'--[^\n]*|/\*.*?\*/', re.S)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'(?<![\w.])-?\d+(?:\.\d+)?\b')
+_IN_LIST = re.compile(r'\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)', re.I)
+_VALUES_LIST = re.compile(r'(\(\s*\?(?:\s*,\s*\?)*\s*\))(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))+')
+_SPACE = re.compile(r'\s+')
+
+# 실행 계획을 남길 수 있는 문장
+_EXPLAINABLE = ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE')
+
+
+@lru_cache(maxsize=2048)
+def normalize_sql(sql: str) -> str:
+    """SQL 을 모양 단위로 정규화 (리터럴과 자리표시자 목록 길이 차이 제거)"""
+    shape = _COMMENT.sub(' ', sql)
+    shape = _STRING.sub('?', shape)
+    shape = _NUMBER.sub('?', shape)
+    shape = _SPACE.sub(' ', shape).strip()
+    shape = _IN_LIST.sub('IN (?...)', shape)
+    return _VALUES_LIST.sub(r'\1, ...', shape)
+
+
+def is_full_scan(plan: List[str]) -> bool:
+    """실행 계획에 인덱스 없이 테이블 전체를 읽는 단계가 있는지"""
+    for detail in plan:
+        if not detail.startswith('SCAN '):
+            continue
+        if 'USING' in detail or 'CONSTANT ROW' in detail:
+            continue
+        return True
+    return False
+
+
+class ShapeStats:
+    """SQL 모양 하나의 누적 통계"""
+
+    __slots__ = ('calls', 'total_seconds', 'max_seconds', 'rows', 'min_params', 'max_params', 'slow')
+
+    def __init__(self):
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.rows = 0
+        self.min_params = None
+        self.max_params = 0
+        self.slow = 0
+
+
+class QueryTracer:
+    """SQL 모양별 실행 시간/매개변수 개수 기록과 느린 쿼리 실행 계획 수집
+
+    기준 시간을 넘은 쿼리는 같은 연결에서 EXPLAIN QUERY PLAN 을 실행해 대기열에
+    넣고, PromptDatabase 가 연결을 닫은 뒤 slow_queries 테이블에 저장합니다.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        slow_query_ms: float = 100.0,
+        retention: int = 1000,
+        max_pending: int = 1000
+    ):
+        self.enabled = enabled
+        self.slow_query_ms = slow_query_ms
+        # slow_queries 테이블에 남길 최대 건수
+        self.retention = retention
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._shapes: Dict[str, ShapeStats] = {}
+        # db_path -> 저장 대기 중인 느린 쿼리
+        self._pending: Dict[str, deque] = {}
+        self._max_pending = max_pending
+
+    def record(
+        self,
+        db_path: str,
+        connection: sqlite3.Connection,
+        sql: str,
+        params,
+        param_count: int,
+        seconds: float,
+        rows: int
+    ):
+        """쿼리 한 건 기록 (기준 시간을 넘으면 실행 계획 수집)"""
+        shape = normalize_sql(sql)
+        slow = seconds * 1000 >= self.slow_query_ms
+        with self._lock:
+            stats = self._shapes.get(shape)
+            if stats is None:
+                stats = self._shapes[shape] = ShapeStats()
+            stats.calls += 1
+            stats.total_seconds += seconds
+            stats.rows += rows
+            if seconds > stats.max_seconds:
+                stats.max_seconds = seconds
+            if stats.min_params is None or param_count < stats.min_params:
+                stats.min_params = param_count
+            if param_count > stats.max_params:
+                stats.max_params = param_count
+            if slow:
+                stats.slow += 1
+
+        if not slow:
+            return
+
+        plan = self._explain(connection, sql, params)
+        entry = {
+            'shape': shape,
+            'sql_text': sql.strip(),
+            'param_count': param_count,
+            'duration_ms': round(seconds * 1000, 3),
+            'rows': rows,
+            'plan': '\n'.join(plan) if plan is not None else None,
+            'full_scan': int(bool(plan) and is_full_scan(plan)),
+            'recorded_at': time.strftime('%Y-%m-%d %H:%M:%S')
+        }
+        with self._lock:
+            self._pending.setdefault(db_path, deque(maxlen=self._max_pending)).append(entry)
+
+    @staticmethod
+    def _explain(connection: sqlite3.Connection, sql: str, params) -> Optional[List[str]]:
+        """추적되지 않는 원래 execute 로 실행 계획 조회"""
+        if not sql.lstrip().upper().startswith(_EXPLAINABLE):
+            return None
+        try:
+            cursor = sqlite3.Connection.execute(connection, f'EXPLAIN QUERY PLAN {sql}', params)
+            return [row[-1] for row in cursor.fetchall()]
+        except sqlite3.Error:
+            return None
+
+    def drain(self, db_path: str) -> List[Dict]:
+        """저장할 느린 쿼리 꺼내기"""
+        with self._lock:
+            pending = self._pending.pop(db_path, None)
+        return list(pending) if pending else []
+
+    def has_pending(self, db_path: str) -> bool:
+        return db_path in self._pending
+
+    def snapshot(self) -> List[Dict]:
+        """SQL 모양별 통계 (누적 시간 내림차순)"""
+        with self._lock:
+            items = [
+                (shape, stats.calls, stats.total_seconds, stats.max_seconds,
+                 stats.rows, stats.min_params, stats.max_params, stats.slow)
+                for shape, stats in self._shapes.items()
+            ]
+        rows = [
+            {
+                'shape': shape,
+                'calls': calls,
+                'total_ms': round(total * 1000, 2),
+                'mean_ms': round(total / calls * 1000, 3),
+                'max_ms': round(maximum * 1000, 3),
+                'rows': row_count,
+                'min_params': min_params,
+                'max_params': max_params,
+                'slow': slow
+            }
+            for shape, calls, total, maximum, row_count, min_params, max_params, slow in items
+        ]
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+    def reset(self):
+        """모양별 통계 초기화 (저장 대기 중인 느린 쿼리는 유지)"""
+        with self._lock:
+            self._shapes.clear()
+            self.started_at = time.time()
+
+
+# 프로세스 공용 쿼리 추적기
+tracer = QueryTracer()
+
+
+def _param_count(params) -> int:
+    try:
+        return len(params)
+    except TypeError:
+        return 0
+
+
+class TracedCursor(sqlite3.Cursor):
+    """실행부터 결과를 다 읽을 때까지의 시간을 한 건으로 기록하는 커서"""
+
+    _trace = None
+
+    def execute(self, sql, parameters=()):
+        self._finish()
+        start = perf_counter()
+        super().execute(sql, parameters)
+        self._trace = [sql, parameters, _param_count(parameters), perf_counter() - start, 0]
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        self._finish()
+        rows = list(seq_of_parameters)
+        start = perf_counter()
+        super().executemany(sql, rows)
+        elapsed = perf_counter() - start
+        # 실행 계획은 첫 행의 매개변수로 조회
+        self._trace = [sql, rows[0] if rows else (), _param_count(rows[0]) if rows else 0, elapsed, len(rows)]
+        self._finish()
+        return self
+
+    def fetchone(self):
+        start = perf_counter()
+        row = super().fetchone()
+        self._add(perf_counter() - start, 0 if row is None else 1)
+        if row is None:
+            self._finish()
+        return row
+
+    def fetchmany(self, size=None):
+        start = perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._add(perf_counter() - start, len(rows))
+        if not rows:
+            self._finish()
+        return rows
+
+    def fetchall(self):
+        start = perf_counter()
+        rows = super().fetchall()
+        self._add(perf_counter() - start, len(rows))
+        self._finish()
+        return rows
+
+    def __next__(self):
+        start = perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._finish()
+            raise
+        self._add(perf_counter() - start, 1)
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        self._finish()
+
+    def _add(self, seconds: float, rows: int):
+        trace = self._trace
+        if trace is not None:
+            trace[3] += seconds
+            trace[4] += rows
+
+    def _finish(self):
+        trace, self._trace = self._trace, None
+        if trace is None:
+            return
+        sql, params, param_count, seconds, rows = trace
+        try:
+            tracer.record(self.connection.db_path, self.connection, sql, params, param_count, seconds, rows)
+        except sqlite3.ProgrammingError:
+            # 연결이 이미 닫힘
+            pass
+
+
+class TracedConnection(sqlite3.Connection):
+    """sqlite3.connect(factory=TracedConnection) 로 쓰는 추적 연결"""
+
+    def __init__(self, database, *args, **kwargs):
+        super().__init__(database, *args, **kwargs)
+        self.db_path = database
+
+    def cursor(self, factory=TracedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+def connect(db_path: str, **kwargs) -> sqlite3.Connection:
+    """설정에 따라 추적 연결 또는 일반 연결 생성"""
+    if tracer.enabled:
+        return sqlite3.connect(db_path, factory=TracedConnection, **kwargs)
+    return sqlite3.connect(db_path, **kwargs)
+
+
+def configure_query_tracer(config) -> QueryTracer:
+    """설정의 query_tracing 값 적용"""
+    tracer.enabled = config.get('query_tracing.enabled', True)
+    tracer.slow_query_ms = config.get('query_tracing.slow_query_ms', 100)
+    tracer.retention = config.get('query_tracing.max_slow_queries', 1000)
+    return tracer
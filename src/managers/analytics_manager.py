@@ -1,16 +1,18 @@
 import pandas as pd
 from typing import Dict, List, Tuple
 from ..database.database import PromptDatabase
+from .keyword_manager import KeywordManager
 
 class AnalyticsManager:
     """프롬프트 분석을 담당하는 클래스"""
     
     def __init__(self, database: PromptDatabase):
         self.database = database
+        self.keyword_manager = KeywordManager(database)
 
     def get_creation_trends(self) -> Tuple[List, List]:
         """프롬프트 생성 추이 분석"""
-        history = self.database.get_history()
+        history = self.database.get_history(columns=['created_at'])
         
         if history.empty:
             return [], []
@@ -29,7 +31,7 @@ class AnalyticsManager:
 
     def get_model_usage_stats(self) -> Dict[str, int]:
         """모델별 사용 통계"""
-        history = self.database.get_history()
+        history = self.database.get_history(columns=['model'])
         
         if history.empty:
             return {}
@@ -44,7 +46,7 @@ class AnalyticsManager:
 
     def get_category_stats(self) -> Dict[str, int]:
         """카테고리별 통계"""
-        history = self.database.get_history()
+        history = self.database.get_history(columns=['category'])
         
         if history.empty:
             return {}
@@ -59,7 +61,7 @@ class AnalyticsManager:
 
     def get_user_contribution_stats(self) -> Dict[str, Dict[str, int]]:
         """사용자별 기여도 통계"""
-        history = self.database.get_history()
+        history = self.database.get_history(columns=['created_by', 'is_best'])
         
         if history.empty:
             return {
@@ -84,4 +86,12 @@ class AnalyticsManager:
         except Exception as e:
             print(f"Error in get_user_contribution_stats: {str(e)}")
             
-        return stats
\ No newline at end of file
+        return stats
+
+    def get_top_keywords(
+        self,
+        group_by: str,
+        top_n: int = 10
+    ) -> Dict[str, List[Tuple[str, float]]]:
+        """그룹(카테고리/모델/부서)별 TF-IDF 상위 키워드"""
+        return self.keyword_manager.get_group_keywords(group_by, top_n)
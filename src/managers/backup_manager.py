@@ -0,0 +1,63 @@
+from typing import Dict, List, Optional
+import threading
+import time
+from src.database.backup import BackupResult, create_backup_service
+from src.database.database import PromptDatabase
+from src.utils.config import Config
+
+
+class BackupManager:
+    """주기 백업 스케줄러와 화면에서 요청한 백업 실행을 담당하는 클래스
+
+    백업은 몇 분씩 걸릴 수 있으므로 화면에서는 백그라운드 스레드로 실행하고 status 로
+    진행 상태를 보여 줍니다. 복원은 실행 중인 앱의 메모리 색인과 맞지 않게 되므로
+    화면에서는 하지 않고 명령줄(python -m src.cli restore)로만 합니다.
+    """
+
+    def __init__(self, config: Config, database: PromptDatabase):
+        self.service = create_backup_service(config, database.db_path)
+        self.interval_hours = config.get('database.backup_interval_hours', 24)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.status = {'running': False}
+
+    @property
+    def directory(self) -> str:
+        return self.service.directory
+
+    @property
+    def keep(self) -> int:
+        return self.service.keep
+
+    def start_scheduler(self) -> bool:
+        """주기 백업 시작 (주기가 0 이면 False, 이미 시작했으면 그대로)"""
+        if not self.interval_hours:
+            return False
+        self.service.start_scheduler(self.interval_hours)
+        return True
+
+    def start_background(self) -> bool:
+        """지금 백업을 백그라운드 스레드로 시작 (이미 실행 중이면 False)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self.status = {'running': True, 'started_at': time.time()}
+            self._thread = threading.Thread(target=self._run, name='backup', daemon=True)
+            self._thread.start()
+            return True
+
+    def _run(self):
+        try:
+            self.status['result'] = self.service.backup()
+        except Exception as e:
+            self.status['error'] = str(e)
+        finally:
+            self.status.update(running=False, finished_at=time.time())
+
+    def last_result(self) -> Optional[BackupResult]:
+        """이 프로세스에서 마지막으로 실행한 백업 결과 (스케줄러 포함)"""
+        return self.service.last_result
+
+    def get_backups(self) -> List[Dict]:
+        """보관 중인 스냅숏 목록 (최신순)"""
+        return self.service.list_backups()
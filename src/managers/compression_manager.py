@@ -0,0 +1,130 @@
+from typing import Dict, Optional
+import threading
+import time
+import pandas as pd
+from src.database.compression import (
+    COMPRESSED_COLUMNS, dictionary_id, is_compressed, settings, train_dictionary
+)
+from src.database.database import PromptDatabase
+
+
+class CompressionManager:
+    """본문 압축 사전 학습, 기존 행 재압축 작업, 압축 통계를 담당하는 클래스
+
+    재압축은 id 순서로 batch_size 행씩 읽어 현재 설정(압축 여부, 최소 크기, 최신 사전)에
+    맞게 다시 저장합니다. 압축을 끈 상태로 실행하면 압축된 값을 원문으로 되돌립니다.
+    배치마다 쓰기 트랜잭션이 짧게 끝나도록 나누고, 배치 사이에 잠깐 쉬어 화면의 쓰기가
+    밀리지 않게 합니다.
+    """
+
+    def __init__(self, database: PromptDatabase):
+        self.database = database
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.status = {'running': False}
+
+    @property
+    def enabled(self) -> bool:
+        return settings.enabled
+
+    @property
+    def min_bytes(self) -> int:
+        return settings.min_bytes
+
+    def train_dictionary(self, sample_size: int = 500) -> Optional[int]:
+        """무작위 표본으로 새 사전을 만들어 저장 (반복되는 조각이 없으면 None)"""
+        samples = self.database.get_text_sample(sample_size)
+        data = train_dictionary(samples, settings.dictionary_bytes)
+        if not data:
+            return None
+        return self.database.save_compression_dictionary(data, len(samples))
+
+    def _target(self, value, dict_id: int):
+        """현재 설정으로 저장할 값 (바꿀 필요가 없으면 원래 값)"""
+        if is_compressed(value):
+            if settings.enabled and dictionary_id(value) == dict_id:
+                return value
+            value = self.database.codec.decode(value)
+        if not settings.enabled:
+            return value
+        return self.database.codec.encode(value, dict_id)
+
+    def recompress(
+        self,
+        batch_size: int = 200,
+        pause_sec: float = 0.05,
+        stop: Optional[threading.Event] = None
+    ) -> Dict:
+        """전체 행을 현재 설정으로 다시 저장"""
+        dict_id = self.database.get_compression_dictionary_id() if settings.enabled else 0
+        result = {'scanned': 0, 'changed_values': 0, 'bytes_before': 0, 'bytes_after': 0}
+        last_id = 0
+
+        while not (stop and stop.is_set()):
+            rows = self.database.get_stored_texts(last_id, batch_size)
+            if not rows:
+                break
+
+            updates = {column: [] for column in COMPRESSED_COLUMNS}
+            for row in rows:
+                for column in COMPRESSED_COLUMNS:
+                    value = row[column]
+                    target = self._target(value, dict_id)
+                    if target is not value:
+                        updates[column].append((row['id'], value, target))
+                        result['changed_values'] += 1
+                        result['bytes_before'] += _stored_size(value)
+                        result['bytes_after'] += _stored_size(target)
+
+            self.database.save_stored_texts(updates)
+            result['scanned'] += len(rows)
+            last_id = rows[-1]['id']
+            self.status.update(result, last_id=last_id)
+            if pause_sec:
+                time.sleep(pause_sec)
+        return result
+
+    def start_background(self, batch_size: int = 200) -> bool:
+        """재압축을 백그라운드 스레드로 시작 (이미 실행 중이면 False)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self._stop.clear()
+            self.status = {'running': True, 'started_at': time.time()}
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(batch_size,),
+                name='recompress',
+                daemon=True
+            )
+            self._thread.start()
+            return True
+
+    def stop_background(self):
+        """실행 중인 재압축 중지 (현재 배치까지 저장)"""
+        self._stop.set()
+
+    def _run(self, batch_size: int):
+        try:
+            self.status.update(self.recompress(batch_size, stop=self._stop))
+        except Exception as e:
+            self.status['error'] = str(e)
+        finally:
+            self.status.update(running=False, finished_at=time.time(), stopped=self._stop.is_set())
+
+    def get_stats(self) -> pd.DataFrame:
+        """컬럼별 압축 건수와 압축률"""
+        return self.database.get_compression_stats()
+
+    def get_dictionaries(self) -> pd.DataFrame:
+        """저장된 압축 사전 목록"""
+        return self.database.get_compression_dictionaries()
+
+
+def _stored_size(value) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    return len(value)
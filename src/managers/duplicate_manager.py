@@ -0,0 +1,110 @@
+from typing import Dict, List, Optional, Tuple
+from src.database.database import PromptDatabase
+from src.utils.minhash import MinHasher
+
+class DuplicateManager:
+    """MinHash/LSH 기반 유사 중복 프롬프트 탐지를 담당하는 클래스"""
+    
+    def __init__(self, database: PromptDatabase, threshold: float = 0.8):
+        self.database = database
+        self.threshold = threshold
+        self.hasher = MinHasher()
+
+    def minhash(self, prompt_content: str) -> Tuple[bytes, List[Tuple[int, int]]]:
+        """저장할 시그니처와 LSH 버킷 (프롬프트 저장과 같은 트랜잭션에서 쓰기 위해 미리 계산)"""
+        signature = self.hasher.signature(prompt_content)
+        return self.hasher.to_bytes(signature), self.hasher.band_buckets(signature)
+
+    def index_prompt(self, prompt_id: int, prompt_content: str):
+        """프롬프트 시그니처 계산 및 LSH 인덱스 등록"""
+        self.database.save_minhash(prompt_id, *self.minhash(prompt_content))
+
+    def find_near_duplicates(
+        self,
+        prompt_content: str,
+        threshold: Optional[float] = None,
+        exclude_id: Optional[int] = None
+    ) -> List[Dict]:
+        """유사 중복 프롬프트 조회"""
+        threshold = self.threshold if threshold is None else threshold
+        signature = self.hasher.signature(prompt_content)
+        
+        candidates = self.database.get_lsh_candidates(
+            self.hasher.band_buckets(signature)
+        )
+        candidates = [pid for pid in candidates if pid != exclude_id]
+        signatures = self.database.get_minhash_signatures(candidates)
+        
+        similarities = {}
+        for prompt_id, data in signatures.items():
+            similarity = self.hasher.estimate_similarity(
+                signature,
+                self.hasher.from_bytes(data)
+            )
+            if similarity >= threshold:
+                similarities[prompt_id] = similarity
+        
+        summaries = self.database.get_prompt_summaries(list(similarities))
+        duplicates = [
+            {
+                'id': prompt_id,
+                'title': summaries[prompt_id]['title'],
+                'version': summaries[prompt_id]['version'],
+                'similarity': similarity
+            }
+            for prompt_id, similarity in similarities.items()
+            if prompt_id in summaries
+        ]
+        
+        return sorted(duplicates, key=lambda x: x['similarity'], reverse=True)
+
+    def rebuild_index(self) -> int:
+        """전체 프롬프트의 시그니처 재계산 (배치 작업)"""
+        count = 0
+        for row in self.database.iter_prompt_texts():
+            self.index_prompt(row['id'], row['prompt_content'] or '')
+            count += 1
+        return count
+
+    def cluster_duplicates(self, threshold: Optional[float] = None) -> List[List[int]]:
+        """LSH 버킷 충돌을 이용한 기존 중복 프롬프트 군집화 (배치 작업)"""
+        threshold = self.threshold if threshold is None else threshold
+        collisions = self.database.get_lsh_collisions()
+        
+        member_ids = sorted({pid for group in collisions for pid in group})
+        signatures = {
+            pid: self.hasher.from_bytes(data)
+            for pid, data in self.database.get_minhash_signatures(member_ids).items()
+        }
+        
+        # Union-Find
+        parent = {pid: pid for pid in member_ids}
+        
+        def find(pid: int) -> int:
+            while parent[pid] != pid:
+                parent[pid] = parent[parent[pid]]
+                pid = parent[pid]
+            return pid
+        
+        for group in collisions:
+            # 버킷 대표와만 비교하여 쌍 비교 수를 버킷 크기에 선형으로 유지
+            head = group[0]
+            for pid in group[1:]:
+                if find(head) == find(pid):
+                    continue
+                similarity = self.hasher.estimate_similarity(
+                    signatures[head],
+                    signatures[pid]
+                )
+                if similarity >= threshold:
+                    parent[find(pid)] = find(head)
+        
+        clusters = {}
+        for pid in member_ids:
+            clusters.setdefault(find(pid), []).append(pid)
+        
+        return sorted(
+            (sorted(ids) for ids in clusters.values() if len(ids) > 1),
+            key=len,
+            reverse=True
+        )
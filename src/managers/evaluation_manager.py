@@ -0,0 +1,120 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Tuple
+import hashlib
+import json
+import os
+import time
+import pandas as pd
+from src.database.database import PromptDatabase
+from src.utils.metrics import BatchMetrics
+
+# 채점 방식이 바뀌면 올려서 전체 재평가
+EVALUATOR_VERSION = '3'
+
+
+def content_hash(response: Optional[str], expected: Optional[str]) -> str:
+    """채점 대상 내용 해시"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update((response or '').encode('utf-8'))
+    digest.update(b'\x00')
+    digest.update((expected or '').encode('utf-8'))
+    return digest.hexdigest()
+
+
+def score_batch(rows: List[Tuple[int, str, str, str]]) -> List[Dict]:
+    """행 묶음 채점 (프로세스 풀 작업 단위)"""
+    scores = BatchMetrics().score(
+        [response for _, _, response, _ in rows],
+        [expected for _, _, _, expected in rows]
+    )
+    
+    results = []
+    for (prompt_id, digest, _, _), metrics in zip(rows, scores.to_dict('records')):
+        scored = not pd.isna(metrics['token_f1'])
+        results.append({
+            'prompt_id': prompt_id,
+            'content_hash': digest,
+            'score': metrics['token_f1'] if scored else None,
+            'metrics': json.dumps(metrics if scored else {})
+        })
+    return results
+
+
+class EvaluationManager:
+    """저장된 답변의 기대결과 대비 회귀 평가를 담당하는 클래스"""
+    
+    def __init__(self, database: PromptDatabase):
+        self.database = database
+
+    def evaluate_library(
+        self,
+        workers: Optional[int] = None,
+        chunk_size: int = 500,
+        force: bool = False
+    ) -> Dict:
+        """전체 라이브러리 증분 평가
+        
+        내용 해시나 평가기 버전이 바뀐 행만 다시 채점합니다.
+        """
+        start = time.perf_counter()
+        known = {} if force else self.database.get_evaluation_hashes(EVALUATOR_VERSION)
+        counts = {'total': 0, 'scored': 0}
+        
+        chunks = self._iter_changed_chunks(known, chunk_size, counts)
+        first = next(chunks, None)
+        
+        if first is not None and len(first) < chunk_size:
+            # 변경 행이 한 묶음보다 적으면 프로세스 풀 시작 비용 없이 바로 채점
+            self.database.save_evaluations(EVALUATOR_VERSION, score_batch(first))
+        elif first is not None:
+            workers = workers or os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                max_pending = workers * 2
+                pending = {executor.submit(score_batch, first)}
+                
+                for chunk in chunks:
+                    pending.add(executor.submit(score_batch, chunk))
+                    if len(pending) >= max_pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            self.database.save_evaluations(EVALUATOR_VERSION, future.result())
+                
+                for future in pending:
+                    self.database.save_evaluations(EVALUATOR_VERSION, future.result())
+        
+        return {
+            'evaluator_version': EVALUATOR_VERSION,
+            'total': counts['total'],
+            'scored': counts['scored'],
+            'skipped': counts['total'] - counts['scored'],
+            'duration_sec': round(time.perf_counter() - start, 3)
+        }
+
+    def _iter_changed_chunks(
+        self,
+        known: Dict[int, str],
+        chunk_size: int,
+        counts: Dict[str, int]
+    ) -> Iterator[List[Tuple]]:
+        """내용 해시가 바뀐 행만 묶음 단위로 순회 (전체 본문을 메모리에 올리지 않음)"""
+        chunk = []
+        for row in self.database.iter_prompt_texts(
+            fields=['chatbot_response', 'expected_result']
+        ):
+            counts['total'] += 1
+            digest = content_hash(row['chatbot_response'], row['expected_result'])
+            if known.get(row['id']) == digest:
+                continue
+            
+            chunk.append((row['id'], digest, row['chatbot_response'], row['expected_result']))
+            counts['scored'] += 1
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        
+        if chunk:
+            yield chunk
+
+    def get_results(self) -> pd.DataFrame:
+        """현재 평가기 버전의 평가 결과"""
+        return self.database.get_evaluations(EVALUATOR_VERSION)
@@ -1,6 +1,7 @@
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from src.database.database import PromptDatabase
+from src.managers.similarity_manager import SimilarityManager
 import pandas as pd
 
 class HistoryManager:
@@ -8,44 +9,45 @@ class HistoryManager:
     
     def __init__(self, database: PromptDatabase):
         self.database = database
+        self.similarity_manager = SimilarityManager(database)
 
-    def get_history(self, filters: Optional[Dict] = None) -> pd.DataFrame:
-        """필터링된 히스토리 조회"""
-        history = self.database.get_history()
+    def get_history(
+        self,
+        filters: Optional[Dict] = None,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """필터링된 히스토리 조회 (필터는 SQL 에서 적용)"""
+        history = self.database.get_history(filters, columns)
         
-        if history.empty:
-            return history
+        if not history.empty and 'created_at' in history:
+            # created_at 컬럼을 datetime 타입으로 변환
+            history['created_at'] = pd.to_datetime(history['created_at'])
+        
+        return history
 
-        # created_at 컬럼을 datetime 타입으로 변환
-        history['created_at'] = pd.to_datetime(history['created_at'])
+    def get_history_page(
+        self,
+        filters: Optional[Dict] = None,
+        sort_by: str = 'created_at',
+        ascending: bool = False,
+        page: int = 1,
+        page_size: int = 50,
+        columns: Optional[List[str]] = None
+    ) -> Tuple[pd.DataFrame, int]:
+        """서버 측 정렬/페이지 히스토리 조회 (현재 페이지, 전체 건수)"""
+        total = self.database.count_history(filters)
+        page_data = self.database.get_history_page(
+            filters, sort_by, ascending, page, page_size, columns
+        )
         
-        if filters:
-            if filters.get('model'):
-                history = history[history['model'].isin(filters['model'])]
-            
-            if filters.get('version'):
-                history = history[history['version'].isin(filters['version'])]
-            
-            if filters.get('category'):
-                history = history[history['category'].isin(filters['category'])]
-            
-            if filters.get('date_range') and len(filters['date_range']) == 2:
-                start_date, end_date = filters['date_range']
-                history = history[
-                    (history['created_at'].dt.date >= start_date) &
-                    (history['created_at'].dt.date <= end_date)
-                ]
-            
-            if filters.get('created_by'):
-                history = history[
-                    history['created_by'].str.contains(
-                        filters['created_by'], 
-                        case=False,
-                        na=False
-                    )
-                ]
+        if 'created_at' in page_data:
+            page_data['created_at'] = pd.to_datetime(page_data['created_at'])
         
-        return history.sort_values('created_at', ascending=False)
+        return page_data, total
+
+    def get_history_stats(self, filters: Optional[Dict] = None) -> Dict:
+        """필터 조건의 집계 통계"""
+        return self.database.get_history_stats(filters)
 
     def get_change_logs(self, prompt_id: Optional[int] = None) -> pd.DataFrame:
         """변경 이력 조회"""
@@ -56,6 +58,23 @@ class HistoryManager:
         
         return logs
 
+    def get_rule_names(self) -> List[str]:
+        """필터에 사용할 구조 규칙 이름 (일괄 검사 결과 기준)"""
+        return self.database.get_rule_names()
+
+    def search_prompts(
+        self,
+        term: str,
+        page: int = 1,
+        page_size: int = 20
+    ) -> Tuple[pd.DataFrame, int]:
+        """BM25 순위 검색 (현재 페이지, 전체 건수)"""
+        return self.database.search_ranked(term, page, page_size)
+
+    def find_similar_prompts(self, prompt_id: int, top_k: int = 10) -> pd.DataFrame:
+        """유사 프롬프트 상위 k개 조회"""
+        return pd.DataFrame(self.similarity_manager.find_similar(prompt_id, top_k))
+
     def export_history(self, data: pd.DataFrame, format: str = 'csv') -> bytes:
         """히스토리 내보내기"""
         if format.lower() == 'csv':
@@ -0,0 +1,80 @@
+from collections import Counter
+from typing import Dict, List, Tuple
+import heapq
+import numpy as np
+from src.database.database import PromptDatabase, KEYWORD_GROUP_COLUMNS
+from src.utils.text_analyzer import tf_idf
+from src.utils.tokenizer import terms
+
+# 키워드 색인 대상 필드
+KEYWORD_FIELDS = ['title', 'description', 'query', 'prompt_content']
+
+
+class KeywordManager:
+    """말뭉치 기준 TF-IDF 키워드 색인을 담당하는 클래스"""
+    
+    def __init__(self, database: PromptDatabase):
+        self.database = database
+
+    @staticmethod
+    def term_counts(data: Dict) -> Counter:
+        """색인 대상 필드의 단어 빈도 (프롬프트 저장과 같은 트랜잭션에서 쓰기 위해 미리 계산)"""
+        text = '\n'.join(data.get(field) or '' for field in KEYWORD_FIELDS)
+        return Counter(terms(text))
+
+    def index_prompt(self, prompt_id: int, data: Dict):
+        """프롬프트 단어 빈도 저장 및 문서 빈도 갱신"""
+        self.database.replace_prompt_terms(prompt_id, self.term_counts(data))
+
+    def get_prompt_keywords(self, prompt_id: int, top_n: int = 10) -> List[Tuple[str, float]]:
+        """프롬프트의 TF-IDF 상위 키워드"""
+        total = self.database.count_prompts()
+        rows = self.database.get_prompt_terms(prompt_id)
+        return heapq.nlargest(
+            top_n,
+            ((row['term'], tf_idf(row['tf'], row['df'], total)) for row in rows),
+            key=lambda x: x[1]
+        )
+
+    def get_group_keywords(
+        self,
+        column: str,
+        top_n: int = 10
+    ) -> Dict[str, List[Tuple[str, float]]]:
+        """카테고리/모델/부서별 TF-IDF 상위 키워드 (전체 그룹을 쿼리 하나로 집계)"""
+        total = self.database.count_prompts()
+        rows = self.database.get_group_terms(column)
+        keywords = {value: [] for value in sorted(rows['value'].unique())}
+        
+        rows = rows.dropna(subset=['term'])
+        if rows.empty:
+            return keywords
+        # text_analyzer.tf_idf 와 같은 식
+        rows = rows.assign(
+            score=(1.0 + np.log(rows['tf'])) * (np.log((1 + total) / (1 + rows['df'])) + 1.0)
+        )
+        top = (
+            rows.sort_values(['value', 'score'], ascending=[True, False], kind='stable')
+            .groupby('value', sort=False)
+            .head(top_n)
+        )
+        for value, term, score in zip(top['value'], top['term'], top['score']):
+            keywords[value].append((term, float(score)))
+        return keywords
+
+    def get_group_values(self, column: str) -> List[str]:
+        """키워드 집계가 가능한 그룹 값 목록"""
+        return self.database.get_group_values(column)
+
+    def rebuild_index(self) -> int:
+        """전체 프롬프트 키워드 재색인 (배치 작업)"""
+        count = 0
+        for row in self.database.iter_prompt_texts():
+            self.index_prompt(row['id'], row)
+            count += 1
+        return count
+
+    @staticmethod
+    def group_columns() -> List[str]:
+        """집계 가능한 그룹 컬럼 목록"""
+        return list(KEYWORD_GROUP_COLUMNS)
@@ -0,0 +1,142 @@
+import pandas as pd
+from src.database.database import PromptDatabase
+from src.database.query_tracer import QueryTracer, tracer
+from src.utils.instrumentation import MetricsRegistry, metrics
+from src.utils.memory import MemoryTracker, memory
+
+
+class MetricsManager:
+    """계측 지표 조회를 담당하는 클래스"""
+
+    def __init__(
+        self,
+        database: PromptDatabase,
+        registry: MetricsRegistry = metrics,
+        query_tracer: QueryTracer = tracer,
+        memory_tracker: MemoryTracker = memory
+    ):
+        self.database = database
+        self.registry = registry
+        self.query_tracer = query_tracer
+        self.memory_tracker = memory_tracker
+
+    @property
+    def enabled(self) -> bool:
+        return self.registry.enabled
+
+    @property
+    def started_at(self) -> float:
+        return self.registry.started_at
+
+    def get_operation_stats(self) -> pd.DataFrame:
+        """작업별 호출 수/지연 시간/행 수"""
+        return pd.DataFrame(
+            self.registry.snapshot(),
+            columns=[
+                'operation', 'calls', 'errors', 'rows', 'total_ms',
+                'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'
+            ]
+        )
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 형식 지표"""
+        return self.registry.to_prometheus()
+
+    def export_prometheus(self, path: str):
+        """Prometheus 텍스트 파일 저장"""
+        self.registry.write_prometheus(path)
+
+    def reset(self):
+        """누적 지표 초기화"""
+        self.registry.reset()
+
+    @property
+    def tracing_enabled(self) -> bool:
+        return self.query_tracer.enabled
+
+    @property
+    def slow_query_ms(self) -> float:
+        return self.query_tracer.slow_query_ms
+
+    def get_query_shapes(self) -> pd.DataFrame:
+        """이 프로세스에서 실행된 SQL 모양별 통계"""
+        return pd.DataFrame(
+            self.query_tracer.snapshot(),
+            columns=[
+                'shape', 'calls', 'total_ms', 'mean_ms', 'max_ms',
+                'rows', 'min_params', 'max_params', 'slow'
+            ]
+        )
+
+    def get_slow_queries(self, full_scan_only: bool = False, limit: int = 200) -> pd.DataFrame:
+        """저장된 느린 쿼리와 실행 계획"""
+        return self.database.get_slow_queries(full_scan_only, limit)
+
+    def get_slow_query_summary(self) -> pd.DataFrame:
+        """SQL 모양별 느린 쿼리 집계"""
+        return self.database.get_slow_query_summary()
+
+    def clear_slow_queries(self) -> int:
+        """느린 쿼리 기록 삭제"""
+        return self.database.clear_slow_queries()
+
+    def reset_query_stats(self):
+        """SQL 모양별 통계 초기화"""
+        self.query_tracer.reset()
+
+    @property
+    def memory_enabled(self) -> bool:
+        return self.memory_tracker.enabled
+
+    @property
+    def trace_reruns(self) -> bool:
+        return self.memory_tracker.trace_reruns
+
+    def get_read_budget(self) -> dict:
+        """현재 읽기 예산 설정"""
+        budget = self.memory_tracker.budget
+        return {
+            'max_rows': budget.max_rows,
+            'max_mb': round(budget.max_bytes / 2 ** 20, 1) if budget.max_bytes else None,
+            'on_exceed': budget.on_exceed
+        }
+
+    def get_frame_stats(self) -> pd.DataFrame:
+        """메서드별 반환 DataFrame 크기 (memory_usage(deep=True))"""
+        return pd.DataFrame(
+            self.memory_tracker.frame_snapshot(),
+            columns=[
+                'operation', 'calls', 'rows', 'total_mb', 'mean_kb',
+                'max_mb', 'last_kb', 'budget_hits'
+            ]
+        )
+
+    def get_rerun_memory(self) -> pd.DataFrame:
+        """최근 재실행별 할당량과 최대 사용량 (tracemalloc)"""
+        return pd.DataFrame(
+            [
+                {
+                    'recorded_at': pd.Timestamp.fromtimestamp(rerun.recorded_at),
+                    'label': rerun.label,
+                    'duration_ms': rerun.duration_ms,
+                    'allocated_kb': rerun.allocated_kb,
+                    'peak_kb': rerun.peak_kb
+                }
+                for rerun in self.memory_tracker.rerun_snapshot()
+            ],
+            columns=['recorded_at', 'label', 'duration_ms', 'allocated_kb', 'peak_kb']
+        )
+
+    def get_rerun_allocations(self, index: int = 0) -> pd.DataFrame:
+        """재실행 하나의 할당 증가 상위 위치 (index 0 이 가장 최근)"""
+        reruns = self.memory_tracker.rerun_snapshot()
+        if index >= len(reruns):
+            return pd.DataFrame(columns=['location', 'size_kb', 'size_diff_kb', 'count_diff'])
+        return pd.DataFrame(
+            reruns[index].top,
+            columns=['location', 'size_kb', 'size_diff_kb', 'count_diff']
+        )
+
+    def reset_memory_stats(self):
+        """DataFrame 크기/재실행 메모리 기록 초기화"""
+        self.memory_tracker.reset()
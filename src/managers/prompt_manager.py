@@ -1,5 +1,9 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from src.database.database import PromptDatabase
+from src.managers.duplicate_manager import DuplicateManager
+from src.managers.keyword_manager import KeywordManager
+from src.managers.similarity_manager import SimilarityManager
+from src.utils.search_engine import SearchEngine
 from src.utils.text_analyzer import TextAnalyzer
 
 class PromptManager:
@@ -8,6 +12,9 @@ class PromptManager:
     def __init__(self, database: PromptDatabase):
         self.database = database
         self.text_analyzer = TextAnalyzer()
+        self.duplicate_manager = DuplicateManager(database)
+        self.similarity_manager = SimilarityManager(database)
+        self.keyword_manager = KeywordManager(database)
 
     def create_prompt(self, data: Dict) -> int:
         """새 프롬프트 생성"""
@@ -29,12 +36,45 @@ class PromptManager:
                 filtered_data['prompt_content']
             ))
         
-        return self.database.save_prompt(filtered_data)
+        # 중복 탐지 색인은 프롬프트와 같은 트랜잭션에 저장
+        prompt_id = self.database.save_prompt(
+            filtered_data,
+            minhash=self.duplicate_manager.minhash(filtered_data.get('prompt_content') or '')
+        )
+        self._index_prompt(prompt_id, filtered_data)
+        
+        return prompt_id
 
     def update_prompt(self, prompt_id: int, data: Dict) -> bool:
         """프롬프트 업데이트"""
         data['stats'] = str(self.text_analyzer.count_stats(data['prompt_content']))
-        return self.database.update_prompt(prompt_id, data)
+        success = self.database.update_prompt(
+            prompt_id,
+            data,
+            minhash=self.duplicate_manager.minhash(data['prompt_content'] or '')
+        )
+        
+        if success:
+            self._index_prompt(prompt_id, self.database.get_prompt(prompt_id) or data)
+        
+        return success
+
+    def find_near_duplicates(
+        self,
+        prompt_content: str,
+        exclude_id: Optional[int] = None
+    ) -> List[Dict]:
+        """저장 전 유사 중복 프롬프트 확인"""
+        return self.duplicate_manager.find_near_duplicates(
+            prompt_content,
+            exclude_id=exclude_id
+        )
+
+    def _index_prompt(self, prompt_id: int, data: Dict):
+        """저장된 프롬프트의 검색용 인덱스 갱신 (중복 탐지 색인은 저장 때 함께 기록됨)"""
+        self.similarity_manager.index_prompt(prompt_id, data)
+        self.keyword_manager.index_prompt(prompt_id, data)
+        SearchEngine.for_database(self.database).add_document(prompt_id, data)
 
     def get_prompt(self, prompt_id: int) -> Optional[Dict]:
         """프롬프트 조회"""
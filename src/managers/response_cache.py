@@ -0,0 +1,85 @@
+from typing import Dict, Optional
+from datetime import datetime
+import hashlib
+import json
+from src.backends.base import ModelRequest, ModelResponse
+from src.database.database import PromptDatabase
+
+
+def is_deterministic(request: ModelRequest) -> bool:
+    """temperature 가 없거나 0 이면 결정적 요청"""
+    return (request.params.get('temperature') or 0) <= 0
+
+
+class ResponseCache:
+    """(모델, 프롬프트, 파라미터) 키 기반 모델 응답 캐시
+
+    temperature 가 0 보다 크면 반복마다 응답이 달라야 하므로 반복 번호도 키에 넣습니다.
+    그렇지 않으면 K 번 반복이 모두 같은 캐시 응답 하나로 겹쳐 일관성이 항상 1.0 이 됩니다.
+    """
+    
+    def __init__(
+        self,
+        database: PromptDatabase,
+        ttl_hours: float = 168,
+        max_mb: float = 256
+    ):
+        self.database = database
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_bytes = int(max_mb * 1024 * 1024)
+
+    @staticmethod
+    def make_key(request: ModelRequest) -> str:
+        """캐시 키 생성 (비결정적 요청은 반복 번호 포함)"""
+        payload = {
+            'model': request.model,
+            'prompt': request.prompt,
+            'params': request.params
+        }
+        if not is_deterministic(request):
+            payload['repetition'] = request.repetition
+        payload = json.dumps(
+            payload,
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, request: ModelRequest) -> Optional[ModelResponse]:
+        """캐시된 응답 조회"""
+        row = self.database.get_cached_response(
+            self.make_key(request),
+            datetime.now().timestamp() - self.ttl_seconds
+        )
+        if row is None:
+            return None
+        
+        return ModelResponse(
+            model=row['model'],
+            text=row['response'],
+            latency_ms=0.0,
+            input_tokens=row['input_tokens'],
+            output_tokens=row['output_tokens']
+        )
+
+    def put(self, request: ModelRequest, response: ModelResponse):
+        """응답 저장"""
+        self.database.save_cached_response({
+            'cache_key': self.make_key(request),
+            'model': request.model,
+            'params': json.dumps(request.params, sort_keys=True),
+            'response': response.text,
+            'input_tokens': response.input_tokens,
+            'output_tokens': response.output_tokens
+        })
+
+    def evict(self) -> int:
+        """TTL 및 용량 기준 정리"""
+        return self.database.evict_response_cache(
+            datetime.now().timestamp() - self.ttl_seconds,
+            self.max_bytes
+        )
+
+    def stats(self) -> Dict:
+        """캐시 항목 수 및 용량"""
+        return self.database.get_response_cache_stats()
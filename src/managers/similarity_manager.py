@@ -0,0 +1,377 @@
+from typing import Dict, List, Optional
+import threading
+import numpy as np
+from src.database.database import PromptDatabase
+from src.utils.vectorizer import HashingVectorizer
+
+# 유사도 벡터화 대상 필드
+VECTOR_FIELDS = ['title', 'description', 'query', 'prompt_content']
+
+# 동기화 뒤 삭제된 프롬프트를 빼고도 top_k 를 채우기 위한 여유분
+SUMMARY_MARGIN = 10
+
+
+class VectorIndex:
+    """프로세스 전역 해시 TF-IDF 벡터 인덱스
+    
+    데이터베이스 파일별로 하나만 생성되며, 모든 세션이 같은 행렬을 공유합니다.
+    프롬프트 벡터는 1024차원 중 수십 개만 0 이 아니므로 행 순서대로 (열 번호, 값)
+    항목을 이어 붙인 희소 배열로 보관합니다. 항목당 6바이트라 프롬프트 100만 건,
+    평균 40개 항목이면 약 240MB 입니다 (밀집 float32 행렬은 4GB).
+    
+    교체된 벡터가 원래 자리에 들어가지 않으면 보조 배열에 추가하고, 보조 배열이
+    커지면 전체를 행 순서로 다시 정리합니다.
+    """
+
+    _instances: Dict[str, 'VectorIndex'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, database: PromptDatabase, vectorizer: HashingVectorizer):
+        self.database = database
+        self.vectorizer = vectorizer
+        self._lock = threading.RLock()
+        self._clear()
+
+    def _clear(self):
+        """인덱스 비우기 (다음 동기화에서 저장된 벡터를 모두 다시 읽음)"""
+        col_type = np.min_scalar_type(self.vectorizer.n_features - 1)
+        # 행 순서 항목 배열 (행마다 slots 칸, 빈 칸은 값 0)
+        self._cols = np.zeros(0, dtype=col_type)
+        self._values = np.zeros(0, dtype=np.float32)
+        self._used = 0
+        # 자리를 옮긴 행의 보조 항목 배열
+        self._extra_cols = np.zeros(0, dtype=col_type)
+        self._extra_values = np.zeros(0, dtype=np.float32)
+        self._extra_rows = np.zeros(0, dtype=np.int32)
+        self._extra_used = 0
+        # 행별 정보
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._starts = np.zeros(0, dtype=np.int64)
+        self._slots = np.zeros(0, dtype=np.int32)
+        # 보조 배열로 옮긴 행: row -> (시작, 길이)
+        self._moved: Dict[int, tuple] = {}
+        self._rows: Dict[int, int] = {}
+        self._size = 0
+        self._doc_freq = np.zeros(self.vectorizer.n_features, dtype=np.int64)
+        self._synced_at = 0.0
+        self._checked_prompt_id = 0
+        self._change_seq = 0
+        self._weights: Optional[np.ndarray] = None
+        self._norms: Optional[np.ndarray] = None
+
+    @classmethod
+    def for_database(cls, database: PromptDatabase) -> 'VectorIndex':
+        """데이터베이스 파일별 공유 인덱스 반환"""
+        with cls._instances_lock:
+            index = cls._instances.get(database.db_path)
+            if index is None:
+                index = cls(database, HashingVectorizer())
+                cls._instances[database.db_path] = index
+            return index
+
+    def upsert(self, prompt_id: int, vector: np.ndarray):
+        """벡터 추가 또는 교체 (문서 빈도 증분 갱신)"""
+        cols = np.flatnonzero(vector)
+        values = vector[cols]
+        with self._lock:
+            row = self._rows.get(prompt_id)
+            if row is None:
+                self._append_row(prompt_id, cols, values)
+            else:
+                self._remove_entries(row)
+                start, slots = self._starts[row], self._slots[row]
+                if len(cols) <= slots:
+                    self._cols[start:start + len(cols)] = cols
+                    self._values[start:start + len(cols)] = values
+                else:
+                    self._append_extra(row, cols, values)
+            
+            self._doc_freq[cols] += 1
+            self._weights = None
+            
+            if self._extra_used > max(65536, self._used // 8):
+                self._compact()
+
+    def remove(self, prompt_id: int):
+        """삭제된 프롬프트 제외 (행 자리는 값 0 으로 남아 점수가 0 이 됨)"""
+        with self._lock:
+            row = self._rows.pop(prompt_id, None)
+            if row is None:
+                return
+            self._remove_entries(row)
+            self._weights = None
+
+    def sync(self):
+        """다른 프로세스에서 저장된 벡터, 벡터가 없는 신규 프롬프트, 삭제된 프롬프트 반영
+        
+        삭제는 prompt_changes 기록으로 찾고, 기록이 정리되어 일부를 빠뜨렸으면 인덱스를
+        비우고 저장된 벡터를 모두 다시 읽습니다.
+        """
+        with self._lock:
+            oldest, latest, changed = self.database.get_prompt_changes(self._change_seq)
+            missed = latest < self._change_seq or (oldest is not None and oldest > self._change_seq + 1)
+            if missed or not self._rows:
+                # 비어 있는 인덱스는 아래에서 전체를 읽으므로 변경 기록이 필요 없음
+                self._clear()
+                changed = []
+            
+            for prompt_id, data, updated_at in self.database.get_vectors(self._synced_at):
+                self.upsert(prompt_id, self.vectorizer.from_bytes(data))
+                self._synced_at = max(self._synced_at, updated_at)
+            
+            # 벡터 없이 저장된 프롬프트 (레거시 화면 등) 색인
+            max_prompt_id = self.database.get_max_prompt_id()
+            if max_prompt_id > self._checked_prompt_id:
+                pending = []
+                for row in self.database.get_prompts_without_vectors(self._checked_prompt_id):
+                    vector = self.vectorizer.transform_fields(
+                        row.get(field) for field in VECTOR_FIELDS
+                    )
+                    self.upsert(row['id'], vector)
+                    pending.append((row['id'], self.vectorizer.to_bytes(vector)))
+                if pending:
+                    self.database.save_vectors(pending)
+                self._checked_prompt_id = max_prompt_id
+            
+            if changed:
+                existing = self.database.get_prompt_summaries(changed)
+                for prompt_id in changed:
+                    if prompt_id not in existing:
+                        self.remove(prompt_id)
+            self._change_seq = latest
+
+    def query(
+        self,
+        vector: np.ndarray,
+        top_k: int = 10,
+        exclude_id: Optional[int] = None
+    ) -> List[tuple]:
+        """코사인 유사도 상위 k개 (prompt_id, score) 목록"""
+        with self._lock:
+            if self._size == 0:
+                return []
+            
+            weights, norms = self._get_weights()
+            ids = self._ids[:self._size]
+            
+            weighted_query = vector * weights
+            query_norm = np.linalg.norm(weighted_query)
+            if query_norm == 0:
+                return []
+            
+            # 행렬-벡터 곱: (M * w) . (q * w) = M . (q * w^2)
+            scores = self._row_sums(weighted_query * weights)
+            scores /= norms * query_norm
+            
+            if exclude_id is not None and exclude_id in self._rows:
+                scores[self._rows[exclude_id]] = -1.0
+            
+            k = min(top_k, self._size)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            
+            return [
+                (int(ids[i]), float(scores[i]))
+                for i in top
+                if scores[i] > 0
+            ]
+
+    def get_vector(self, prompt_id: int) -> Optional[np.ndarray]:
+        """저장된 프롬프트 벡터 조회"""
+        with self._lock:
+            row = self._rows.get(prompt_id)
+            if row is None:
+                return None
+            if row in self._moved:
+                start, length = self._moved[row]
+                cols = self._extra_cols[start:start + length]
+                values = self._extra_values[start:start + length]
+            else:
+                start = self._starts[row]
+                cols = self._cols[start:start + self._slots[row]]
+                values = self._values[start:start + self._slots[row]]
+            vector = np.zeros(self.vectorizer.n_features, dtype=np.float32)
+            vector[cols[values != 0]] = values[values != 0]
+            return vector
+
+    def _row_sums(self, column_weights: np.ndarray, squared: bool = False) -> np.ndarray:
+        """행마다 sum(값 * column_weights[열]) (squared 면 값 대신 값^2)"""
+        values = self._values[:self._used]
+        extra_values = self._extra_values[:self._extra_used]
+        if squared:
+            values, extra_values = values * values, extra_values * extra_values
+        
+        products = values * column_weights[self._cols[:self._used]]
+        # 행마다 한 칸 이상이라 시작 위치가 겹치지 않음
+        sums = np.add.reduceat(products, self._starts[:self._size])
+        if self._extra_used:
+            sums += np.bincount(
+                self._extra_rows[:self._extra_used],
+                weights=extra_values * column_weights[self._extra_cols[:self._extra_used]],
+                minlength=self._size
+            ).astype(np.float32)
+        return sums
+
+    def _get_weights(self):
+        """IDF 가중치 및 행 노름 (변경 시에만 재계산)"""
+        if self._weights is None:
+            self._weights = (
+                np.log((1 + len(self._rows)) / (1 + self._doc_freq)) + 1.0
+            ).astype(np.float32)
+            self._norms = np.sqrt(self._row_sums(self._weights ** 2, squared=True))
+            self._norms[self._norms == 0] = 1.0
+        return self._weights, self._norms
+
+    def _append_row(self, prompt_id: int, cols: np.ndarray, values: np.ndarray):
+        """새 행을 배열 끝에 추가 (빈 벡터도 한 칸 차지)"""
+        self._ensure_rows(self._size + 1)
+        row = self._size
+        slots = max(len(cols), 1)
+        self._ensure_entries(self._used + slots)
+        self._cols[self._used:self._used + len(cols)] = cols
+        self._values[self._used:self._used + len(cols)] = values
+        self._ids[row] = prompt_id
+        self._starts[row] = self._used
+        self._slots[row] = slots
+        self._rows[prompt_id] = row
+        self._used += slots
+        self._size += 1
+
+    def _append_extra(self, row: int, cols: np.ndarray, values: np.ndarray):
+        """원래 자리에 들어가지 않는 교체 벡터를 보조 배열에 추가"""
+        size = self._extra_used + len(cols)
+        if size > len(self._extra_cols):
+            capacity = max(size, len(self._extra_cols) * 2, 4096)
+            self._extra_cols = _grow(self._extra_cols, capacity, self._extra_used)
+            self._extra_values = _grow(self._extra_values, capacity, self._extra_used)
+            self._extra_rows = _grow(self._extra_rows, capacity, self._extra_used)
+        self._extra_cols[self._extra_used:size] = cols
+        self._extra_values[self._extra_used:size] = values
+        self._extra_rows[self._extra_used:size] = row
+        self._moved[row] = (self._extra_used, len(cols))
+        self._extra_used = size
+
+    def _remove_entries(self, row: int):
+        """교체되는 행의 예전 값을 0 으로 지우고 문서 빈도에서 제외"""
+        if row in self._moved:
+            start, length = self._moved.pop(row)
+            cols, values = self._extra_cols, self._extra_values
+        else:
+            start, length = self._starts[row], self._slots[row]
+            cols, values = self._cols, self._values
+        live = values[start:start + length] != 0
+        self._doc_freq[cols[start:start + length][live]] -= 1
+        values[start:start + length] = 0.0
+
+    def _compact(self):
+        """보조 배열의 항목까지 모아 행 순서로 다시 배치"""
+        size = self._size
+        main_rows = np.repeat(np.arange(size, dtype=np.int32), self._slots[:size])
+        live = self._values[:self._used] != 0
+        extra_live = self._extra_values[:self._extra_used] != 0
+        rows = np.concatenate((main_rows[live], self._extra_rows[:self._extra_used][extra_live]))
+        cols = np.concatenate((self._cols[:self._used][live], self._extra_cols[:self._extra_used][extra_live]))
+        values = np.concatenate((self._values[:self._used][live], self._extra_values[:self._extra_used][extra_live]))
+        
+        order = np.argsort(rows, kind='stable')
+        rows, cols, values = rows[order], cols[order], values[order]
+        counts = np.bincount(rows, minlength=size)
+        slots = np.maximum(counts, 1)
+        starts = np.concatenate(([0], np.cumsum(slots)[:-1]))
+        # 행 안에서의 순번만큼 행 시작 위치에서 떨어진 칸에 배치
+        positions = starts[rows] + np.arange(len(rows)) - (np.cumsum(counts) - counts)[rows]
+        
+        total = int(slots.sum())
+        self._cols = np.zeros(max(total, 65536), dtype=self._cols.dtype)
+        self._values = np.zeros(max(total, 65536), dtype=np.float32)
+        self._cols[positions] = cols
+        self._values[positions] = values
+        self._used = total
+        self._starts[:size] = starts
+        self._slots[:size] = slots
+        self._extra_used = 0
+        self._moved.clear()
+
+    def _ensure_entries(self, size: int):
+        """항목 배열 용량을 두 배씩 확장"""
+        capacity = len(self._cols)
+        if size <= capacity:
+            return
+        new_capacity = max(size, capacity * 2, 65536)
+        self._cols = _grow(self._cols, new_capacity, self._used)
+        self._values = _grow(self._values, new_capacity, self._used)
+
+    def _ensure_rows(self, size: int):
+        """행 배열 용량을 두 배씩 확장"""
+        capacity = len(self._ids)
+        if size <= capacity:
+            return
+        new_capacity = max(size, capacity * 2, 1024)
+        self._ids = _grow(self._ids, new_capacity, self._size)
+        self._starts = _grow(self._starts, new_capacity, self._size)
+        self._slots = _grow(self._slots, new_capacity, self._size)
+
+
+def _grow(array: np.ndarray, capacity: int, used: int) -> np.ndarray:
+    grown = np.zeros(capacity, dtype=array.dtype)
+    grown[:used] = array[:used]
+    return grown
+
+
+class SimilarityManager:
+    """유사 프롬프트 상위 k개 검색을 담당하는 클래스"""
+    
+    def __init__(self, database: PromptDatabase):
+        self.database = database
+        self.index = VectorIndex.for_database(database)
+
+    def index_prompt(self, prompt_id: int, data: Dict):
+        """프롬프트 벡터 계산 및 저장"""
+        vector = self.index.vectorizer.transform_fields(
+            data.get(field) for field in VECTOR_FIELDS
+        )
+        self.database.save_vectors([(prompt_id, self.index.vectorizer.to_bytes(vector))])
+        self.index.upsert(prompt_id, vector)
+
+    def find_similar(self, prompt_id: int, top_k: int = 10) -> List[Dict]:
+        """지정한 프롬프트와 유사한 프롬프트 조회"""
+        self.index.sync()
+        vector = self.index.get_vector(prompt_id)
+        if vector is None:
+            return []
+        return self._with_summaries(
+            self.index.query(vector, top_k + SUMMARY_MARGIN, exclude_id=prompt_id), top_k
+        )
+
+    def find_similar_text(self, text: str, top_k: int = 10) -> List[Dict]:
+        """입력 텍스트와 유사한 프롬프트 조회"""
+        self.index.sync()
+        vector = self.index.vectorizer.transform(text)
+        return self._with_summaries(self.index.query(vector, top_k + SUMMARY_MARGIN), top_k)
+
+    def rebuild_index(self) -> int:
+        """전체 프롬프트 벡터 재계산 (배치 작업)"""
+        count = 0
+        batch = []
+        for row in self.database.iter_prompt_texts():
+            vector = self.index.vectorizer.transform_fields(
+                row.get(field) for field in VECTOR_FIELDS
+            )
+            self.index.upsert(row['id'], vector)
+            batch.append((row['id'], self.index.vectorizer.to_bytes(vector)))
+            count += 1
+            if len(batch) >= 1000:
+                self.database.save_vectors(batch)
+                batch = []
+        if batch:
+            self.database.save_vectors(batch)
+        return count
+
+    def _with_summaries(self, matches: List[tuple], top_k: int) -> List[Dict]:
+        """검색 결과에 프롬프트 기본 정보 추가 (동기화 뒤 삭제된 프롬프트는 빼고 top_k 개)"""
+        summaries = self.database.get_prompt_summaries([pid for pid, _ in matches])
+        return [
+            {**summaries[prompt_id], 'similarity': score}
+            for prompt_id, score in matches
+            if prompt_id in summaries
+        ][:top_k]
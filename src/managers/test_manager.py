@@ -1,24 +1,209 @@
-from typing import List, Dict, Optional
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Set, Union
+import json
+from src.backends.base import ModelRequest
+from src.backends.registry import create_backends
+from src.database.database import PromptDatabase
+from src.managers.response_cache import ResponseCache
+from src.managers.test_runner import ConsistencyTestRunner, summarize_cache
+from src.utils.config import Config
+from src.utils.consistency import ConsistencyAnalyzer
+from src.utils.instrumentation import instrumented
+from src.utils.rule_engine import RuleEngine
+from src.utils.template_matrix import TestMatrix, render_template, template_variables
 from src.utils.text_analyzer import TextAnalyzer
 
 class TestManager:
     """프롬프트 테스트를 담당하는 클래스"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        database: Optional[PromptDatabase] = None
+    ):
         self.text_analyzer = TextAnalyzer()
+        self.consistency_analyzer = ConsistencyAnalyzer()
+        self.config = config or Config()
+        self.rule_engine = RuleEngine(self.config.get('validation.rules'))
+        self.backends = create_backends(self.config.get('models', {'stub': {'backend': 'stub'}}))
+        
+        self.cache = None
+        if database is not None and self.config.get('cache.enabled', True):
+            self.cache = ResponseCache(
+                database,
+                ttl_hours=self.config.get('cache.ttl_hours', 168),
+                max_mb=self.config.get('cache.max_mb', 256)
+            )
+        
+        self.runner = ConsistencyTestRunner(
+            self.backends,
+            max_retries=self.config.get('execution.max_retries', 3),
+            max_in_flight=self.config.get('execution.max_in_flight', 64),
+            cache=self.cache
+        )
+
+    def available_models(self) -> List[str]:
+        """테스트에 사용할 수 있는 모델 목록"""
+        return list(self.backends.keys())
+
+    def build_requests(
+        self,
+        prompt: str,
+        test_cases: Iterable[str],
+        models: List[str],
+        repetitions: int = 1,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[ModelRequest]:
+        """테스트 케이스 x 모델 x 반복 횟수 요청 생성"""
+        for index, test in enumerate(test_cases):
+            combined_prompt = f"{prompt}\n\nTest Input: {test}"
+            for model in models:
+                for repetition in range(repetitions):
+                    yield ModelRequest(
+                        model=model,
+                        prompt=combined_prompt,
+                        params=dict(params or {}),
+                        test_index=index,
+                        test_input=test,
+                        repetition=repetition
+                    )
+
+    def get_template_variables(self, template: str) -> Set[str]:
+        """프롬프트 템플릿의 변수 이름"""
+        return template_variables(template)
+
+    def create_test_matrix(self, spec: Union[str, Dict, IO]) -> TestMatrix:
+        """JSON 정의 또는 CSV/JSONL 파일로 테스트 매트릭스 생성"""
+        if isinstance(spec, (str, dict)):
+            return TestMatrix.from_spec(spec)
+        return TestMatrix.from_file(spec)
+
+    def build_matrix_requests(
+        self,
+        template: str,
+        matrix: TestMatrix,
+        models: List[str],
+        repetitions: int = 1,
+        params: Optional[Dict[str, Any]] = None,
+        sample: Optional[int] = None,
+        seed: int = 0
+    ) -> Iterator[ModelRequest]:
+        """템플릿 변수 매트릭스의 조합별 요청을 지연 생성"""
+        for index, variables in enumerate(matrix.iter_cases(sample, seed)):
+            rendered = render_template(template, variables)
+            test_input = json.dumps(variables, ensure_ascii=False)
+            for model in models:
+                for repetition in range(repetitions):
+                    yield ModelRequest(
+                        model=model,
+                        prompt=rendered,
+                        params=dict(params or {}),
+                        test_index=index,
+                        test_input=test_input,
+                        repetition=repetition
+                    )
+
+    def iter_matrix_test(
+        self,
+        template: str,
+        matrix: TestMatrix,
+        models: Optional[List[str]] = None,
+        repetitions: int = 1,
+        params: Optional[Dict[str, Any]] = None,
+        sample: Optional[int] = None,
+        seed: int = 0,
+        use_cache: bool = True
+    ) -> Iterator[Dict]:
+        """템플릿 매트릭스 테스트 실행 (완료되는 순서대로 결과 반환)"""
+        requests = self.build_matrix_requests(
+            template,
+            matrix,
+            models or ['stub'],
+            repetitions,
+            params,
+            sample,
+            seed
+        )
+        for result in self.runner.iter_results(requests, use_cache):
+            result['stats'] = self.text_analyzer.count_stats(result['response'] or '')
+            yield result
 
-    def run_consistency_test(self, prompt: str, test_cases: List[str]) -> List[Dict]:
+    def iter_consistency_test(
+        self,
+        prompt: str,
+        test_cases: Iterable[str],
+        models: Optional[List[str]] = None,
+        repetitions: int = 1,
+        params: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
+    ) -> Iterator[Dict]:
+        """일관성 테스트 실행 (완료되는 순서대로 결과 반환)"""
+        requests = self.build_requests(
+            prompt,
+            test_cases,
+            models or ['stub'],
+            repetitions,
+            params
+        )
+        for result in self.runner.iter_results(requests, use_cache):
+            result['stats'] = self.text_analyzer.count_stats(result['response'] or '')
+            yield result
+
+    def run_consistency_test(
+        self,
+        prompt: str,
+        test_cases: List[str],
+        models: Optional[List[str]] = None,
+        repetitions: int = 1,
+        params: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
+    ) -> List[Dict]:
         """일관성 테스트 실행"""
-        results = []
-        for test in test_cases:
-            result = {
-                'input': test,
-                'combined_prompt': f"{prompt}\n\nTest Input: {test}",
-                'stats': self.text_analyzer.count_stats(prompt)
-            }
-            results.append(result)
-        return results
+        results = list(self.iter_consistency_test(
+            prompt,
+            test_cases,
+            models,
+            repetitions,
+            params,
+            use_cache
+        ))
+        return sorted(
+            results,
+            key=lambda r: (r['test_index'], r['model'], r['repetition'])
+        )
+
+    def compute_consistency(self, responses: List[str]) -> Dict:
+        """반복 응답의 K x K 유사도 행렬 및 분산 통계"""
+        matrix = self.consistency_analyzer.similarity_matrix(responses)
+        return {
+            'matrix': matrix,
+            **self.consistency_analyzer.summarize(matrix)
+        }
+
+    def summarize_consistency(self, results: List[Dict]) -> List[Dict]:
+        """테스트 케이스 x 모델별 일관성 통계"""
+        groups = {}
+        for result in results:
+            if result.get('error') or result.get('response') is None:
+                continue
+            key = (result['test_index'], result['model'])
+            groups.setdefault(key, []).append(result)
+        
+        summaries = []
+        for (test_index, model), group in sorted(groups.items()):
+            group = sorted(group, key=lambda r: r['repetition'])
+            summaries.append({
+                'test_index': test_index,
+                'model': model,
+                'repetitions': [r['repetition'] for r in group],
+                **self.compute_consistency([r['response'] for r in group])
+            })
+        return summaries
 
+    def get_cache_summary(self, results: List[Dict]) -> Dict:
+        """테스트 실행의 캐시 적중률"""
+        return summarize_cache(results)
+
+    @instrumented('test_manager.compare_versions', rows=False)
     def compare_versions(
         self, 
         old_version: str, 
@@ -43,12 +228,5 @@ class TestManager:
         }
 
     def validate_prompt_structure(self, prompt: str) -> Dict[str, bool]:
-        """프롬프트 구조 유효성 검사"""
-        structure = {
-            'has_context': len(prompt.strip()) > 0,
-            'has_instruction': any(keyword in prompt.lower() 
-                                 for keyword in ['please', 'analyze', 'explain', 'describe']),
-            'has_example': '예시' in prompt or 'example' in prompt.lower(),
-            'has_format_specification': any(char in prompt for char in ['[', ']', '{', '}'])
-        }
-        return structure
\ No newline at end of file
+        """프롬프트 구조 유효성 검사 (설정의 validation.rules 기준)"""
+        return self.rule_engine.evaluate(prompt)
@@ -0,0 +1,256 @@
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+import asyncio
+import queue
+import threading
+import time
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter
+)
+from src.backends.base import (
+    ModelBackend,
+    ModelRequest,
+    ModelResponse,
+    RetryableBackendError
+)
+from src.managers.response_cache import ResponseCache
+
+
+class TokenBucket:
+    """비동기 토큰 버킷 속도 제한기"""
+
+    def __init__(self, rate_per_second: float, capacity: float = None):
+        self.rate = rate_per_second
+        self.capacity = capacity or max(1.0, rate_per_second)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        if self.rate <= 0:
+            return
+        
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class ConsistencyTestRunner:
+    """테스트 케이스 x 반복 횟수 요청을 동시에 실행하는 비동기 실행기"""
+
+    def __init__(
+        self,
+        backends: Dict[str, ModelBackend],
+        max_retries: int = 3,
+        max_in_flight: int = 64,
+        cache: Optional[ResponseCache] = None
+    ):
+        self.backends = backends
+        self.max_retries = max_retries
+        self.max_in_flight = max_in_flight
+        self.cache = cache
+
+    async def run(
+        self,
+        requests: Iterable[ModelRequest],
+        use_cache: bool = True
+    ) -> AsyncIterator[Dict]:
+        """요청을 동시에 실행하고 완료되는 순서대로 결과 반환
+        
+        입력은 지연 평가되며, 동시에 진행 중인 요청은 max_in_flight 개로 제한됩니다.
+        use_cache 가 False 이면 캐시를 읽지도 쓰지도 않습니다.
+        같은 캐시 키의 요청이 동시에 진행 중이면 백엔드는 한 번만 호출하고 결과를 나눠 씁니다.
+        """
+        cache = self.cache if use_cache else None
+        in_flight: Dict[str, asyncio.Future] = {}
+
+        semaphores = {
+            name: asyncio.Semaphore(backend.concurrency)
+            for name, backend in self.backends.items()
+        }
+        buckets = {
+            name: TokenBucket(backend.rate_per_second)
+            for name, backend in self.backends.items()
+        }
+        
+        pending = set()
+        request_iter = iter(requests)
+        exhausted = False
+        
+        while pending or not exhausted:
+            while not exhausted and len(pending) < self.max_in_flight:
+                request = next(request_iter, None)
+                if request is None:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(
+                    self._execute(request, semaphores, buckets, cache, in_flight)
+                ))
+            
+            if not pending:
+                break
+            
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+        
+        if cache is not None:
+            await asyncio.to_thread(cache.evict)
+
+    def iter_results(
+        self,
+        requests: Iterable[ModelRequest],
+        use_cache: bool = True
+    ) -> Iterator[Dict]:
+        """동기 코드(Streamlit 화면)에서 결과를 완료 순서대로 받는 브리지"""
+        results = queue.Queue(maxsize=self.max_in_flight)
+        stopped = threading.Event()
+        sentinel = object()
+        
+        def put(item) -> bool:
+            while not stopped.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def worker():
+            async def consume():
+                async for result in self.run(requests, use_cache):
+                    if not put(result):
+                        break
+            
+            try:
+                asyncio.run(consume())
+            except Exception as e:
+                put(e)
+            finally:
+                put(sentinel)
+        
+        threading.Thread(target=worker, daemon=True).start()
+        
+        try:
+            while True:
+                item = results.get()
+                if item is sentinel:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # 소비자가 중간에 멈추면 작업 스레드도 종료
+            stopped.set()
+
+    async def _execute(
+        self,
+        request: ModelRequest,
+        semaphores: Dict,
+        buckets: Dict,
+        cache: Optional[ResponseCache],
+        in_flight: Dict[str, asyncio.Future]
+    ) -> Dict:
+        """단일 요청 실행 (캐시 조회, 동시성 제한, 속도 제한, 재시도)"""
+        result = {
+            'test_index': request.test_index,
+            'input': request.test_input,
+            'combined_prompt': request.prompt,
+            'model': request.model,
+            'repetition': request.repetition,
+            'response': None,
+            'latency_ms': None,
+            'error': None,
+            'cached': False
+        }
+        
+        backend = self.backends.get(request.model)
+        if backend is None:
+            result['error'] = f"등록되지 않은 모델입니다: {request.model}"
+            return result
+        
+        try:
+            if cache is None:
+                response = await self._generate(backend, request, semaphores, buckets)
+            else:
+                key = cache.make_key(request)
+                task = in_flight.get(key)
+                shared = task is not None
+                if task is None:
+                    task = asyncio.ensure_future(
+                        self._cached_generate(backend, request, semaphores, buckets, cache)
+                    )
+                    in_flight[key] = task
+                    task.add_done_callback(lambda _: in_flight.pop(key, None))
+                response, cached = await task
+                result['cached'] = cached or shared
+            
+            result['response'] = response.text
+            result['latency_ms'] = response.latency_ms
+            result['input_tokens'] = response.input_tokens
+            result['output_tokens'] = response.output_tokens
+        except Exception as e:
+            result['error'] = str(e)
+        
+        return result
+
+    async def _cached_generate(
+        self,
+        backend: ModelBackend,
+        request: ModelRequest,
+        semaphores: Dict,
+        buckets: Dict,
+        cache: ResponseCache
+    ) -> Tuple[ModelResponse, bool]:
+        """캐시 조회 후 없으면 백엔드 호출 결과를 저장 (응답, 캐시 적중 여부)"""
+        response = await asyncio.to_thread(cache.get, request)
+        if response is not None:
+            return response, True
+        
+        response = await self._generate(backend, request, semaphores, buckets)
+        await asyncio.to_thread(cache.put, request, response)
+        return response, False
+
+    async def _generate(
+        self,
+        backend: ModelBackend,
+        request: ModelRequest,
+        semaphores: Dict,
+        buckets: Dict
+    ) -> ModelResponse:
+        """백엔드 호출 (동시성 제한, 속도 제한, 재시도)"""
+        async with semaphores[request.model]:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(self.max_retries),
+                wait=wait_exponential_jitter(initial=1, max=30),
+                retry=retry_if_exception_type(RetryableBackendError),
+                reraise=True
+            ):
+                with attempt:
+                    await buckets[request.model].acquire()
+                    return await backend.generate(request)
+
+
+def summarize_cache(results: List[Dict]) -> Dict:
+    """테스트 실행 단위 캐시 적중률"""
+    requests = len(results)
+    hits = sum(1 for result in results if result.get('cached'))
+    return {
+        'requests': requests,
+        'hits': hits,
+        'hit_ratio': hits / requests if requests else 0.0
+    }
@@ -0,0 +1,68 @@
+from typing import Dict, List, Optional
+import hashlib
+import time
+import pandas as pd
+from src.database.database import PromptDatabase
+from src.utils.rule_engine import RuleEngine
+
+
+def prompt_hash(prompt_content: Optional[str]) -> str:
+    """검사 대상 본문 해시"""
+    return hashlib.blake2b((prompt_content or '').encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ValidationManager:
+    """프롬프트 구조 규칙 검사를 담당하는 클래스"""
+
+    def __init__(self, database: PromptDatabase, rules: Optional[List[Dict]] = None):
+        self.database = database
+        self.engine = RuleEngine(rules)
+
+    def validate(self, prompt: str) -> Dict[str, bool]:
+        """단일 프롬프트 규칙 검사"""
+        return self.engine.evaluate(prompt)
+
+    def validate_library(self, batch_size: int = 1000, force: bool = False) -> Dict:
+        """전체 라이브러리 규칙 검사 (한 번의 스트리밍 순회)
+
+        본문이나 규칙 집합이 바뀐 프롬프트만 다시 검사합니다.
+        """
+        start = time.perf_counter()
+        version = self.engine.version
+        known = {} if force else self.database.get_rule_hashes(version)
+        counts = {'total': 0, 'validated': 0}
+        failures = dict.fromkeys(self.engine.rule_names, 0)
+
+        batch = []
+        for row in self.database.iter_prompt_texts(fields=['prompt_content']):
+            counts['total'] += 1
+            digest = prompt_hash(row['prompt_content'])
+            if known.get(row['id']) == digest:
+                continue
+
+            rules = self.engine.evaluate(row['prompt_content'])
+            for name, passed in rules.items():
+                if not passed:
+                    failures[name] += 1
+            batch.append({'prompt_id': row['id'], 'content_hash': digest, 'rules': rules})
+            counts['validated'] += 1
+
+            if len(batch) >= batch_size:
+                self.database.save_rule_results(version, batch)
+                batch = []
+
+        if batch:
+            self.database.save_rule_results(version, batch)
+
+        return {
+            'ruleset_version': version,
+            'total': counts['total'],
+            'validated': counts['validated'],
+            'skipped': counts['total'] - counts['validated'],
+            'failures': failures,
+            'duration_sec': round(time.perf_counter() - start, 3)
+        }
+
+    def get_summary(self) -> pd.DataFrame:
+        """규칙별 통과/위반 건수"""
+        return self.database.get_rule_summary()
@@ -1,6 +1,6 @@
 from typing import Dict, Any
-import yaml
 import os
+from src.utils.rule_engine import DEFAULT_RULES
 
 class Config:
     """설정 관리 클래스"""
@@ -8,7 +8,13 @@ class Config:
     DEFAULT_CONFIG = {
         'database': {
             'path': 'prompts.db',
-            'backup_path': 'backups/'
+            'backup_path': 'backups/',
+            # 0 이면 자동 백업 안 함
+            'backup_interval_hours': 24,
+            'backup_keep': 7,
+            'backup_step_pages': 1024,
+            'backup_step_sleep_ms': 50,
+            'backup_verify': 'quick'
         },
         'similarity': {
             'threshold': 0.8,
@@ -21,6 +27,75 @@ class Config:
         'ui': {
             'theme': 'light',
             'page_size': 20
+        },
+        'models': {
+            'stub': {
+                'backend': 'stub',
+                'concurrency': 16,
+                'rate_per_second': 0
+            },
+            'GPT-3.5': {
+                'backend': 'openai',
+                'model': 'gpt-3.5-turbo',
+                'api_key_env': 'OPENAI_API_KEY',
+                'concurrency': 4,
+                'rate_per_second': 2
+            },
+            '클로드': {
+                'backend': 'claude',
+                'model': 'claude-3-5-sonnet-latest',
+                'api_key_env': 'ANTHROPIC_API_KEY',
+                'concurrency': 4,
+                'rate_per_second': 2
+            }
+        },
+        'execution': {
+            'max_retries': 3,
+            'max_in_flight': 64,
+            'repetitions': 1
+        },
+        'cache': {
+            'enabled': True,
+            'ttl_hours': 168,
+            'max_mb': 256
+        },
+        'validation': {
+            'rules': DEFAULT_RULES
+        },
+        'instrumentation': {
+            'enabled': True,
+            'prometheus_file': None,
+            'export_interval_sec': 15,
+            'http_host': '127.0.0.1',
+            'http_port': None
+        },
+        'query_tracing': {
+            'enabled': True,
+            'slow_query_ms': 100,
+            'max_slow_queries': 1000
+        },
+        'profiling': {
+            'enabled': False,
+            'directory': 'profiles/',
+            'top_n': 30,
+            'sample_interval_ms': 5,
+            'keep': 50
+        },
+        'memory': {
+            'enabled': True,
+            'trace_reruns': False,
+            'trace_frames': 1,
+            'top_n': 15,
+            'max_read_rows': None,
+            'max_read_mb': 256,
+            'on_exceed': 'project'
+        },
+        'compression': {
+            'enabled': False,
+            'min_bytes': 4096,
+            'level': 6,
+            'use_dictionary': True,
+            'dictionary_kb': 32
         }
     }
 
@@ -31,6 +106,8 @@ class Config:
     def _load_config(self) -> Dict[str, Any]:
         """설정 파일 로드"""
         if os.path.exists(self.config_path):
+            import yaml
+            
             with open(self.config_path, 'r', encoding='utf-8') as f:
                 return yaml.safe_load(f)
         return self.DEFAULT_CONFIG
@@ -61,5 +138,7 @@ class Config:
 
     def _save_config(self):
         """설정 파일 저장"""
+        import yaml
+        
         with open(self.config_path, 'w', encoding='utf-8') as f:
             yaml.dump(self.config, f, allow_unicode=True)
\ No newline at end of file
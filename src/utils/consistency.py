@@ -0,0 +1,140 @@
+from typing import Dict, List
+import numpy as np
+from .tokenizer import normalize_text
+
+# n-gram 해시용 승수
+HASH_BASE = np.uint64(1_000_003)
+
+
+class ConsistencyAnalyzer:
+    """반복 응답 간 K x K 유사도 행렬 및 분산 통계 계산 클래스"""
+
+    def __init__(
+        self,
+        ngram_size: int = 3,
+        n_features: int = 1 << 14,
+        short_length: int = 200
+    ):
+        self.ngram_size = ngram_size
+        self.n_features = n_features
+        # 이 글자 수 이하인 짧은 답변끼리는 편집 거리도 함께 반영
+        self.short_length = short_length
+
+    def similarity_matrix(self, responses: List[str]) -> np.ndarray:
+        """해시 문자 n-gram 코사인 (+짧은 답변의 정규화 편집 거리) 유사도 행렬"""
+        texts = [normalize_text(text) for text in responses]
+        size = len(texts)
+        if size == 0:
+            return np.zeros((0, 0))
+        
+        vectors = np.zeros((size, self.n_features), dtype=np.float32)
+        for i, text in enumerate(texts):
+            indices = self._ngram_hashes(text)
+            if len(indices):
+                vectors[i] = np.bincount(indices, minlength=self.n_features)
+        
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        vectors /= norms
+        matrix = (vectors @ vectors.T).astype(np.float64)
+        
+        # 빈 응답끼리는 동일, 빈 응답과 나머지는 상이
+        empty = np.array([not text for text in texts])
+        matrix[np.ix_(empty, empty)] = 1.0
+        
+        lengths = np.array([len(text) for text in texts])
+        short = np.flatnonzero(lengths <= self.short_length)
+        if len(short) > 1:
+            edit = self._edit_similarity([texts[i] for i in short])
+            block = np.ix_(short, short)
+            matrix[block] = (matrix[block] + edit) / 2
+        
+        np.fill_diagonal(matrix, 1.0)
+        return np.clip(matrix, 0.0, 1.0)
+
+    def summarize(self, matrix: np.ndarray) -> Dict:
+        """평균 쌍별 유사도, 분산, 이상치 응답"""
+        size = matrix.shape[0]
+        if size < 2:
+            return {
+                'count': size,
+                'mean_similarity': 1.0,
+                'std_similarity': 0.0,
+                'min_similarity': 1.0,
+                'response_scores': [1.0] * size,
+                'outliers': []
+            }
+        
+        upper = matrix[np.triu_indices(size, k=1)]
+        # 각 응답의 나머지 응답과의 평균 유사도
+        response_scores = (matrix.sum(axis=1) - 1.0) / (size - 1)
+        
+        median = np.median(response_scores)
+        mad = max(np.median(np.abs(response_scores - median)) * 1.4826, 0.02)
+        outliers = np.flatnonzero(response_scores < median - 2 * mad) if size >= 3 else []
+        
+        return {
+            'count': size,
+            'mean_similarity': float(upper.mean()),
+            'std_similarity': float(upper.std()),
+            'min_similarity': float(upper.min()),
+            'response_scores': response_scores.tolist(),
+            'outliers': [int(i) for i in outliers]
+        }
+
+    def _ngram_hashes(self, text: str) -> np.ndarray:
+        """문자 n-gram 롤링 해시 (벡터화)"""
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+        n = self.ngram_size
+        if len(codes) < n:
+            # n 보다 짧은 텍스트는 전체를 하나의 n-gram 으로 취급
+            n = len(codes)
+        if n == 0:
+            return np.zeros(0, dtype=np.int64)
+        
+        hashes = np.zeros(len(codes) - n + 1, dtype=np.uint64)
+        for offset in range(n):
+            hashes = hashes * HASH_BASE + codes[offset:len(codes) - n + 1 + offset]
+        return (hashes % np.uint64(self.n_features)).astype(np.int64)
+
+    def _edit_similarity(self, texts: List[str]) -> np.ndarray:
+        """짧은 답변 전체 쌍의 1 - 정규화 레벤슈타인 거리
+        
+        모든 쌍을 한 번에 진행하며, 행 내부 의존성 D[i][j-1] + 1 은
+        j + 누적최솟값(후보[k] - k) 로 계산합니다.
+        """
+        size = len(texts)
+        first, second = np.triu_indices(size, k=1)
+        lengths = np.array([len(text) for text in texts])
+        width = max(int(lengths.max()), 1)
+        
+        codes = np.full((size, width), -1, dtype=np.int32)
+        for i, text in enumerate(texts):
+            if text:
+                codes[i, :len(text)] = np.frombuffer(text.encode('utf-32-le'), dtype=np.int32)
+        
+        a, b = codes[first], codes[second]
+        len_a, len_b = lengths[first], lengths[second]
+        pairs = np.arange(len(first))
+        columns = np.arange(width + 1, dtype=np.int32)
+        
+        previous = np.tile(columns, (len(first), 1))
+        distance = np.where(len_a == 0, len_b, 0)
+        
+        for i in range(1, width + 1):
+            cost = (a[:, i - 1:i] != b).astype(np.int32)
+            candidate = np.empty_like(previous)
+            candidate[:, 0] = i
+            candidate[:, 1:] = np.minimum(previous[:, 1:] + 1, previous[:, :-1] + cost)
+            current = columns + np.minimum.accumulate(candidate - columns, axis=1)
+            
+            done = len_a == i
+            distance[done] = current[pairs[done], len_b[done]]
+            previous = current
+        
+        longest = np.maximum(np.maximum(len_a, len_b), 1)
+        similarity = np.eye(size)
+        values = 1.0 - distance / longest
+        similarity[first, second] = values
+        similarity[second, first] = values
+        return similarity
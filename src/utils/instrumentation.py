@@ -0,0 +1,363 @@
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+import inspect
+import os
+import threading
+import time
+from time import perf_counter
+
+# 지연 시간 히스토그램 구간 상한 (초)
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+METRIC_PREFIX = 'prompt_tool'
+
+
+class OperationStats:
+    """작업 하나의 누적 지표 (호출 수, 오류 수, 지연 시간 히스토그램, 행 수)"""
+
+    __slots__ = ('calls', 'errors', 'total_seconds', 'max_seconds', 'rows', 'buckets')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.rows = 0
+        # 마지막 칸은 가장 큰 구간을 넘는 호출 (+Inf)
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def quantile(self, q: float) -> float:
+        """히스토그램으로 추정한 분위수 (해당 구간의 상한)"""
+        if not self.calls:
+            return 0.0
+        target = q * self.calls
+        seen = 0
+        for upper, count in zip(LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if seen >= target:
+                return min(upper, self.max_seconds)
+        return self.max_seconds
+
+
+class MetricsRegistry:
+    """프로세스 안에서 작업별 지표를 모으는 클래스
+
+    호출 경로에서는 (작업, 시간, 행 수, 오류) 튜플을 큐에 넣기만 하고 (deque.append 는
+    잠금 없이 스레드 안전), 히스토그램 집계는 조회할 때나 큐가 찼을 때 한 번에 합니다.
+    enabled 가 False 이면 계측된 함수는 시간 측정 없이 바로 호출됩니다.
+    """
+
+    # 집계하지 않고 쌓아 둘 최대 기록 수
+    PENDING_LIMIT = 4096
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._operations: Dict[str, OperationStats] = {}
+        self._pending = deque()
+
+    def record(self, name: str, seconds: float, rows: Optional[int] = None, error: bool = False):
+        """호출 한 건 기록"""
+        self._pending.append((name, seconds, rows, error))
+        if len(self._pending) >= self.PENDING_LIMIT:
+            self.flush()
+
+    def flush(self):
+        """쌓인 기록을 작업별 지표에 반영"""
+        with self._lock:
+            pending = self._pending
+            operations = self._operations
+            while pending:
+                try:
+                    name, seconds, rows, error = pending.popleft()
+                except IndexError:
+                    break
+                stats = operations.get(name)
+                if stats is None:
+                    stats = operations[name] = OperationStats()
+                stats.calls += 1
+                stats.total_seconds += seconds
+                stats.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+                if seconds > stats.max_seconds:
+                    stats.max_seconds = seconds
+                if error:
+                    stats.errors += 1
+                if rows:
+                    stats.rows += rows
+
+    @contextmanager
+    def timer(self, name: str):
+        """블록 실행 시간 기록 (yield 한 dict 의 'rows' 에 행 수를 넣을 수 있음)"""
+        if not self.enabled:
+            yield {}
+            return
+
+        context = {}
+        start = perf_counter()
+        try:
+            yield context
+        except BaseException:
+            self.record(name, perf_counter() - start, context.get('rows'), error=True)
+            raise
+        self.record(name, perf_counter() - start, context.get('rows'))
+
+    def snapshot(self) -> List[Dict]:
+        """작업별 지표 목록 (누적 시간 내림차순)"""
+        self.flush()
+        with self._lock:
+            items = [(name, self._copy(stats)) for name, stats in self._operations.items()]
+
+        rows = []
+        for name, stats in items:
+            rows.append({
+                'operation': name,
+                'calls': stats.calls,
+                'errors': stats.errors,
+                'rows': stats.rows,
+                'total_ms': round(stats.total_seconds * 1000, 2),
+                'mean_ms': round(stats.total_seconds / stats.calls * 1000, 3),
+                'p50_ms': round(stats.quantile(0.5) * 1000, 3),
+                'p95_ms': round(stats.quantile(0.95) * 1000, 3),
+                'p99_ms': round(stats.quantile(0.99) * 1000, 3),
+                'max_ms': round(stats.max_seconds * 1000, 3)
+            })
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+    def reset(self):
+        """누적 지표 초기화"""
+        with self._lock:
+            self._pending.clear()
+            self._operations.clear()
+            self.started_at = time.time()
+
+    @staticmethod
+    def _copy(stats: OperationStats) -> OperationStats:
+        copied = OperationStats()
+        for field in OperationStats.__slots__:
+            value = getattr(stats, field)
+            setattr(copied, field, list(value) if isinstance(value, list) else value)
+        return copied
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 형식 내보내기"""
+        self.flush()
+        with self._lock:
+            items = sorted(
+                (name, self._copy(stats)) for name, stats in self._operations.items()
+            )
+
+        lines = [
+            f'# HELP {METRIC_PREFIX}_calls_total Instrumented operation calls.',
+            f'# TYPE {METRIC_PREFIX}_calls_total counter'
+        ]
+        lines += [
+            f'{METRIC_PREFIX}_calls_total{{operation="{name}"}} {stats.calls}'
+            for name, stats in items
+        ]
+        lines += [
+            f'# HELP {METRIC_PREFIX}_errors_total Instrumented operation failures.',
+            f'# TYPE {METRIC_PREFIX}_errors_total counter'
+        ]
+        lines += [
+            f'{METRIC_PREFIX}_errors_total{{operation="{name}"}} {stats.errors}'
+            for name, stats in items
+        ]
+        lines += [
+            f'# HELP {METRIC_PREFIX}_rows_total Rows returned by instrumented operations.',
+            f'# TYPE {METRIC_PREFIX}_rows_total counter'
+        ]
+        lines += [
+            f'{METRIC_PREFIX}_rows_total{{operation="{name}"}} {stats.rows}'
+            for name, stats in items
+        ]
+        lines += [
+            f'# HELP {METRIC_PREFIX}_latency_seconds Instrumented operation latency.',
+            f'# TYPE {METRIC_PREFIX}_latency_seconds histogram'
+        ]
+        for name, stats in items:
+            cumulative = 0
+            for upper, count in zip(LATENCY_BUCKETS + ('+Inf',), stats.buckets):
+                cumulative += count
+                lines.append(
+                    f'{METRIC_PREFIX}_latency_seconds_bucket'
+                    f'{{operation="{name}",le="{upper}"}} {cumulative}'
+                )
+            lines.append(
+                f'{METRIC_PREFIX}_latency_seconds_sum{{operation="{name}"}} {stats.total_seconds:.6f}'
+            )
+            lines.append(
+                f'{METRIC_PREFIX}_latency_seconds_count{{operation="{name}"}} {stats.calls}'
+            )
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str):
+        """Prometheus 텍스트 파일 저장 (node_exporter textfile 수집기용, 원자적 교체)"""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        os.replace(temp_path, path)
+
+
+# 프로세스 공용 지표 저장소
+metrics = MetricsRegistry()
+
+
+def count_rows(result) -> Optional[int]:
+    """반환값의 행 수 (DataFrame/리스트, (결과, 전체 건수) 튜플은 결과 기준)
+
+    단일 행이나 집계 딕셔너리, 스칼라는 행 수로 세지 않습니다.
+    """
+    if isinstance(result, tuple):
+        result = result[0] if result else None
+    if result is None or isinstance(result, (str, bytes, bool, int, float, dict)):
+        return None
+    try:
+        return len(result)
+    except TypeError:
+        return None
+
+
+def instrumented(name: str, rows: bool = True):
+    """함수 호출 수/지연 시간/반환 행 수 기록 데코레이터
+
+    rows 가 True 이면 반환값의 길이를 행 수로 기록합니다. 제너레이터 함수는 순회가
+    끝날 때까지의 시간과 생성한 항목 수를 기록합니다.
+    """
+    def decorator(func):
+        if inspect.isgeneratorfunction(func):
+            @wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                if not metrics.enabled:
+                    yield from func(*args, **kwargs)
+                    return
+
+                produced = 0
+                start = perf_counter()
+                try:
+                    for item in func(*args, **kwargs):
+                        produced += 1
+                        yield item
+                except GeneratorExit:
+                    # 호출한 쪽이 순회를 중간에 멈춘 경우 (오류 아님)
+                    metrics.record(name, perf_counter() - start, produced)
+                    raise
+                except BaseException:
+                    metrics.record(name, perf_counter() - start, produced, error=True)
+                    raise
+                metrics.record(name, perf_counter() - start, produced)
+            return generator_wrapper
+
+        # 호출마다 드는 비용을 줄이려고 큐에 직접 추가
+        pending = metrics._pending
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not metrics.enabled:
+                return func(*args, **kwargs)
+
+            start = perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                metrics.record(name, perf_counter() - start, error=True)
+                raise
+            pending.append((name, perf_counter() - start, count_rows(result) if rows else None, False))
+            if len(pending) >= MetricsRegistry.PENDING_LIMIT:
+                metrics.flush()
+            return result
+        return wrapper
+    return decorator
+
+
+def instrument_methods(prefix: str, exclude: Tuple[str, ...] = (), rows: bool = True):
+    """클래스의 공개 메서드 전체에 instrumented 적용 (정적/클래스 메서드 포함)"""
+    def decorator(cls):
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith('_') or attr in exclude:
+                continue
+            name = f"{prefix}.{attr}"
+            if isinstance(value, staticmethod):
+                setattr(cls, attr, staticmethod(instrumented(name, rows)(value.__func__)))
+            elif isinstance(value, classmethod):
+                setattr(cls, attr, classmethod(instrumented(name, rows)(value.__func__)))
+            elif inspect.isfunction(value):
+                setattr(cls, attr, instrumented(name, rows)(value))
+        return cls
+    return decorator
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = metrics
+
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        body = self.registry.to_prometheus().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_exporters: Dict[Tuple, object] = {}
+_exporters_lock = threading.Lock()
+
+
+def serve_metrics(port: int, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+    """/metrics 를 제공하는 로컬 HTTP 서버 시작 (주소별로 한 번만)"""
+    with _exporters_lock:
+        server = _exporters.get(('http', host, port))
+        if server is None:
+            server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            server.daemon_threads = True
+            threading.Thread(
+                target=server.serve_forever, name='metrics-http', daemon=True
+            ).start()
+            _exporters[('http', host, port)] = server
+        return server
+
+
+def export_metrics_periodically(path: str, interval_sec: float = 15.0) -> threading.Thread:
+    """지표 파일을 주기적으로 갱신하는 백그라운드 스레드 시작 (경로별로 한 번만)"""
+    def loop():
+        while True:
+            time.sleep(interval_sec)
+            try:
+                metrics.write_prometheus(path)
+            except OSError:
+                pass
+
+    with _exporters_lock:
+        thread = _exporters.get(('file', path))
+        if thread is None:
+            thread = threading.Thread(target=loop, name='metrics-file', daemon=True)
+            thread.start()
+            _exporters[('file', path)] = thread
+        return thread
+
+
+def configure_instrumentation(config) -> MetricsRegistry:
+    """설정에 따라 계측 사용 여부와 내보내기 대상 적용"""
+    metrics.enabled = config.get('instrumentation.enabled', True)
+    port = config.get('instrumentation.http_port')
+    if metrics.enabled and port:
+        serve_metrics(int(port), config.get('instrumentation.http_host', '127.0.0.1'))
+    path = config.get('instrumentation.prometheus_file')
+    if metrics.enabled and path:
+        export_metrics_periodically(path, config.get('instrumentation.export_interval_sec', 15))
+    return metrics
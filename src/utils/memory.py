@@ -0,0 +1,326 @@
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Dict, List, Optional, Tuple
+import inspect
+import sys
+import threading
+import time
+import tracemalloc
+
+# 예산을 넘었을 때의 동작
+# project: 큰 본문 컬럼을 빼고 읽고, 그래도 넘으면 page 처럼 앞부분만 읽음
+# page: 예산 안에 들어오는 앞부분 행만 읽음
+# refuse: 읽지 않고 오류
+BUDGET_ACTIONS = ('project', 'page', 'refuse')
+
+# 읽기 전 크기 추정값 (실제보다 조금 크게 잡음)
+# 셀 하나의 고정 비용 (바이트)
+CELL_OVERHEAD_BYTES = 32
+# 한글이 섞인 문자열은 글자당 2바이트로 저장됨
+BYTES_PER_CHAR = 2
+
+
+@dataclass
+class ReadPlan:
+    """예산을 적용한 읽기 계획"""
+    columns: List[str]
+    limit: Optional[int] = None
+    action: Optional[str] = None
+    total_rows: int = 0
+    estimated_bytes: int = 0
+
+    @property
+    def refused(self) -> bool:
+        return self.action == 'refuse'
+
+    def describe(self) -> Dict:
+        """DataFrame.attrs['budget'] 에 남길 내용"""
+        return {
+            'action': self.action,
+            'total_rows': self.total_rows,
+            'loaded_rows': self.total_rows if self.limit is None else min(self.limit, self.total_rows),
+            'estimated_bytes': self.estimated_bytes,
+            'columns': list(self.columns)
+        }
+
+
+class ReadBudget:
+    """한 번의 읽기로 메모리에 올릴 수 있는 행 수/바이트 한도
+
+    한도가 None 이면 제한하지 않습니다. 바이트는 읽기 전에 SQL 로 구한 행 수와 본문
+    글자 수로 추정한 값이라 실제 DataFrame 크기와 차이가 있을 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        max_rows: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        on_exceed: str = 'project'
+    ):
+        if on_exceed not in BUDGET_ACTIONS:
+            raise ValueError(f"on_exceed 는 {', '.join(BUDGET_ACTIONS)} 중 하나여야 합니다: {on_exceed}")
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.on_exceed = on_exceed
+
+    @property
+    def limited(self) -> bool:
+        return self.max_rows is not None or self.max_bytes is not None
+
+    @staticmethod
+    def estimate_bytes(rows: int, columns: int, text_chars: int) -> int:
+        return rows * columns * CELL_OVERHEAD_BYTES + text_chars * BYTES_PER_CHAR
+
+    def _fits(self, rows: int, size: int) -> bool:
+        return (
+            (self.max_rows is None or rows <= self.max_rows)
+            and (self.max_bytes is None or size <= self.max_bytes)
+        )
+
+    def _row_limit(self, rows: int, size: int) -> int:
+        """예산 안에 들어오는 행 수"""
+        limit = rows if self.max_rows is None else min(rows, self.max_rows)
+        if self.max_bytes is not None and rows:
+            limit = min(limit, int(self.max_bytes / (size / rows)))
+        return max(limit, 0)
+
+    def plan(
+        self,
+        columns: List[str],
+        large_columns: List[str],
+        rows: int,
+        text_chars: Dict[str, int]
+    ) -> ReadPlan:
+        """행 수와 컬럼별 글자 수로 읽기 계획 결정"""
+        size = self.estimate_bytes(rows, len(columns), sum(text_chars.values()))
+        plan = ReadPlan(columns=list(columns), total_rows=rows, estimated_bytes=size)
+        if self._fits(rows, size):
+            return plan
+
+        if self.on_exceed == 'refuse':
+            plan.action = 'refuse'
+            return plan
+
+        if self.on_exceed == 'project':
+            projected = [column for column in columns if column not in large_columns]
+            if len(projected) < len(columns):
+                plan.columns = projected
+                plan.action = 'project'
+                size = self.estimate_bytes(
+                    rows, len(projected),
+                    sum(chars for column, chars in text_chars.items() if column in projected)
+                )
+                plan.estimated_bytes = size
+                if self._fits(rows, size):
+                    return plan
+
+        plan.limit = self._row_limit(rows, size)
+        plan.action = 'project+page' if plan.action == 'project' else 'page'
+        plan.estimated_bytes = int(size * plan.limit / rows) if rows else 0
+        return plan
+
+
+class FrameStats:
+    """메서드 하나가 반환한 DataFrame 의 누적 크기"""
+
+    __slots__ = ('calls', 'rows', 'bytes', 'max_bytes', 'last_bytes', 'budget_hits')
+
+    def __init__(self):
+        self.calls = 0
+        self.rows = 0
+        self.bytes = 0
+        self.max_bytes = 0
+        self.last_bytes = 0
+        self.budget_hits = 0
+
+
+@dataclass
+class RerunMemory:
+    """재실행 한 번의 tracemalloc 측정 결과"""
+    label: str
+    recorded_at: float
+    duration_ms: float = 0.0
+    allocated_kb: float = 0.0
+    peak_kb: float = 0.0
+    top: List[Dict] = field(default_factory=list)
+
+
+class MemoryTracker:
+    """DataFrame 크기와 재실행별 메모리 할당을 모으는 클래스
+
+    track_frames 가 붙은 메서드가 DataFrame 을 반환하면 memory_usage(deep=True) 를
+    메서드별로 누적합니다. trace_reruns 가 켜져 있으면 tracemalloc 으로 재실행 전후
+    스냅숏을 비교해 최근 결과를 보관합니다. tracemalloc 은 프로세스 전체를 추적하므로
+    스냅숏 비교는 한 번에 한 재실행만 하고, 그 사이 다른 세션의 할당도 섞일 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        trace_reruns: bool = False,
+        top_n: int = 15,
+        keep: int = 50
+    ):
+        self.enabled = enabled
+        self.trace_reruns = trace_reruns
+        self.top_n = top_n
+        self.budget = ReadBudget()
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._tracing = threading.Lock()
+        self._frames: Dict[str, FrameStats] = {}
+        self._reruns = deque(maxlen=keep)
+
+    def record_frame(self, name: str, frame, budget: Optional[Dict] = None):
+        """DataFrame 하나의 크기 기록"""
+        size = int(frame.memory_usage(deep=True).sum())
+        with self._lock:
+            stats = self._frames.get(name)
+            if stats is None:
+                stats = self._frames[name] = FrameStats()
+            stats.calls += 1
+            stats.rows += len(frame)
+            stats.bytes += size
+            stats.last_bytes = size
+            if size > stats.max_bytes:
+                stats.max_bytes = size
+            if budget and budget.get('action'):
+                stats.budget_hits += 1
+
+    def frame_snapshot(self) -> List[Dict]:
+        """메서드별 DataFrame 크기 (최대 크기 내림차순)"""
+        with self._lock:
+            items = [
+                (name, stats.calls, stats.rows, stats.bytes, stats.max_bytes,
+                 stats.last_bytes, stats.budget_hits)
+                for name, stats in self._frames.items()
+            ]
+        rows = [
+            {
+                'operation': name,
+                'calls': calls,
+                'rows': total_rows,
+                'total_mb': round(total / 2 ** 20, 2),
+                'mean_kb': round(total / calls / 1024, 1),
+                'max_mb': round(max_bytes / 2 ** 20, 2),
+                'last_kb': round(last / 1024, 1),
+                'budget_hits': hits
+            }
+            for name, calls, total_rows, total, max_bytes, last, hits in items
+        ]
+        return sorted(rows, key=lambda row: row['max_mb'], reverse=True)
+
+    @contextmanager
+    def rerun(self, label: str = 'rerun'):
+        """블록 실행 전후의 tracemalloc 스냅숏 비교 (추적 중이 아니거나 다른 재실행을 재는 중이면 건너뜀)"""
+        if not (self.enabled and self.trace_reruns and tracemalloc.is_tracing()):
+            yield None
+            return
+        if not self._tracing.acquire(blocking=False):
+            yield None
+            return
+
+        try:
+            result = RerunMemory(label=label, recorded_at=time.time())
+            tracemalloc.reset_peak()
+            before_current, _ = tracemalloc.get_traced_memory()
+            before = tracemalloc.take_snapshot()
+            start = time.perf_counter()
+            try:
+                yield result
+            finally:
+                result.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+                current, peak = tracemalloc.get_traced_memory()
+                after = tracemalloc.take_snapshot()
+                result.allocated_kb = round((current - before_current) / 1024, 1)
+                result.peak_kb = round((peak - before_current) / 1024, 1)
+                result.top = self._top_allocations(before, after)
+                self._reruns.append(result)
+        finally:
+            self._tracing.release()
+
+    def _top_allocations(self, before, after) -> List[Dict]:
+        ignore = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*>')
+        ]
+        differences = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), 'lineno')
+        return [
+            {
+                'location': f"{difference.traceback[0].filename}:{difference.traceback[0].lineno}",
+                'size_kb': round(difference.size / 1024, 1),
+                'size_diff_kb': round(difference.size_diff / 1024, 1),
+                'count_diff': difference.count_diff
+            }
+            for difference in differences[:self.top_n]
+        ]
+
+    def rerun_snapshot(self) -> List[RerunMemory]:
+        """최근 재실행 측정 결과 (최신순)"""
+        return list(reversed(self._reruns))
+
+    def reset(self):
+        with self._lock:
+            self._frames.clear()
+            self._reruns.clear()
+            self.started_at = time.time()
+
+
+memory = MemoryTracker()
+
+
+def _first_frame(result):
+    """반환값이 DataFrame 이거나 (DataFrame, ...) 튜플이면 그 DataFrame"""
+    # pandas 를 아직 불러오지 않았거나 다른 스레드가 불러오는 중이면 DataFrame 일 수 없음
+    frame_type = getattr(sys.modules.get('pandas'), 'DataFrame', None)
+    if frame_type is None:
+        return None
+    if isinstance(result, tuple) and result:
+        result = result[0]
+    return result if isinstance(result, frame_type) else None
+
+
+def tracked_frame(name: str):
+    """반환된 DataFrame 의 메모리 사용량을 memory 에 기록하는 데코레이터"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            if memory.enabled:
+                frame = _first_frame(result)
+                if frame is not None:
+                    memory.record_frame(name, frame, frame.attrs.get('budget'))
+            return result
+        return wrapper
+    return decorator
+
+
+def track_frames(prefix: str, exclude: Tuple[str, ...] = ()):
+    """클래스의 공개 메서드 전체에 tracked_frame 적용 (제너레이터 제외)"""
+    def decorator(cls):
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith('_') or attr in exclude:
+                continue
+            if inspect.isfunction(value) and not inspect.isgeneratorfunction(value):
+                setattr(cls, attr, tracked_frame(f"{prefix}.{attr}")(value))
+        return cls
+    return decorator
+
+
+def configure_memory(config) -> MemoryTracker:
+    """설정의 memory 값으로 DataFrame 크기 기록, 재실행 추적, 읽기 예산 적용"""
+    memory.enabled = config.get('memory.enabled', True)
+    memory.trace_reruns = config.get('memory.trace_reruns', False)
+    memory.top_n = config.get('memory.top_n', 15)
+    if memory.enabled and memory.trace_reruns and not tracemalloc.is_tracing():
+        tracemalloc.start(config.get('memory.trace_frames', 1))
+
+    max_mb = config.get('memory.max_read_mb')
+    memory.budget = ReadBudget(
+        max_rows=config.get('memory.max_read_rows'),
+        max_bytes=int(max_mb * 2 ** 20) if max_mb else None,
+        on_exceed=config.get('memory.on_exceed', 'project')
+    )
+    return memory
@@ -0,0 +1,237 @@
+from typing import List, Optional, Sequence
+import numpy as np
+import pandas as pd
+from .tokenizer import STOPWORDS, strip_particle, tokenize
+
+# 점수 컬럼 목록
+SCORE_COLUMNS = [
+    'exact_match', 'token_precision', 'token_recall', 'token_f1',
+    'rouge_l', 'keyword_coverage'
+]
+
+
+class TokenizedBatch:
+    """문서 묶음의 토큰 ID 배열 (평탄화 배열 + 문서별 오프셋)"""
+
+    def __init__(self, ids: np.ndarray, lengths: np.ndarray):
+        self.ids = ids
+        self.lengths = lengths
+        self.offsets = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(np.int64)
+        self.doc_index = np.repeat(np.arange(len(lengths)), lengths)
+
+    def segment(self, i: int) -> np.ndarray:
+        return self.ids[self.offsets[i]:self.offsets[i] + self.lengths[i]]
+
+
+class BatchMetrics:
+    """(답변, 기대결과) 쌍 묶음의 벡터화 평가 지표 계산 클래스
+    
+    모든 지표는 쌍별 파이썬 루프 대신 공통 어휘의 토큰 ID 배열 위에서 계산합니다.
+    """
+
+    def __init__(self, max_tokens: int = 1000, chunk_cells: int = 4_000_000):
+        # ROUGE-L 동적 계획법 비용을 제한하기 위한 문서당 최대 토큰 수
+        self.max_tokens = max_tokens
+        # ROUGE-L 묶음 하나의 (쌍 수 x 기대결과 길이) 최대 셀 수
+        self.chunk_cells = chunk_cells
+
+    def score(
+        self,
+        responses: Sequence[Optional[str]],
+        expected: Sequence[Optional[str]]
+    ) -> pd.DataFrame:
+        """쌍 묶음의 지표 계산 (기대결과가 비어 있으면 NaN)"""
+        size = len(responses)
+        if size != len(expected):
+            raise ValueError("responses 와 expected 의 길이가 다릅니다.")
+        if size == 0:
+            return pd.DataFrame(columns=SCORE_COLUMNS, dtype=float)
+        
+        response_full = [tokenize(text or '') for text in responses]
+        expected_full = [tokenize(text or '') for text in expected]
+        # 일치 여부는 잘리지 않은 전체 토큰으로 판정 (앞부분만 같은 긴 답변을 일치로 보지 않음)
+        exact_match = self._exact_match(response_full, expected_full)
+        
+        response_tokens = [tokens[:self.max_tokens] for tokens in response_full]
+        expected_tokens = [tokens[:self.max_tokens] for tokens in expected_full]
+        
+        # 공통 어휘로 토큰 ID 부여
+        flat = [token for tokens in response_tokens + expected_tokens for token in tokens]
+        codes, vocab = pd.factorize(pd.Series(flat, dtype=object))
+        codes = codes.astype(np.int64)
+        
+        response_lengths = np.fromiter((len(t) for t in response_tokens), dtype=np.int64, count=size)
+        expected_lengths = np.fromiter((len(t) for t in expected_tokens), dtype=np.int64, count=size)
+        split = int(response_lengths.sum())
+        
+        response_batch = TokenizedBatch(codes[:split], response_lengths)
+        expected_batch = TokenizedBatch(codes[split:], expected_lengths)
+        vocab_size = max(len(vocab), 1)
+        
+        precision, recall, f1 = self._token_prf(response_batch, expected_batch, vocab_size)
+        
+        result = pd.DataFrame({
+            'exact_match': exact_match,
+            'token_precision': precision,
+            'token_recall': recall,
+            'token_f1': f1,
+            'rouge_l': self._rouge_l(response_batch, expected_batch),
+            'keyword_coverage': self._keyword_coverage(
+                response_batch, expected_batch, np.asarray(vocab, dtype=object)
+            )
+        })
+        
+        # 기대결과가 없는 쌍은 채점하지 않음
+        result.loc[expected_lengths == 0, :] = np.nan
+        return result
+
+    def score_frame(
+        self,
+        data: pd.DataFrame,
+        response_column: str = 'chatbot_response',
+        expected_column: str = 'expected_result'
+    ) -> pd.DataFrame:
+        """get_history 결과 등 DataFrame 의 점수 컬럼 계산 (입력과 같은 인덱스)"""
+        scores = self.score(
+            data[response_column].tolist(),
+            data[expected_column].tolist()
+        )
+        scores.index = data.index
+        return scores
+
+    def _token_prf(self, response: TokenizedBatch, expected: TokenizedBatch, vocab_size: int):
+        """토큰 단위 정밀도/재현율/F1 (중복 토큰은 최소 빈도만큼 일치)"""
+        response_keys, response_counts = np.unique(
+            response.doc_index * vocab_size + response.ids, return_counts=True
+        )
+        expected_keys, expected_counts = np.unique(
+            expected.doc_index * vocab_size + expected.ids, return_counts=True
+        )
+        
+        common_keys, response_idx, expected_idx = np.intersect1d(
+            response_keys, expected_keys, assume_unique=True, return_indices=True
+        )
+        common = np.bincount(
+            common_keys // vocab_size,
+            weights=np.minimum(response_counts[response_idx], expected_counts[expected_idx]),
+            minlength=len(response.lengths)
+        )
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            precision = np.where(response.lengths > 0, common / response.lengths, 0.0)
+            recall = np.where(expected.lengths > 0, common / expected.lengths, 0.0)
+            f1 = np.where(
+                precision + recall > 0,
+                2 * precision * recall / (precision + recall),
+                0.0
+            )
+        return precision, recall, f1
+
+    @staticmethod
+    def _exact_match(response: List[List[str]], expected: List[List[str]]) -> np.ndarray:
+        """정규화 일치 (대소문자, 공백, 문장부호 무시)"""
+        return np.fromiter(
+            (bool(r) and r == e for r, e in zip(response, expected)),
+            dtype=np.float64,
+            count=len(response)
+        )
+
+    def _rouge_l(self, response: TokenizedBatch, expected: TokenizedBatch) -> np.ndarray:
+        """최장 공통 부분 수열 기반 ROUGE-L F1
+        
+        길이가 비슷한 쌍끼리 묶어 패딩을 줄이고, 묶음 전체에 대해
+        한 행씩 DP 를 진행합니다 (행 내부 의존성은 누적 최댓값으로 처리).
+        """
+        size = len(response.lengths)
+        lcs = np.zeros(size, dtype=np.float64)
+        
+        order = np.argsort(expected.lengths * (self.max_tokens + 1) + response.lengths, kind='stable')
+        order = order[(response.lengths[order] > 0) & (expected.lengths[order] > 0)]
+        
+        start = 0
+        while start < len(order):
+            width = max(int(expected.lengths[order[start]]), 1)
+            end = start + 1
+            while end < len(order):
+                width = int(expected.lengths[order[end]])
+                if (end - start + 1) * width > self.chunk_cells:
+                    break
+                end += 1
+            
+            lcs[order[start:end]] = self._lcs_chunk(response, expected, order[start:end])
+            start = end
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            precision = np.where(response.lengths > 0, lcs / response.lengths, 0.0)
+            recall = np.where(expected.lengths > 0, lcs / expected.lengths, 0.0)
+            return np.where(
+                precision + recall > 0,
+                2 * precision * recall / (precision + recall),
+                0.0
+            )
+
+    def _lcs_chunk(
+        self,
+        response: TokenizedBatch,
+        expected: TokenizedBatch,
+        pairs: np.ndarray
+    ) -> np.ndarray:
+        """쌍 묶음의 LCS 길이"""
+        rows = self._padded(response, pairs, fill=-1)
+        cols = self._padded(expected, pairs, fill=-2)
+        
+        batch, width = cols.shape
+        previous = np.zeros((batch, width + 1), dtype=np.int32)
+        
+        for i in range(rows.shape[1]):
+            match = rows[:, i:i + 1] == cols
+            candidate = np.where(match, previous[:, :-1] + 1, previous[:, 1:])
+            previous[:, 1:] = np.maximum.accumulate(candidate, axis=1)
+        
+        return previous[np.arange(batch), expected.lengths[pairs]].astype(np.float64)
+
+    @staticmethod
+    def _padded(batch: TokenizedBatch, pairs: np.ndarray, fill: int) -> np.ndarray:
+        """선택한 문서들의 토큰 ID 를 패딩된 2차원 배열로 변환"""
+        lengths = batch.lengths[pairs]
+        width = max(int(lengths.max()), 1)
+        padded = np.full((len(pairs), width), fill, dtype=np.int64)
+        
+        mask = np.arange(width) < lengths[:, None]
+        positions = batch.offsets[pairs][:, None] + np.arange(width)
+        padded[mask] = batch.ids[positions[mask]]
+        return padded
+
+    def _keyword_coverage(
+        self,
+        response: TokenizedBatch,
+        expected: TokenizedBatch,
+        vocab: np.ndarray
+    ) -> np.ndarray:
+        """기대결과 키워드(조사/불용어 제거) 중 답변에 포함된 비율"""
+        # 어휘 단위로 한 번만 조사 제거 및 불용어 판정
+        keywords = [
+            strip_particle(word) if word and '가' <= word[-1] <= '힣' else word
+            for word in vocab
+        ]
+        keyword_ids, keyword_vocab = pd.factorize(pd.Series(keywords, dtype=object))
+        is_keyword = np.array(
+            [word not in STOPWORDS and len(word) > 1 for word in keyword_vocab],
+            dtype=bool
+        )
+        keyword_size = max(len(keyword_vocab), 1)
+        
+        def unique_keys(batch: TokenizedBatch) -> np.ndarray:
+            ids = keyword_ids[batch.ids] if len(batch.ids) else batch.ids
+            mask = is_keyword[ids] if len(ids) else np.zeros(0, dtype=bool)
+            return np.unique(batch.doc_index[mask] * keyword_size + ids[mask])
+        
+        expected_keys = unique_keys(expected)
+        covered = np.isin(expected_keys, unique_keys(response), assume_unique=True)
+        
+        size = len(expected.lengths)
+        totals = np.bincount(expected_keys // keyword_size, minlength=size)
+        hits = np.bincount(expected_keys[covered] // keyword_size, minlength=size)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(totals > 0, hits / totals, 0.0)
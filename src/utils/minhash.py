@@ -0,0 +1,69 @@
+from typing import List, Tuple
+import hashlib
+import zlib
+import numpy as np
+from .tokenizer import char_ngrams
+
+# datasketch 와 동일한 해시 계열 (a * x + b) mod p
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+class MinHasher:
+    """MinHash 시그니처 및 LSH 밴드 계산 클래스"""
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 5,
+        seed: int = 1
+    ):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm 은 bands 의 배수여야 합니다.")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = generator.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        """텍스트의 MinHash 시그니처 계산"""
+        shingles = set(char_ngrams(text, self.shingle_size))
+        if not shingles:
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint64)
+
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode('utf-8')) for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+        # (shingle 수 x num_perm) 행렬에서 열별 최솟값
+        permuted = (np.outer(hashes, self._a) + self._b) % MERSENNE_PRIME & MAX_HASH
+        return permuted.min(axis=0)
+
+    def band_buckets(self, signature: np.ndarray) -> List[Tuple[int, int]]:
+        """LSH 밴드별 (band, bucket) 목록"""
+        buckets = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(chunk.tobytes(), digest_size=8).digest()
+            buckets.append((band, int.from_bytes(digest, 'big', signed=True)))
+        return buckets
+
+    def to_bytes(self, signature: np.ndarray) -> bytes:
+        """시그니처를 BLOB 저장용 바이트로 변환"""
+        return signature.astype(np.uint64).tobytes()
+
+    def from_bytes(self, data: bytes) -> np.ndarray:
+        """BLOB 바이트를 시그니처로 복원"""
+        return np.frombuffer(data, dtype=np.uint64)
+
+    @staticmethod
+    def estimate_similarity(sig1: np.ndarray, sig2: np.ndarray) -> float:
+        """두 시그니처의 추정 자카드 유사도"""
+        return float(np.mean(sig1 == sig2))
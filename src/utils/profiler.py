@@ -0,0 +1,169 @@
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import cProfile
+import glob
+import os
+import pstats
+import sys
+import threading
+import time
+
+
+@dataclass
+class ProfileResult:
+    """프로파일 한 번의 결과"""
+    label: str
+    duration_ms: float = 0.0
+    samples: int = 0
+    pstats_path: Optional[str] = None
+    collapsed_path: Optional[str] = None
+    top: List[Dict] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+class SamplingProfiler:
+    """대상 스레드의 호출 스택을 주기적으로 수집해 접힌 스택(collapsed stack)으로 집계"""
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='profiler-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                )
+                frame = frame.f_back
+            stack = ';'.join(reversed(names))
+            self.stacks[stack] = self.stacks.get(stack, 0) + 1
+
+    def write_collapsed(self, path: str):
+        """flamegraph.pl / speedscope 에서 읽는 'a;b;c 횟수' 형식으로 저장"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+
+def top_functions(stats: pstats.Stats, limit: int) -> List[Dict]:
+    """누적 시간 상위 함수"""
+    rows = []
+    for (filename, line, name), (_, calls, tottime, cumtime, _) in stats.stats.items():
+        rows.append({
+            'function': f"{name} ({os.path.basename(filename)}:{line})",
+            'calls': calls,
+            'tottime_ms': round(tottime * 1000, 2),
+            'cumtime_ms': round(cumtime * 1000, 2)
+        })
+    rows.sort(key=lambda row: row['cumtime_ms'], reverse=True)
+    return rows[:limit]
+
+
+class RerunProfiler:
+    """화면 재실행 한 번을 cProfile 과 샘플링 프로파일러로 감싸 파일로 저장
+
+    한 번에 하나의 프로파일만 실행하고 (다른 세션이 프로파일 중이면 건너뜀), 저장
+    디렉터리에는 최근 keep 개의 결과만 남깁니다. 프로파일링 중 오류는 화면 렌더링을
+    막지 않고 결과의 error 에만 남습니다.
+    """
+
+    _running = threading.Lock()
+
+    def __init__(
+        self,
+        directory: str = 'profiles/',
+        top_n: int = 30,
+        interval: float = 0.005,
+        keep: int = 50
+    ):
+        self.directory = directory
+        self.top_n = top_n
+        self.interval = interval
+        self.keep = keep
+
+    @contextmanager
+    def profile(self, label: str = 'rerun'):
+        """블록 실행을 프로파일 (다른 프로파일이 실행 중이면 None 을 yield)"""
+        if not self._running.acquire(blocking=False):
+            yield None
+            return
+
+        result = ProfileResult(label=label)
+        profiler = cProfile.Profile()
+        sampler = SamplingProfiler(threading.get_ident(), self.interval)
+        try:
+            sampler.start()
+            start = time.perf_counter()
+            profiler.enable()
+            try:
+                yield result
+            finally:
+                profiler.disable()
+                result.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+                sampler.stop()
+                self._save(result, profiler, sampler)
+        finally:
+            self._running.release()
+
+    def _save(self, result: ProfileResult, profiler: cProfile.Profile, sampler: SamplingProfiler):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            stem = os.path.join(
+                self.directory,
+                f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{_safe_name(result.label)}"
+            )
+            result.pstats_path = f"{stem}.pstats"
+            profiler.dump_stats(result.pstats_path)
+            result.collapsed_path = f"{stem}.collapsed"
+            sampler.write_collapsed(result.collapsed_path)
+            result.samples = sampler.samples
+            result.top = top_functions(pstats.Stats(profiler), self.top_n)
+            self._rotate()
+        except Exception as e:
+            result.error = str(e)
+
+    def _rotate(self):
+        """오래된 결과 파일 삭제"""
+        for pattern in ('*.pstats', '*.collapsed'):
+            paths = sorted(glob.glob(os.path.join(self.directory, pattern)), key=os.path.getmtime)
+            for path in paths[:-self.keep]:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+def _safe_name(label: str) -> str:
+    return ''.join(ch if ch.isalnum() or ch in '-_' else '_' for ch in label)[:40] or 'rerun'
+
+
+def create_profiler(config) -> RerunProfiler:
+    """설정의 profiling 값으로 프로파일러 생성"""
+    return RerunProfiler(
+        directory=config.get('profiling.directory', 'profiles/'),
+        top_n=config.get('profiling.top_n', 30),
+        interval=config.get('profiling.sample_interval_ms', 5) / 1000,
+        keep=config.get('profiling.keep', 50)
+    )
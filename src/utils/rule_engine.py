@@ -0,0 +1,214 @@
+from itertools import islice
+from typing import Dict, FrozenSet, List, Optional, Pattern, Set
+import hashlib
+import json
+import re
+from src.utils.tokenizer import WORD_PATTERN
+
+# 지원하는 규칙 유형
+#   keywords     : 키워드 중 하나 이상 포함 (대소문자 무시)
+#   sections     : 줄 머리의 섹션 제목 (# 제목, [제목], **제목**, 제목:) 모두 포함
+#   placeholders : {{ 변수 }} 자리표시자 포함 (이름 목록이 비어 있으면 하나 이상)
+#   max_tokens   : 단어 토큰 수 상한
+#   min_length   : 공백 제외 최소 글자 수
+RULE_TYPES = ('keywords', 'sections', 'placeholders', 'max_tokens', 'min_length')
+
+DEFAULT_RULES = [
+    {'name': 'has_context', 'type': 'min_length', 'min_chars': 1},
+    {'name': 'has_instruction', 'type': 'keywords',
+     'keywords': ['please', 'analyze', 'explain', 'describe']},
+    {'name': 'has_example', 'type': 'keywords', 'keywords': ['예시', 'example']},
+    {'name': 'has_format_specification', 'type': 'keywords', 'keywords': ['[', ']', '{', '}']},
+    {'name': 'within_token_limit', 'type': 'max_tokens', 'max_tokens': 4000}
+]
+
+SECTION_PREFIX = r'^[ \t]*(?:#{1,6}[ \t]*|\[[ \t]*|\*\*[ \t]*)?'
+# 섹션 이름 뒤에는 콜론, 닫는 ] 나 **, 또는 (닫는 # 뒤) 줄 끝이 와야 함 ("Outputs vary" 는 Output 섹션이 아님)
+SECTION_SUFFIX = r'[ \t]*(?:[:：]|\]|\*\*|#*[ \t]*$)'
+PLACEHOLDER_PATTERN = r'\{\{[ \t]*(?P<ph>\w+)'
+
+
+class RuleEngine:
+    """설정 기반 프롬프트 구조 규칙 검사기
+
+    키워드/섹션/자리표시자 규칙은 하나의 정규식으로 컴파일해 본문을 한 번만 훑고,
+    토큰 수 규칙은 한도 중 최댓값까지만 셉니다. 규칙을 추가해도 순회 횟수는 늘지 않습니다.
+    """
+
+    def __init__(self, rules: Optional[List[Dict]] = None):
+        self.rules = [dict(rule) for rule in (rules or DEFAULT_RULES)]
+        self._check_rules()
+        self.version = hashlib.blake2b(
+            json.dumps(self.rules, sort_keys=True, ensure_ascii=False).encode('utf-8'),
+            digest_size=8
+        ).hexdigest()
+        self._compile()
+
+    @property
+    def rule_names(self) -> List[str]:
+        return [rule['name'] for rule in self.rules]
+
+    def evaluate(self, text: str) -> Dict[str, bool]:
+        """규칙별 통과 여부"""
+        text = text or ''
+        satisfied: Set[int] = set()
+        sections: Set[str] = set()
+        placeholders: Set[str] = set()
+
+        # 충족된 규칙의 패턴은 빼고 남은 위치부터 이어서 훑음 (전체 한 번 순회)
+        pending = self._scan_rules
+        scanner = self._scanner(pending)
+        position = 0
+        while scanner is not None:
+            match = scanner.search(text, position)
+            if match is None:
+                break
+            position = match.start() + 1
+
+            kind = match.lastgroup
+            value = match.group(kind).lower()
+            hits = set()
+            if kind == 'kw':
+                hits = self._keyword_hits(value) & pending
+            else:
+                if kind == 'sec':
+                    sections.add(value)
+                else:
+                    placeholders.add(value)
+                hits = {
+                    index for index in pending
+                    if index in self._required and self._structure_satisfied(index, sections, placeholders)
+                }
+                # 같은 위치에서 시작하는 키워드는 앞선 대안에 가려지므로 따로 확인
+                if self._keyword_pattern is not None:
+                    keyword = self._keyword_pattern.match(text, match.start())
+                    if keyword:
+                        hits |= self._keyword_hits(keyword.group(0).lower()) & pending
+
+            if hits:
+                satisfied |= hits
+                pending = pending - hits
+                scanner = self._scanner(pending)
+
+        token_count = 0
+        if self._token_limit is not None and (len(text) + 1) // 2 > self._min_token_limit:
+            # 토큰 수가 글자 수의 절반을 넘을 수 없으므로 짧은 본문은 세지 않음
+            token_count = sum(1 for _ in islice(WORD_PATTERN.finditer(text), self._token_limit + 1))
+        content_length = len(text.strip())
+
+        results = {}
+        for index, rule in enumerate(self.rules):
+            rule_type = rule['type']
+            if rule_type in ('keywords', 'sections', 'placeholders'):
+                passed = index in satisfied
+            elif rule_type == 'max_tokens':
+                passed = token_count <= rule['max_tokens']
+            else:
+                passed = content_length >= rule.get('min_chars', 1)
+            results[rule['name']] = passed
+        return results
+
+    def _keyword_hits(self, value: str) -> Set[int]:
+        """일치한 키워드의 규칙 (소문자 기준)
+
+        IGNORECASE 는 'ſ', 'İ' 같은 유니코드 대소문자 변형도 맞추지만 그 lower() 는
+        키워드와 다를 수 있으므로, 없는 값이면 lower() 가 키워드로 시작하는지 직접 확인합니다.
+        """
+        rules = self._keyword_rules.get(value)
+        if rules is None:
+            rules = set().union(*(
+                rules for keyword, rules in self._own_keyword_rules.items() if value.startswith(keyword)
+            ))
+        return rules
+
+    def _structure_satisfied(self, index: int, sections: Set[str], placeholders: Set[str]) -> bool:
+        """섹션/자리표시자 규칙 충족 여부"""
+        required = self._required[index]
+        if self.rules[index]['type'] == 'sections':
+            return required <= sections
+        return required <= placeholders if required else bool(placeholders)
+
+    def _scanner(self, pending: FrozenSet[int]) -> Optional[Pattern]:
+        """남은 규칙만으로 만든 단일 정규식 (조합별로 한 번만 컴파일)"""
+        if not pending:
+            return None
+        scanner = self._scanners.get(pending)
+        if scanner is None:
+            keywords = {k for k, rules in self._own_keyword_rules.items() if rules & pending}
+            sections = set().union(*(
+                self._required[i] for i in pending if self.rules[i]['type'] == 'sections'
+            ))
+            has_placeholders = any(self.rules[i]['type'] == 'placeholders' for i in pending)
+
+            # 모든 대안을 전방 탐색으로 감싸 겹치는 일치도 각 시작 위치에서 찾음
+            parts = []
+            if sections:
+                parts.append(SECTION_PREFIX + f'(?P<sec>{self._alternation(sections)})' + SECTION_SUFFIX)
+            if has_placeholders:
+                parts.append(PLACEHOLDER_PATTERN)
+            if keywords:
+                parts.append(f'(?P<kw>{self._alternation(keywords)})')
+            scanner = re.compile('(?=' + '|'.join(parts) + ')', re.IGNORECASE | re.MULTILINE)
+            self._scanners[pending] = scanner
+        return scanner
+
+    def _check_rules(self):
+        """규칙 정의 검증"""
+        names = set()
+        for rule in self.rules:
+            name, rule_type = rule.get('name'), rule.get('type')
+            if not name or name in names:
+                raise ValueError(f"규칙 이름이 없거나 중복되었습니다: {name}")
+            if rule_type not in RULE_TYPES:
+                raise ValueError(f"지원하지 않는 규칙 유형입니다: {rule_type}")
+            if rule_type == 'keywords' and not rule.get('keywords'):
+                raise ValueError(f"키워드 규칙에 키워드가 없습니다: {name}")
+            if rule_type == 'sections' and not rule.get('sections'):
+                raise ValueError(f"섹션 규칙에 섹션이 없습니다: {name}")
+            if rule_type == 'max_tokens' and not isinstance(rule.get('max_tokens'), int):
+                raise ValueError(f"토큰 규칙에 max_tokens 정수가 필요합니다: {name}")
+            names.add(name)
+
+    def _compile(self):
+        """규칙을 단일 정규식과 조회 테이블로 컴파일"""
+        keyword_rules: Dict[str, Set[int]] = {}
+        self._required: Dict[int, Set[str]] = {}
+        token_limits = []
+
+        for index, rule in enumerate(self.rules):
+            rule_type = rule['type']
+            if rule_type == 'keywords':
+                for keyword in rule['keywords']:
+                    keyword_rules.setdefault(str(keyword).lower(), set()).add(index)
+            elif rule_type == 'sections':
+                self._required[index] = {str(name).lower() for name in rule['sections']}
+            elif rule_type == 'placeholders':
+                self._required[index] = {str(name).lower() for name in rule.get('placeholders', [])}
+            elif rule_type == 'max_tokens':
+                token_limits.append(rule['max_tokens'])
+
+        # 한 위치에서는 가장 긴 키워드만 잡히므로 접두어 키워드의 규칙을 미리 합침
+        self._own_keyword_rules = keyword_rules
+        self._keyword_rules = {
+            keyword: set().union(*(
+                rules for other, rules in keyword_rules.items() if keyword.startswith(other)
+            ))
+            for keyword in keyword_rules
+        }
+        self._token_limit = max(token_limits) if token_limits else None
+        self._min_token_limit = min(token_limits) if token_limits else None
+
+        keyword_alternation = self._alternation(keyword_rules)
+        self._keyword_pattern = (
+            re.compile(keyword_alternation, re.IGNORECASE) if keyword_alternation else None
+        )
+        self._scan_rules = frozenset(
+            index for index, rule in enumerate(self.rules)
+            if rule['type'] in ('keywords', 'sections', 'placeholders')
+        )
+        self._scanners: Dict[FrozenSet[int], Pattern] = {}
+
+    @staticmethod
+    def _alternation(words) -> str:
+        """긴 단어 우선 정규식 대안"""
+        return '|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True))
@@ -0,0 +1,168 @@
+from typing import Dict, List, Tuple
+import heapq
+import math
+import threading
+from .tokenizer import terms
+
+# 필드별 가중치 (제목 > 쿼리 > 본문)
+FIELD_WEIGHTS = {
+    'title': 3.0,
+    'query': 2.0,
+    'prompt_content': 1.0,
+    'description': 0.8,
+    'chatbot_response': 0.5
+}
+
+
+class SearchEngine:
+    """메모리 역색인 기반 BM25F 검색 엔진
+    
+    데이터베이스 파일별로 하나만 생성되어 main.py 와 app.py 화면이 함께 사용합니다.
+    """
+
+    _instances: Dict[str, 'SearchEngine'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, database, k1: float = 1.2, b: float = 0.75):
+        self.database = database
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        # term -> {doc_id: {field: tf}}
+        self._postings: Dict[str, Dict[int, Dict[str, int]]] = {}
+        self._doc_terms: Dict[int, List[str]] = {}
+        self._doc_lengths: Dict[int, Dict[str, int]] = {}
+        self._total_lengths = {field: 0 for field in FIELD_WEIGHTS}
+        self._max_doc_id = 0
+        # 반영한 마지막 prompt_changes seq (다른 프로세스의 수정/삭제)
+        self._change_seq = 0
+
+    @classmethod
+    def for_database(cls, database) -> 'SearchEngine':
+        """데이터베이스 파일별 공유 검색 엔진 반환 (최초 호출 시 색인 생성)"""
+        with cls._instances_lock:
+            engine = cls._instances.get(database.db_path)
+            if engine is None:
+                engine = cls(database)
+                engine.sync()
+                cls._instances[database.db_path] = engine
+            return engine
+
+    @property
+    def document_count(self) -> int:
+        return len(self._doc_lengths)
+
+    def add_document(self, doc_id: int, fields: Dict[str, str]):
+        """문서 추가 또는 교체"""
+        with self._lock:
+            self.remove_document(doc_id)
+            
+            lengths = {}
+            unique_terms = set()
+            for field in FIELD_WEIGHTS:
+                tokens = terms(fields.get(field) or '')
+                lengths[field] = len(tokens)
+                self._total_lengths[field] += len(tokens)
+                for token in tokens:
+                    field_tfs = self._postings.setdefault(token, {}).setdefault(doc_id, {})
+                    field_tfs[field] = field_tfs.get(field, 0) + 1
+                unique_terms.update(tokens)
+            
+            self._doc_lengths[doc_id] = lengths
+            self._doc_terms[doc_id] = list(unique_terms)
+            self._max_doc_id = max(self._max_doc_id, doc_id)
+
+    def remove_document(self, doc_id: int):
+        """문서 제거"""
+        with self._lock:
+            lengths = self._doc_lengths.pop(doc_id, None)
+            if lengths is None:
+                return
+            
+            for field, length in lengths.items():
+                self._total_lengths[field] -= length
+            
+            for token in self._doc_terms.pop(doc_id, []):
+                docs = self._postings.get(token)
+                if docs is not None:
+                    docs.pop(doc_id, None)
+                    if not docs:
+                        del self._postings[token]
+
+    def sync(self):
+        """다른 프로세스에서 추가/수정/삭제된 문서 반영
+
+        변경 기록이 정리되어 일부를 빠뜨렸거나 (오래 동기화하지 않은 경우) 기록이 뒤로
+        돌아갔으면 (백업 복원 등) 전체를 다시 색인합니다.
+        """
+        with self._lock:
+            oldest, latest, changed = self.database.get_prompt_changes(self._change_seq)
+            missed = latest < self._change_seq or (oldest is not None and oldest > self._change_seq + 1)
+            if missed or not self._doc_lengths:
+                # 비어 있는 색인은 아래에서 전체를 읽으므로 변경 기록이 필요 없음
+                self._reset()
+                changed = []
+            
+            for row in self.database.iter_prompt_texts(
+                after_id=self._max_doc_id,
+                fields=list(FIELD_WEIGHTS)
+            ):
+                self.add_document(row['id'], row)
+            
+            rows = self.database.get_prompt_texts(changed, list(FIELD_WEIGHTS))
+            for doc_id in changed:
+                if doc_id in rows:
+                    self.add_document(doc_id, rows[doc_id])
+                else:
+                    self.remove_document(doc_id)
+            self._change_seq = latest
+
+    def _reset(self):
+        """색인 비우기 (다음 동기화에서 전체 재색인)"""
+        self._postings.clear()
+        self._doc_terms.clear()
+        self._doc_lengths.clear()
+        self._total_lengths = {field: 0 for field in FIELD_WEIGHTS}
+        self._max_doc_id = 0
+
+    def search(
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = 20
+    ) -> Tuple[int, List[Tuple[int, float]]]:
+        """BM25F 점수순 (전체 건수, 현재 페이지 [(doc_id, score)]) 반환"""
+        query_terms = set(terms(query))
+        if not query_terms:
+            return 0, []
+        
+        self.sync()
+        
+        with self._lock:
+            doc_count = self.document_count
+            avg_lengths = {
+                field: (total / doc_count if doc_count else 0) or 1.0
+                for field, total in self._total_lengths.items()
+            }
+            
+            scores: Dict[int, float] = {}
+            for term in query_terms:
+                docs = self._postings.get(term)
+                if not docs:
+                    continue
+                
+                idf = math.log(1 + (doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+                for doc_id, field_tfs in docs.items():
+                    lengths = self._doc_lengths[doc_id]
+                    weighted_tf = sum(
+                        FIELD_WEIGHTS[field] * tf
+                        / (1 - self.b + self.b * lengths[field] / avg_lengths[field])
+                        for field, tf in field_tfs.items()
+                    )
+                    scores[doc_id] = scores.get(doc_id, 0.0) + (
+                        idf * weighted_tf * (self.k1 + 1) / (weighted_tf + self.k1)
+                    )
+        
+        page = max(page, 1)
+        top = heapq.nlargest(page * page_size, scores.items(), key=lambda x: x[1])
+        return len(scores), top[(page - 1) * page_size:]
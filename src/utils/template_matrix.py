@@ -0,0 +1,157 @@
+from functools import lru_cache
+from typing import Dict, IO, Iterator, List, Optional, Set, Union
+import csv
+import io
+import json
+import math
+import random
+from jinja2 import Environment, StrictUndefined, Template, meta
+
+# 템플릿 공용 환경 (정의되지 않은 변수는 오류)
+_ENVIRONMENT = Environment(
+    undefined=StrictUndefined,
+    autoescape=False,
+    keep_trailing_newline=True
+)
+
+
+@lru_cache(maxsize=128)
+def compile_template(source: str) -> Template:
+    """템플릿 컴파일 (같은 원문은 한 번만 컴파일)"""
+    return _ENVIRONMENT.from_string(source)
+
+
+@lru_cache(maxsize=128)
+def template_variables(source: str) -> Set[str]:
+    """템플릿에서 사용하는 {{변수}} 이름 목록"""
+    return meta.find_undeclared_variables(_ENVIRONMENT.parse(source))
+
+
+def render_template(source: str, variables: Dict) -> str:
+    """변수 조합으로 템플릿 렌더링"""
+    return compile_template(source).render(**variables)
+
+
+class TestMatrix:
+    """템플릿 변수 테스트 매트릭스
+    
+    변수별 값 목록의 데카르트 곱 또는 CSV/JSONL 파일의 행을 조합으로 사용하며,
+    조합은 필요할 때마다 생성되어 전체 목록을 메모리에 만들지 않습니다.
+    """
+
+    def __init__(
+        self,
+        values: Optional[Dict[str, List]] = None,
+        source: Optional[Union[str, IO]] = None,
+        file_format: Optional[str] = None
+    ):
+        if (values is None) == (source is None):
+            raise ValueError("values 또는 source 중 하나만 지정해야 합니다.")
+        
+        self.values = {name: list(options) for name, options in (values or {}).items()}
+        self.source = source
+        self.file_format = file_format
+        if source is not None and file_format not in ('csv', 'jsonl'):
+            raise ValueError(f"지원하지 않는 파일 형식입니다: {file_format}")
+
+    @classmethod
+    def from_spec(cls, spec: Union[str, Dict]) -> 'TestMatrix':
+        """JSON 문자열 또는 딕셔너리 {변수: [값, ...]} 로 생성"""
+        if isinstance(spec, str):
+            spec = json.loads(spec)
+        if not isinstance(spec, dict):
+            raise ValueError("매트릭스 정의는 {변수: [값, ...]} 형식이어야 합니다.")
+        
+        return cls(values={
+            name: options if isinstance(options, list) else [options]
+            for name, options in spec.items()
+        })
+
+    @classmethod
+    def from_file(cls, source: Union[str, IO], file_format: Optional[str] = None) -> 'TestMatrix':
+        """CSV/JSONL 파일 (한 행이 한 조합) 로 생성"""
+        if file_format is None:
+            name = source if isinstance(source, str) else getattr(source, 'name', '')
+            file_format = 'jsonl' if str(name).endswith(('.jsonl', '.ndjson')) else 'csv'
+        return cls(source=source, file_format=file_format)
+
+    def __len__(self) -> int:
+        """전체 조합 수 (파일은 행 수를 세기 위해 한 번 순회)"""
+        if self.source is None:
+            return math.prod(len(options) for options in self.values.values()) if self.values else 0
+        return sum(1 for _ in self._iter_file())
+
+    @property
+    def variables(self) -> List[str]:
+        if self.source is None:
+            return list(self.values.keys())
+        first = next(self._iter_file(), {})
+        return list(first.keys())
+
+    def iter_cases(self, sample: Optional[int] = None, seed: int = 0) -> Iterator[Dict]:
+        """조합을 하나씩 생성 (sample 지정 시 무작위 부분집합)"""
+        if self.source is not None:
+            rows = self._iter_file()
+            yield from (rows if not sample else self._reservoir(rows, sample, seed))
+            return
+        
+        total = len(self)
+        if not sample or sample >= total:
+            yield from self._iter_product(range(total))
+        else:
+            # range 에서 표본을 뽑아 조합 목록을 만들지 않고 색인으로 복원
+            indices = sorted(random.Random(seed).sample(range(total), sample))
+            yield from self._iter_product(indices)
+
+    def _iter_product(self, indices) -> Iterator[Dict]:
+        """혼합 기수 색인을 변수 조합으로 복원"""
+        names = list(self.values.keys())
+        sizes = [len(self.values[name]) for name in names]
+        
+        for index in indices:
+            case = {}
+            for name, size in zip(reversed(names), reversed(sizes)):
+                index, position = divmod(index, size)
+                case[name] = self.values[name][position]
+            yield {name: case[name] for name in names}
+
+    def _iter_file(self) -> Iterator[Dict]:
+        """CSV/JSONL 행 스트리밍"""
+        handle, release = self._open()
+        try:
+            if self.file_format == 'csv':
+                yield from csv.DictReader(handle)
+            else:
+                for line in handle:
+                    if line.strip():
+                        yield json.loads(line)
+        finally:
+            release()
+
+    def _open(self):
+        """파일 경로 또는 업로드 파일 객체 열기 (핸들, 해제 함수)"""
+        if isinstance(self.source, str):
+            handle = open(self.source, 'r', encoding='utf-8', newline='')
+            return handle, handle.close
+        
+        self.source.seek(0)
+        if isinstance(self.source, io.TextIOBase):
+            return self.source, lambda: None
+        
+        # 업로드 파일은 다시 읽을 수 있도록 닫지 않고 분리
+        handle = io.TextIOWrapper(self.source, encoding='utf-8', newline='')
+        return handle, handle.detach
+
+    @staticmethod
+    def _reservoir(rows: Iterator[Dict], size: int, seed: int) -> List[Dict]:
+        """저장소 표본 추출 (메모리는 표본 크기만큼만 사용)"""
+        rng = random.Random(seed)
+        reservoir = []
+        for i, row in enumerate(rows):
+            if i < size:
+                reservoir.append(row)
+            else:
+                j = rng.randint(0, i)
+                if j < size:
+                    reservoir[j] = row
+        return reservoir
@@ -1,8 +1,13 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+from collections import Counter
 import difflib
-import re
+import heapq
+import math
+from .instrumentation import instrument_methods
+from .tokenizer import terms
 
 
+@instrument_methods('text_analyzer', rows=False)
 class TextAnalyzer:
     """텍스트 분석 유틸리티 클래스"""
     
@@ -63,24 +68,32 @@ class TextAnalyzer:
         
         return added, removed
 
-    def extract_keywords(self, text: str, top_n: int = 10) -> List[Tuple[str, int]]:
-        """주요 키워드 추출"""
-        # 불용어 목록
-        stopwords = set(['은', '는', '이', '가', '을', '를', '의', '와', '과', '으로', '로'])
+    def extract_keywords(
+        self,
+        text: str,
+        top_n: int = 10,
+        document_frequencies: Optional[Dict[str, int]] = None,
+        total_documents: int = 0
+    ) -> List[Tuple[str, float]]:
+        """주요 키워드 추출
         
-        # 단어 분리 및 카운트
-        words = text.split()
-        word_count = {}
+        document_frequencies 가 주어지면 말뭉치 기준 TF-IDF 로,
+        없으면 단어 빈도로 순위를 매깁니다.
+        """
+        term_counts = Counter(terms(text))
         
-        for word in words:
-            word = re.sub(r'[^\w\s]', '', word)  # 특수문자 제거
-            if word and word not in stopwords:
-                word_count[word] = word_count.get(word, 0) + 1
+        if document_frequencies is None:
+            return [(term, float(count)) for term, count in term_counts.most_common(top_n)]
         
-        # 상위 키워드 추출
-        sorted_words = sorted(
-            word_count.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )
-        return sorted_words[:top_n]
\ No newline at end of file
+        scores = {
+            term: tf_idf(count, document_frequencies.get(term, 0), total_documents)
+            for term, count in term_counts.items()
+        }
+        return heapq.nlargest(top_n, scores.items(), key=lambda x: x[1])
+
+
+def tf_idf(tf: int, df: int, total_documents: int) -> float:
+    """로그 스케일 TF 와 평활화 IDF 의 곱"""
+    if tf <= 0:
+        return 0.0
+    return (1.0 + math.log(tf)) * (math.log((1 + total_documents) / (1 + df)) + 1.0)
@@ -0,0 +1,68 @@
+from typing import List
+import re
+
+# 한글/영문/숫자 단어 패턴
+WORD_PATTERN = re.compile(r'[0-9A-Za-z가-힣]+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def normalize_text(text: str) -> str:
+    """비교용 텍스트 정규화 (소문자 변환, 공백 정리)"""
+    if not text:
+        return ''
+    return WHITESPACE_PATTERN.sub(' ', text.lower()).strip()
+
+
+def tokenize(text: str) -> List[str]:
+    """단어 단위 토큰 분리"""
+    if not text:
+        return []
+    return WORD_PATTERN.findall(text.lower())
+
+
+def char_ngrams(text: str, n: int = 5) -> List[str]:
+    """정규화된 텍스트의 문자 n-gram 목록"""
+    normalized = normalize_text(text)
+    if len(normalized) <= n:
+        return [normalized] if normalized else []
+    return [normalized[i:i + n] for i in range(len(normalized) - n + 1)]
+
+
+# 검색/키워드 분석에서 제외할 불용어
+STOPWORDS = frozenset([
+    # 한국어
+    '은', '는', '이', '가', '을', '를', '의', '와', '과', '으로', '로',
+    '에', '에서', '도', '만', '및', '또는', '그리고', '그', '저',
+    '것', '수', '등', '더', '하다', '있다', '없다', '합니다', '입니다',
+    '해주세요', '주세요', '하는', '있는', '대한', '통해', '위해',
+    # 영어
+    'a', 'an', 'the', 'and', 'or', 'of', 'to', 'in', 'on', 'for', 'with',
+    'is', 'are', 'be', 'as', 'by', 'at', 'it', 'this', 'that', 'from',
+    'you', 'your', 'please'
+])
+
+# 한국어 조사 (긴 것부터 검사)
+KOREAN_PARTICLES = (
+    '으로부터', '에서는', '에게서', '으로', '에서', '에게', '까지', '부터',
+    '보다', '처럼', '하고', '은', '는', '이', '가', '을', '를', '의',
+    '와', '과', '로', '에', '도', '만'
+)
+
+
+def strip_particle(word: str) -> str:
+    """한글 단어 끝의 조사 제거"""
+    for particle in KOREAN_PARTICLES:
+        if word.endswith(particle) and len(word) - len(particle) >= 2:
+            return word[:-len(particle)]
+    return word
+
+
+def terms(text: str) -> List[str]:
+    """색인용 용어 목록 (조사 및 불용어 제거)"""
+    result = []
+    for word in tokenize(text):
+        if '가' <= word[-1] <= '힣':
+            word = strip_particle(word)
+        if word not in STOPWORDS and len(word) > 1:
+            result.append(word)
+    return result
@@ -0,0 +1,43 @@
+from typing import Iterable
+import zlib
+import numpy as np
+from .tokenizer import terms
+
+
+class HashingVectorizer:
+    """해시 트릭 기반 고정 크기 TF 벡터 생성 클래스
+    
+    IDF 가중치는 말뭉치 전체의 문서 빈도가 필요하므로 검색 시점에 적용합니다.
+    """
+
+    def __init__(self, n_features: int = 1024):
+        self.n_features = n_features
+
+    def transform(self, text: str) -> np.ndarray:
+        """텍스트를 로그 스케일 TF 벡터로 변환"""
+        vector = np.zeros(self.n_features, dtype=np.float32)
+        tokens = terms(text)
+        if not tokens:
+            return vector
+
+        indices = np.fromiter(
+            (zlib.crc32(token.encode('utf-8')) % self.n_features for token in tokens),
+            dtype=np.int64,
+            count=len(tokens)
+        )
+        np.add.at(vector, indices, 1.0)
+        nonzero = vector > 0
+        vector[nonzero] = 1.0 + np.log(vector[nonzero])
+        return vector
+
+    def transform_fields(self, fields: Iterable[str]) -> np.ndarray:
+        """여러 텍스트 필드를 하나의 벡터로 변환"""
+        return self.transform('\n'.join(field for field in fields if field))
+
+    def to_bytes(self, vector: np.ndarray) -> bytes:
+        """벡터를 BLOB 저장용 바이트로 변환"""
+        return vector.astype(np.float32).tobytes()
+
+    def from_bytes(self, data: bytes) -> np.ndarray:
+        """BLOB 바이트를 벡터로 복원"""
+        return np.frombuffer(data, dtype=np.float32)
@@ -1,5 +1,7 @@
 import streamlit as st
+from src.database.database import DatabaseError
 from src.managers.analytics_manager import AnalyticsManager
+from src.views.cache import cached_read
 import pandas as pd
 
 class AnalyticsView:
@@ -16,11 +18,12 @@ class AnalyticsView:
         self._render_model_usage()
         self._render_category_stats()
         self._render_user_contribution()
+        self._render_top_keywords()
 
     def _render_creation_trends(self):
         """생성 추이 차트"""
         st.subheader("프롬프트 생성 추이")
-        dates, counts = self.manager.get_creation_trends()
+        dates, counts = cached_read(self.manager.get_creation_trends)
         
         if dates and counts:
             chart_data = pd.DataFrame({
@@ -34,7 +37,7 @@ class AnalyticsView:
     def _render_model_usage(self):
         """모델 사용 통계"""
         st.subheader("모델별 사용 통계")
-        stats = self.manager.get_model_usage_stats()
+        stats = cached_read(self.manager.get_model_usage_stats)
         
         if stats:
             chart_data = pd.DataFrame({
@@ -48,7 +51,7 @@ class AnalyticsView:
     def _render_category_stats(self):
         """카테고리 통계"""
         st.subheader("카테고리별 통계")
-        stats = self.manager.get_category_stats()
+        stats = cached_read(self.manager.get_category_stats)
         
         if stats:
             chart_data = pd.DataFrame({
@@ -62,7 +65,7 @@ class AnalyticsView:
     def _render_user_contribution(self):
         """사용자 기여도 통계"""
         st.subheader("사용자별 기여도")
-        stats = self.manager.get_user_contribution_stats()
+        stats = cached_read(self.manager.get_user_contribution_stats)
         
         col1, col2 = st.columns(2)
         
@@ -86,4 +89,38 @@ class AnalyticsView:
                 })
                 st.bar_chart(chart_data.set_index('user'))
             else:
-                st.info("베스트 프롬프트 데이터가 없습니다.")
\ No newline at end of file
+                st.info("베스트 프롬프트 데이터가 없습니다.")
+
+    def _render_top_keywords(self):
+        """그룹별 상위 키워드"""
+        st.subheader("그룹별 주요 키워드")
+        
+        group_labels = {
+            'category': '카테고리',
+            'model': '모델',
+            'department': '부서'
+        }
+        group_by = st.selectbox(
+            "집계 기준",
+            options=list(group_labels.keys()),
+            format_func=lambda x: group_labels[x]
+        )
+        
+        try:
+            keywords = cached_read(self.manager.get_top_keywords, group_by)
+        except DatabaseError as e:
+            st.error(f"키워드를 불러오지 못했습니다: {e}")
+            return
+        
+        if keywords:
+            columns = st.columns(min(len(keywords), 3))
+            for i, (value, terms) in enumerate(keywords.items()):
+                with columns[i % len(columns)]:
+                    st.markdown(f"##### {value}")
+                    if terms:
+                        chart_data = pd.DataFrame(terms, columns=['keyword', 'score'])
+                        st.bar_chart(chart_data.set_index('keyword'))
+                    else:
+                        st.info("키워드 데이터가 없습니다.")
+        else:
+            st.info("키워드 데이터가 없습니다.")
@@ -0,0 +1,56 @@
+from datetime import datetime
+import streamlit as st
+from src.managers.backup_manager import BackupManager
+
+class BackupView:
+    """데이터베이스 백업 목록과 지금 백업 화면 (관리자 전용)"""
+
+    def __init__(self, backup_manager: BackupManager):
+        self.manager = backup_manager
+
+    def render_backups(self):
+        """백업 렌더링"""
+        st.header("백업")
+
+        if self.manager.interval_hours:
+            st.caption(f"{self.manager.interval_hours}시간마다 {self.manager.directory} 에 스냅숏을 만들고 "
+                       f"최근 {self.manager.keep}개를 보관합니다.")
+        else:
+            st.info("자동 백업이 꺼져 있습니다 (database.backup_interval_hours).")
+
+        self._render_job()
+        self._render_list()
+
+    def _render_job(self):
+        """지금 백업"""
+        status = self.manager.status
+        if st.button("지금 백업", disabled=status.get('running', False)):
+            self.manager.start_background()
+            st.rerun()
+
+        if 'started_at' in status:
+            started = datetime.fromtimestamp(status['started_at'])
+            if status['running']:
+                st.write(f"백업 중 (시작 {started:%H:%M:%S})")
+                if st.button("새로고침"):
+                    st.rerun()
+            elif status.get('error'):
+                st.error(f"백업 오류: {status['error']}")
+
+        result = self.manager.last_result()
+        if result is not None and result.path:
+            st.write(f"마지막 백업: {result.path} ({result.bytes / 2 ** 20:.1f}MB, "
+                     f"{result.duration_sec}초, 다시 복사 {result.restarts}회, 검사 {result.integrity})")
+
+    def _render_list(self):
+        """보관 중인 스냅숏"""
+        st.subheader("보관 중인 스냅숏")
+        backups = self.manager.get_backups()
+        if not backups:
+            st.info("백업이 없습니다.")
+            return
+        st.dataframe(
+            [{key: backup[key] for key in ('name', 'size_mb', 'created_at')} for backup in backups],
+            hide_index=True
+        )
+        st.caption("복원은 앱을 멈춘 뒤 python -m src.cli restore <파일> 로 실행합니다.")
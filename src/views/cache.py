@@ -0,0 +1,26 @@
+from typing import Tuple
+import streamlit as st
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _cached_call(_method, method_key: str, data_version: Tuple, args: tuple, kwargs: dict):
+    """데이터 버전이 같으면 이전 결과 재사용 (_method 는 해시 대상에서 제외)"""
+    return _method(*args, **kwargs)
+
+
+def cached_read(method, *args, scopes: Tuple[str, ...] = ('prompts',), **kwargs):
+    """매니저 읽기 메서드 결과 캐시
+
+    쓰기 때마다 올라가는 데이터베이스의 범위별 데이터 버전을 캐시 키에 넣어
+    다른 세션이나 명령줄 도구에서 저장한 내용도 다음 재실행에 반영됩니다.
+    """
+    manager = method.__self__
+    database = manager.database
+    versions = database.get_data_versions()
+    return _cached_call(
+        method,
+        f"{type(manager).__name__}.{method.__name__}@{database.db_path}",
+        tuple(versions.get(scope, 0) for scope in scopes),
+        args,
+        kwargs
+    )
@@ -0,0 +1,23 @@
+import streamlit as st
+from src.managers.history_manager import HistoryManager
+from src.views.cache import cached_read
+
+class ChangeLogView:
+    """변경 이력 화면"""
+    
+    def __init__(self, history_manager: HistoryManager):
+        self.manager = history_manager
+
+    def render_change_logs(self):
+        """변경 이력 렌더링"""
+        st.header("변경 이력")
+        history_data = cached_read(self.manager.get_change_logs)
+        
+        budget = history_data.attrs.get('budget')
+        if budget:
+            st.caption(f"최근 {budget['loaded_rows']}건만 표시합니다 (전체 {budget['total_rows']}건).")
+        
+        if not history_data.empty:
+            st.dataframe(history_data)
+        else:
+            st.info("변경 이력이 없습니다.")
@@ -0,0 +1,82 @@
+from datetime import datetime
+import streamlit as st
+from src.managers.compression_manager import CompressionManager
+
+class CompressionView:
+    """본문 압축 통계와 재압축 작업 화면 (관리자 전용)"""
+
+    def __init__(self, compression_manager: CompressionManager):
+        self.manager = compression_manager
+
+    def render_compression(self):
+        """본문 압축 렌더링"""
+        st.header("본문 압축")
+
+        if self.manager.enabled:
+            st.caption(f"{self.manager.min_bytes:,}바이트 이상인 본문을 저장할 때 압축합니다.")
+        else:
+            st.info("압축이 꺼져 있습니다 (compression.enabled). 이미 압축된 값은 그대로 읽을 수 "
+                    "있고, 재압축을 실행하면 원문으로 되돌립니다.")
+
+        self._render_stats()
+        self._render_dictionaries()
+        self._render_job()
+
+    def _render_stats(self):
+        """컬럼별 압축률"""
+        st.subheader("컬럼별 압축률")
+        stats = self.manager.get_stats()
+        st.dataframe(stats, hide_index=True)
+
+        raw, stored = int(stats['raw_bytes'].sum()), int(stats['stored_bytes'].sum())
+        if raw:
+            col1, col2, col3 = st.columns(3)
+            col1.metric("원문 크기 (MB)", round(raw / 2 ** 20, 1))
+            col2.metric("저장 크기 (MB)", round(stored / 2 ** 20, 1))
+            col3.metric("압축률", f"{stored / raw:.1%}")
+        st.caption("줄어든 공간은 데이터베이스 파일 안에서 재사용되며, 파일 크기는 VACUUM 후에 줄어듭니다.")
+
+    def _render_dictionaries(self):
+        """압축 사전 목록과 학습"""
+        st.subheader("압축 사전")
+        dictionaries = self.manager.get_dictionaries()
+        if dictionaries.empty:
+            st.info("학습된 사전이 없습니다. 사전 없이 zlib 으로만 압축합니다.")
+        else:
+            st.dataframe(dictionaries, hide_index=True)
+
+        if st.button("새 사전 학습"):
+            dict_id = self.manager.train_dictionary()
+            if dict_id is None:
+                st.warning("반복되는 문장이 부족해 사전을 만들지 못했습니다.")
+            else:
+                st.success(f"사전 {dict_id} 을(를) 만들었습니다. 재압축을 실행하면 기존 행에도 적용됩니다.")
+
+    def _render_job(self):
+        """백그라운드 재압축 작업"""
+        st.subheader("재압축 작업")
+        status = self.manager.status
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("재압축 시작", disabled=status.get('running', False)):
+                self.manager.start_background()
+                st.rerun()
+        with col2:
+            if st.button("중지", disabled=not status.get('running', False)):
+                self.manager.stop_background()
+
+        if 'started_at' not in status:
+            return
+
+        started = datetime.fromtimestamp(status['started_at'])
+        state = "실행 중" if status['running'] else ("중지됨" if status.get('stopped') else "완료")
+        st.write(f"{state} (시작 {started:%H:%M:%S}) - 확인한 행 {status.get('scanned', 0):,}개, "
+                 f"바꾼 값 {status.get('changed_values', 0):,}개")
+        if status.get('bytes_before'):
+            st.write(f"바꾼 값 크기: {status['bytes_before'] / 2 ** 20:.1f}MB → "
+                     f"{status['bytes_after'] / 2 ** 20:.1f}MB")
+        if status.get('error'):
+            st.error(f"재압축 오류: {status['error']}")
+        if status['running'] and st.button("새로고침"):
+            st.rerun()
@@ -1,7 +1,15 @@
 # src/views/consistency_test_view.py
+from collections import deque
+
 import streamlit as st
+import pandas as pd
 from ..managers.test_manager import TestManager
 
+# 화면에 보관할 최대 상세 결과 수 (대규모 매트릭스에서도 메모리 일정)
+MAX_KEPT_RESULTS = 1000
+# 실행 중 표에 표시할 최근 결과 수
+LIVE_TABLE_ROWS = 50
+
 class ConsistencyTestView:
     """프롬프트 일관성 테스트 화면"""
     
@@ -15,38 +23,261 @@ class ConsistencyTestView:
         prompt = st.text_area(
             "테스트할 프롬프트를 입력하세요",
             height=200,
-            help="테스트하고자 하는 프롬프트 템플릿을 입력하세요."
+            help="테스트하고자 하는 프롬프트 템플릿을 입력하세요. {{변수}} 형식의 템플릿 변수를 사용할 수 있습니다."
         )
         
-        test_cases = st.text_area(
-            "테스트 케이스를 입력하세요 (각 줄에 하나씩)",
-            height=100,
-            help="각 줄에 하나의 테스트 케이스를 입력하세요."
+        mode = st.radio(
+            "테스트 케이스 입력 방식",
+            options=["줄 단위 입력", "템플릿 변수 매트릭스"],
+            horizontal=True
         )
         
+        test_list, matrix, sample = [], None, None
+        if mode == "줄 단위 입력":
+            test_cases = st.text_area(
+                "테스트 케이스를 입력하세요 (각 줄에 하나씩)",
+                height=100,
+                help="각 줄에 하나의 테스트 케이스를 입력하세요."
+            )
+            # 테스트 케이스 전처리
+            test_list = [case.strip() for case in test_cases.split('\n') if case.strip()]
+        else:
+            matrix, sample = self._render_matrix_inputs(prompt)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            models = st.multiselect(
+                "모델",
+                options=self.manager.available_models(),
+                default=['stub'] if 'stub' in self.manager.available_models() else None
+            )
+        with col2:
+            repetitions = st.number_input(
+                "반복 횟수",
+                min_value=1,
+                max_value=50,
+                value=self.manager.config.get('execution.repetitions', 1)
+            )
+        with col3:
+            temperature = st.slider("temperature", 0.0, 1.0, 0.0, 0.1)
+            use_cache = st.checkbox(
+                "응답 캐시 사용",
+                value=True,
+                help="temperature 가 0 보다 크면 반복마다 따로 캐시합니다. 새 응답을 받으려면 해제하세요."
+            )
+        
         if st.button("테스트 실행"):
             if not prompt:
                 st.warning("프롬프트를 입력해주세요.")
                 return
                 
-            if not test_cases:
+            if not test_list and matrix is None:
                 st.warning("테스트 케이스를 입력해주세요.")
                 return
             
-            # 테스트 케이스 전처리
-            test_list = [case.strip() for case in test_cases.split('\n') if case.strip()]
+            if not models:
+                st.warning("모델을 선택해주세요.")
+                return
             
-            # 테스트 실행
-            results = self.manager.run_consistency_test(prompt, test_list)
+            params = {'temperature': temperature}
+            repetitions = int(repetitions)
+            
+            if matrix is None:
+                case_count = len(test_list)
+                stream = self.manager.iter_consistency_test(
+                    prompt, test_list, models, repetitions, params, use_cache
+                )
+            else:
+                case_count = sample or len(matrix)
+                stream = self.manager.iter_matrix_test(
+                    prompt, matrix, models, repetitions, params,
+                    sample=sample, use_cache=use_cache
+                )
+            
+            # 테스트 실행 (완료되는 순서대로 표시)
+            results, completed, cache_summary = self._run_streaming(
+                stream,
+                case_count * len(models) * repetitions,
+                len(models) * repetitions
+            )
+            
+            if completed > len(results):
+                kept_cases = len({result['test_index'] for result in results})
+                st.info(
+                    f"전체 {completed}건 중 테스트 케이스 {kept_cases}개의 결과 {len(results)}건만 "
+                    f"상세 결과와 일관성 분석에 사용합니다. 캐시 적중률은 전체 결과 기준입니다."
+                )
+            
+            # 일관성 분석
+            if repetitions > 1:
+                self._render_consistency(results)
             
             # 결과 표시
             st.subheader("테스트 결과")
-            for i, result in enumerate(results, 1):
-                with st.expander(f"테스트 케이스 {i}"):
-                    st.write("입력:", result['input'])
-                    st.write("결과:")
-                    st.code(result['combined_prompt'])
+            if use_cache:
+                st.metric(
+                    "캐시 적중률",
+                    f"{cache_summary['hit_ratio']:.0%}",
+                    help=f"{cache_summary['hits']} / {cache_summary['requests']} 요청"
+                )
+            
+            self._render_results(results)
+
+    def _render_matrix_inputs(self, prompt: str):
+        """템플릿 변수 매트릭스 입력 (매트릭스, 표본 크기)"""
+        variables = sorted(self.manager.get_template_variables(prompt)) if prompt else []
+        if variables:
+            st.caption("템플릿 변수: " + ", ".join(variables))
+        
+        source = st.radio(
+            "매트릭스 정의",
+            options=["JSON", "CSV/JSONL 파일"],
+            horizontal=True
+        )
+        
+        try:
+            if source == "JSON":
+                spec = st.text_area(
+                    "변수별 값 목록 (JSON)",
+                    value='{' + ', '.join(f'"{name}": []' for name in variables) + '}',
+                    height=100
+                )
+                matrix = self.manager.create_test_matrix(spec)
+            else:
+                uploaded = st.file_uploader("조합 파일", type=['csv', 'jsonl'])
+                if uploaded is None:
+                    return None, None
+                matrix = self.manager.create_test_matrix(uploaded)
+        except ValueError as e:
+            st.error(f"매트릭스 정의 오류: {str(e)}")
+            return None, None
+        
+        total = len(matrix)
+        sample = st.number_input(
+            f"표본 크기 (전체 {total}개 조합, 0 이면 전체)",
+            min_value=0,
+            max_value=max(total, 0),
+            value=0
+        )
+        if total == 0:
+            return None, None
+        return matrix, int(sample) or None
+
+    def _render_results(self, results):
+        """테스트 케이스별 상세 결과"""
+        cases = {}
+        for result in results:
+            cases.setdefault(result['test_index'], []).append(result)
+        
+        for test_index in sorted(cases):
+            case_results = sorted(
+                cases[test_index],
+                key=lambda r: (r['model'], r['repetition'])
+            )
+            with st.expander(f"테스트 케이스 {test_index + 1}"):
+                st.write("입력:", case_results[0]['input'])
+                st.code(case_results[0]['combined_prompt'])
+                
+                for result in case_results:
+                    st.markdown(f"##### {result['model']} #{result['repetition'] + 1}")
+                    if result['error']:
+                        st.error(result['error'])
+                        continue
                     
-                    st.write("통계:")
-                    for key, value in result['stats'].items():
-                        st.text(f"{key}: {value}")
\ No newline at end of file
+                    st.write(result['response'])
+                    st.caption(
+                        " / ".join(f"{key}: {value}" for key, value in result['stats'].items())
+                    )
+
+    def _render_consistency(self, results):
+        """반복 응답 일관성 행렬 및 통계 표시"""
+        import altair as alt
+        
+        st.subheader("일관성 분석")
+        summaries = self.manager.summarize_consistency(results)
+        
+        st.dataframe(
+            pd.DataFrame([
+                {
+                    '테스트 케이스': summary['test_index'] + 1,
+                    '모델': summary['model'],
+                    '응답 수': summary['count'],
+                    '평균 유사도': round(summary['mean_similarity'], 3),
+                    '표준편차': round(summary['std_similarity'], 3),
+                    '최소 유사도': round(summary['min_similarity'], 3),
+                    '이상치': ', '.join(
+                        f"#{summary['repetitions'][i] + 1}" for i in summary['outliers']
+                    )
+                }
+                for summary in summaries
+            ]),
+            use_container_width=True
+        )
+        
+        for summary in summaries:
+            if summary['count'] < 2:
+                continue
+            
+            with st.expander(f"테스트 케이스 {summary['test_index'] + 1} / {summary['model']} 유사도 행렬"):
+                labels = [f"#{r + 1}" for r in summary['repetitions']]
+                matrix = pd.DataFrame(summary['matrix'], index=labels, columns=labels)
+                heatmap_data = (
+                    matrix.reset_index(names='row')
+                    .melt(id_vars='row', var_name='column', value_name='similarity')
+                )
+                st.altair_chart(
+                    alt.Chart(heatmap_data).mark_rect().encode(
+                        x=alt.X('column:N', sort=labels, title=None),
+                        y=alt.Y('row:N', sort=labels, title=None),
+                        color=alt.Color('similarity:Q', scale=alt.Scale(domain=[0, 1])),
+                        tooltip=['row', 'column', alt.Tooltip('similarity:Q', format='.3f')]
+                    ),
+                    use_container_width=True
+                )
+
+    def _run_streaming(self, stream, total, case_size):
+        """결과를 받는 즉시 진행 상황 갱신 (보관 결과, 완료 수, 전체 캐시 적중률)
+        
+        상세 결과는 MAX_KEPT_RESULTS 건까지만 보관하되 테스트 케이스 단위(모델 x 반복 전체)로
+        보관해 일관성 분석이 일부 반복만으로 계산되지 않게 합니다. 먼저 끝나는 캐시 적중
+        결과에 치우치지 않도록 캐시 적중률은 모든 결과로 셉니다.
+        """
+        progress = st.progress(0.0, text=f"0 / {total}")
+        table = st.empty()
+        
+        results = []
+        kept_cases = set()
+        recent = deque(maxlen=LIVE_TABLE_ROWS)
+        completed = hits = 0
+        for result in stream:
+            completed += 1
+            hits += bool(result.get('cached'))
+            recent.append(result)
+            
+            test_index = result['test_index']
+            if test_index not in kept_cases and (
+                not kept_cases or (len(kept_cases) + 1) * case_size <= MAX_KEPT_RESULTS
+            ):
+                kept_cases.add(test_index)
+            if test_index in kept_cases:
+                results.append(result)
+            
+            progress.progress(
+                min(completed / total, 1.0) if total else 1.0,
+                text=f"{completed} / {total}"
+            )
+            # 표 갱신 비용이 결과 수에 비례하지 않도록 최근 결과만 표시
+            if completed <= LIVE_TABLE_ROWS or completed % LIVE_TABLE_ROWS == 0:
+                table.dataframe(
+                    pd.DataFrame(list(recent))[
+                        ['test_index', 'model', 'repetition', 'cached', 'latency_ms', 'error', 'response']
+                    ],
+                    use_container_width=True
+                )
+        
+        cache_summary = {
+            'requests': completed,
+            'hits': hits,
+            'hit_ratio': hits / completed if completed else 0.0
+        }
+        return results, completed, cache_summary
@@ -3,6 +3,7 @@ import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 from src.managers.history_manager import HistoryManager
+from src.views.cache import cached_read
 
 class HistoryView:
     """프롬프트 히스토리 조회 화면"""
@@ -14,43 +15,82 @@ class HistoryView:
         """히스토리 화면 렌더링"""
         st.header("프롬프트 히스토리")
         
+        # 검색 섹션
+        with st.expander("프롬프트 검색", expanded=False):
+            self._render_search()
+        
         # 필터 섹션
         with st.expander("필터 옵션", expanded=True):
             filters = self._render_filters()
         
-        # 히스토리 데이터 조회
-        history = self.manager.get_history(filters)
+        # 데이터 표시 옵션
+        display_options = self._render_display_options()
         
-        if not history.empty:
-            # 데이터 표시 옵션
-            display_options = self._render_display_options()
-            
-            # 선택된 컬럼만 표시
-            if display_options['columns']:
-                history = history[display_options['columns']]
-            
-            # 정렬
-            if display_options['sort_by']:
-                history = history.sort_values(
-                    by=display_options['sort_by'],
-                    ascending=display_options['sort_ascending']
-                )
+        # 정렬과 페이지는 SQL 에서 적용하고 현재 페이지만 화면으로 전송
+        history, total = cached_read(
+            self.manager.get_history_page,
+            filters,
+            display_options['sort_by'],
+            display_options['sort_ascending'],
+            display_options['page'],
+            display_options['page_size'],
+            display_options['columns'],
+            scopes=('prompts', 'rules')
+        )
+        
+        if total:
+            self._render_page_caption(total, display_options)
             
             # 데이터 표시
             st.dataframe(
-                history,
+                history.drop(columns=['id']) if 'id' not in display_options['columns'] else history,
                 use_container_width=True,
-                height=display_options['height']
+                height=display_options['height'],
+                hide_index=True
             )
             
             # 내보내기 옵션
-            self._render_export_options(history)
+            self._render_export_options(filters)
             
             # 통계 정보
-            self._render_stats(history)
+            self._render_stats(filters)
+            
+            # 유사 프롬프트 (현재 페이지 기준)
+            self._render_similar_prompts(history)
         else:
             st.info("조회된 데이터가 없습니다.")
 
+    def _render_page_caption(self, total: int, display_options: Dict):
+        """전체 건수와 현재 페이지 범위 표시"""
+        start = (display_options['page'] - 1) * display_options['page_size']
+        if start >= total:
+            st.warning(f"총 {total}건으로 {display_options['page']} 페이지가 없습니다.")
+            return
+        end = min(start + display_options['page_size'], total)
+        pages = -(-total // display_options['page_size'])
+        st.caption(f"총 {total}건 중 {start + 1}-{end} ({display_options['page']}/{pages} 페이지)")
+
+    def _render_search(self):
+        """검색어 순위 검색 렌더링"""
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            term = st.text_input("검색어", placeholder="제목, 쿼리, 내용 검색").strip()
+        
+        with col2:
+            page = st.number_input("페이지", min_value=1, value=1, step=1)
+        
+        if term:
+            results, total = self.manager.search_prompts(term, page=int(page))
+            if not results.empty:
+                st.caption(f"총 {total}건")
+                st.dataframe(
+                    results[['score', 'id', 'title', 'model', 'version', 'created_at']],
+                    use_container_width=True
+                )
+            else:
+                st.info("검색 결과가 없습니다.")
+
     def _render_filters(self) -> Dict:
         """필터 옵션 렌더링"""
         filters = {}
@@ -114,6 +154,17 @@ class HistoryView:
             if creator_filter:
                 filters['created_by'] = creator_filter
         
+        # 구조 규칙 위반 필터 (일괄 검사 결과 기준)
+        rule_names = cached_read(self.manager.get_rule_names, scopes=('rules',))
+        if rule_names:
+            failed_rules = st.multiselect(
+                "구조 규칙 위반",
+                options=rule_names,
+                placeholder="위반한 규칙 선택"
+            )
+            if failed_rules:
+                filters['failed_rules'] = failed_rules
+        
         return filters
 
     def _render_display_options(self) -> Dict:
@@ -146,7 +197,7 @@ class HistoryView:
             # 정렬 옵션
             options['sort_by'] = st.selectbox(
                 "정렬 기준",
-                options=["created_at", "title", "version"],
+                options=["created_at", "title", "version", "model", "category"],
                 index=0
             )
             
@@ -154,11 +205,27 @@ class HistoryView:
                 "오름차순 정렬",
                 value=False
             )
+            
+            page_col, size_col = st.columns(2)
+            with page_col:
+                options['page'] = int(st.number_input(
+                    "페이지",
+                    min_value=1,
+                    value=1,
+                    step=1,
+                    key="history_page"
+                ))
+            with size_col:
+                options['page_size'] = st.selectbox(
+                    "페이지당 행 수",
+                    options=[20, 50, 100, 200],
+                    index=1
+                )
         
         return options
 
-    def _render_export_options(self, data: pd.DataFrame):
-        """내보내기 옵션 렌더링"""
+    def _render_export_options(self, filters: Dict):
+        """내보내기 옵션 렌더링 (버튼을 누를 때만 전체 조회)"""
         col1, col2 = st.columns(2)
         
         with col1:
@@ -170,10 +237,15 @@ class HistoryView:
         with col2:
             if st.button("내보내기"):
                 try:
-                    file_data = self.manager.export_history(
-                        data,
-                        export_format.lower()
-                    )
+                    history = self.manager.get_history(filters)
+                    budget = history.attrs.get('budget')
+                    if budget:
+                        st.warning(
+                            f"읽기 예산 때문에 전체 {budget['total_rows']}건 중 "
+                            f"{budget['loaded_rows']}건, {len(budget['columns'])}개 컬럼만 "
+                            "내보냅니다. 필터로 범위를 좁혀 주세요."
+                        )
+                    file_data = self.manager.export_history(history, export_format.lower())
                     
                     file_name = f"prompt_history_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
                     file_extension = export_format.lower()
@@ -197,21 +269,47 @@ class HistoryView:
         }
         return mime_types.get(format, 'text/plain')
 
-    def _render_stats(self, data: pd.DataFrame):
-        """통계 정보 렌더링"""
+    def _render_similar_prompts(self, page_data: pd.DataFrame):
+        """유사 프롬프트 조회 렌더링"""
+        with st.expander("유사 프롬프트 찾기", expanded=False):
+            prompt_options = [
+                {
+                    'id': row['id'],
+                    'title': row.get('title', f"#{row['id']}"),
+                    'version': row.get('version', '-')
+                }
+                for row in page_data.to_dict('records')
+            ]
+            selected = st.selectbox(
+                "기준 프롬프트 (현재 페이지)",
+                options=prompt_options,
+                format_func=lambda p: f"{p['title']} (v{p['version']})",
+                index=None,
+                key="similar_prompt_source"
+            )
+            
+            if selected:
+                similar = self.manager.find_similar_prompts(selected['id'])
+                if not similar.empty:
+                    similar['similarity'] = similar['similarity'].map(lambda x: f"{x:.2%}")
+                    st.dataframe(similar, use_container_width=True)
+                else:
+                    st.info("유사한 프롬프트가 없습니다.")
+
+    def _render_stats(self, filters: Dict):
+        """통계 정보 렌더링 (집계 쿼리 기준)"""
         with st.expander("통계 정보", expanded=False):
+            stats = cached_read(self.manager.get_history_stats, filters, scopes=('prompts', 'rules'))
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                st.metric("총 프롬프트 수", len(data))
-                st.metric("베스트 프롬프트 수", len(data[data['is_best']]))
+                st.metric("총 프롬프트 수", stats['total'])
+                st.metric("베스트 프롬프트 수", stats['best'])
             
             with col2:
-                model_counts = data['model'].value_counts()
                 st.write("모델별 분포")
-                st.bar_chart(model_counts)
+                st.bar_chart(pd.Series(stats['model'], name='count'))
             
             with col3:
-                category_counts = data['category'].value_counts()
                 st.write("카테고리별 분포")
-                st.bar_chart(category_counts)
+                st.bar_chart(pd.Series(stats['category'], name='count'))
@@ -0,0 +1,74 @@
+from datetime import datetime
+import streamlit as st
+from src.managers.metrics_manager import MetricsManager
+
+class MemoryView:
+    """DataFrame 크기와 재실행별 메모리 사용량 화면 (관리자 전용)"""
+
+    def __init__(self, metrics_manager: MetricsManager):
+        self.manager = metrics_manager
+
+    def render_memory(self):
+        """메모리 사용량 렌더링"""
+        st.header("메모리 사용량")
+
+        if not self.manager.memory_enabled:
+            st.info("메모리 기록이 꺼져 있습니다. 설정의 memory.enabled 를 확인하세요.")
+            return
+
+        started = datetime.fromtimestamp(self.manager.memory_tracker.started_at)
+        st.caption(f"{started:%Y-%m-%d %H:%M:%S} 이후 이 프로세스에서 수집한 기록")
+
+        self._render_budget()
+        self._render_frames()
+        self._render_reruns()
+
+        if st.button("메모리 기록 초기화"):
+            self.manager.reset_memory_stats()
+            st.rerun()
+
+    def _render_budget(self):
+        """읽기 예산 설정"""
+        budget = self.manager.get_read_budget()
+        col1, col2, col3 = st.columns(3)
+        col1.metric("최대 행 수", budget['max_rows'] or "제한 없음")
+        col2.metric("최대 크기 (MB)", budget['max_mb'] or "제한 없음")
+        col3.metric("초과 시 동작", budget['on_exceed'])
+
+    def _render_frames(self):
+        """조회 메서드별 반환 DataFrame 크기"""
+        st.subheader("조회별 DataFrame 크기")
+        frames = self.manager.get_frame_stats()
+        if frames.empty:
+            st.info("기록된 DataFrame 이 없습니다.")
+            return
+
+        hits = int(frames['budget_hits'].sum())
+        if hits:
+            st.warning(f"읽기 예산으로 줄이거나 나눠 읽은 조회 {hits}건")
+        st.dataframe(frames, hide_index=True)
+        st.bar_chart(frames.head(15).set_index('operation')['max_mb'])
+
+    def _render_reruns(self):
+        """최근 재실행의 tracemalloc 측정 결과"""
+        st.subheader("재실행별 메모리 할당")
+        if not self.manager.trace_reruns:
+            st.info("재실행 추적이 꺼져 있습니다. 설정의 memory.trace_reruns 를 켜면 "
+                    "tracemalloc 으로 재실행마다 할당량을 기록합니다 (실행 속도가 느려집니다).")
+            return
+
+        reruns = self.manager.get_rerun_memory()
+        if reruns.empty:
+            st.info("기록된 재실행이 없습니다.")
+            return
+
+        st.dataframe(reruns, hide_index=True)
+        selected = st.selectbox(
+            "할당 위치 보기",
+            options=list(range(len(reruns))),
+            format_func=lambda i: (
+                f"{reruns['recorded_at'].iloc[i]:%H:%M:%S} {reruns['label'].iloc[i]} "
+                f"(최대 {reruns['peak_kb'].iloc[i]}KB)"
+            )
+        )
+        st.dataframe(self.manager.get_rerun_allocations(selected), hide_index=True)
@@ -0,0 +1,51 @@
+from datetime import datetime
+import streamlit as st
+from src.managers.metrics_manager import MetricsManager
+
+class MetricsView:
+    """성능 지표 화면 (관리자 전용)"""
+
+    def __init__(self, metrics_manager: MetricsManager):
+        self.manager = metrics_manager
+
+    def render_metrics(self):
+        """성능 지표 렌더링"""
+        st.header("성능 지표")
+
+        if not self.manager.enabled:
+            st.info("계측이 꺼져 있습니다. 설정의 instrumentation.enabled 를 확인하세요.")
+            return
+
+        started = datetime.fromtimestamp(self.manager.started_at)
+        st.caption(f"{started:%Y-%m-%d %H:%M:%S} 이후 이 프로세스에서 수집한 지표")
+
+        stats = self.manager.get_operation_stats()
+        if stats.empty:
+            st.info("수집된 지표가 없습니다.")
+        else:
+            prefixes = sorted({name.split('.')[0] for name in stats['operation']})
+            selected = st.multiselect("대상", options=prefixes, default=prefixes)
+            stats = stats[stats['operation'].str.split('.').str[0].isin(selected)]
+
+            st.dataframe(stats, hide_index=True)
+
+            st.subheader("누적 시간 상위 작업")
+            st.bar_chart(stats.head(15).set_index('operation')['total_ms'])
+
+        self._render_export()
+
+    def _render_export(self):
+        """Prometheus 내보내기 및 초기화"""
+        st.subheader("내보내기")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button(
+                "Prometheus 텍스트 다운로드",
+                self.manager.to_prometheus(),
+                "metrics.prom",
+                "text/plain"
+            )
+        with col2:
+            if st.button("지표 초기화"):
+                self.manager.reset()
+                st.rerun()
@@ -136,8 +136,23 @@ class PromptView:
                 "user_role": st.session_state.current_user['role']
             })
             
+            # 유사 중복 프롬프트가 있으면 저장하지 않고 먼저 알림 (같은 내용으로 다시 저장하면 저장)
+            if st.session_state.get('duplicate_warned_content') != save_data['prompt_content']:
+                duplicates = self.manager.find_near_duplicates(save_data['prompt_content'])
+                if duplicates:
+                    st.session_state.duplicate_warned_content = save_data['prompt_content']
+                    st.warning("내용이 거의 같은 프롬프트가 이미 저장되어 있습니다. "
+                               "그래도 저장하려면 저장을 한 번 더 누르세요.")
+                    for duplicate in duplicates:
+                        st.write(
+                            f"- {duplicate['title']} (v{duplicate['version']}, "
+                            f"유사도 {duplicate['similarity']:.0%})"
+                        )
+                    return
+            st.session_state.pop('duplicate_warned_content', None)
+            
             # 프롬프트 저장
-            prompt_id = self.manager.create_prompt(save_data)
+            self.manager.create_prompt(save_data)
             
             # 자동 버전 증가 처리
             if self.form_data.get('auto_increment'):
@@ -0,0 +1,72 @@
+import streamlit as st
+from src.managers.metrics_manager import MetricsManager
+
+class QueryView:
+    """SQL 모양별 통계와 느린 쿼리 화면 (관리자 전용)"""
+
+    def __init__(self, metrics_manager: MetricsManager):
+        self.manager = metrics_manager
+
+    def render_queries(self):
+        """쿼리 추적 결과 렌더링"""
+        st.header("느린 쿼리")
+
+        if not self.manager.tracing_enabled:
+            st.info("쿼리 추적이 꺼져 있습니다. 설정의 query_tracing.enabled 를 확인하세요.")
+            return
+
+        st.caption(f"기준 시간 {self.manager.slow_query_ms}ms 이상인 쿼리의 실행 계획을 저장합니다.")
+
+        self._render_slow_queries()
+        self._render_shapes()
+
+    def _render_slow_queries(self):
+        """저장된 느린 쿼리 (인덱스 없이 전체 테이블을 읽는 쿼리 표시)"""
+        summary = self.manager.get_slow_query_summary()
+        if summary.empty:
+            st.info("저장된 느린 쿼리가 없습니다.")
+            return
+
+        full_scans = int(summary['full_scan'].sum())
+        if full_scans:
+            st.warning(f"전체 테이블 스캔 쿼리 모양 {full_scans}개")
+
+        st.subheader("모양별 집계")
+        summary['full_scan'] = summary['full_scan'].astype(bool)
+        st.dataframe(summary, hide_index=True)
+
+        st.subheader("최근 느린 쿼리")
+        full_scan_only = st.checkbox("전체 테이블 스캔만 보기")
+        queries = self.manager.get_slow_queries(full_scan_only=full_scan_only)
+        queries['full_scan'] = queries['full_scan'].astype(bool)
+        st.dataframe(queries.drop(columns=['sql_text', 'plan']), hide_index=True)
+
+        if not queries.empty:
+            selected = st.selectbox(
+                "실행 계획 보기",
+                options=queries['id'].tolist(),
+                format_func=lambda query_id: (
+                    f"#{query_id} "
+                    f"{queries.loc[queries['id'] == query_id, 'duration_ms'].iloc[0]}ms"
+                )
+            )
+            query = queries[queries['id'] == selected].iloc[0]
+            st.code(query['sql_text'], language='sql')
+            st.code(query['plan'] or "실행 계획 없음", language='text')
+
+        if st.button("느린 쿼리 기록 삭제"):
+            self.manager.clear_slow_queries()
+            st.rerun()
+
+    def _render_shapes(self):
+        """이 프로세스에서 실행된 SQL 모양별 통계"""
+        st.subheader("SQL 모양별 통계")
+        shapes = self.manager.get_query_shapes()
+        if shapes.empty:
+            st.info("실행된 쿼리가 없습니다.")
+            return
+
+        st.dataframe(shapes, hide_index=True)
+        if st.button("통계 초기화"):
+            self.manager.reset_query_stats()
+            st.rerun()
@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Dict, List, Optional
+
+# 관리자 전용 화면을 볼 수 있는 역할
+ADMIN_ROLE = '관리자'
+
+
+@dataclass(frozen=True)
+class ViewSpec:
+    """메뉴 항목별 화면 정의 (모듈은 처음 선택될 때 가져옴)"""
+    module: str
+    class_name: str
+    manager: str
+    render: str
+    admin_only: bool = False
+
+
+@dataclass(frozen=True)
+class ManagerSpec:
+    """화면이 사용하는 매니저 정의"""
+    module: str
+    class_name: str
+    needs_config: bool = False
+
+
+MANAGERS: Dict[str, ManagerSpec] = {
+    'prompt_manager': ManagerSpec('src.managers.prompt_manager', 'PromptManager'),
+    'history_manager': ManagerSpec('src.managers.history_manager', 'HistoryManager'),
+    'analytics_manager': ManagerSpec('src.managers.analytics_manager', 'AnalyticsManager'),
+    'test_manager': ManagerSpec('src.managers.test_manager', 'TestManager', needs_config=True),
+    'metrics_manager': ManagerSpec('src.managers.metrics_manager', 'MetricsManager'),
+    'compression_manager': ManagerSpec('src.managers.compression_manager', 'CompressionManager'),
+    'backup_manager': ManagerSpec('src.managers.backup_manager', 'BackupManager', needs_config=True)
+}
+
+# 메뉴 표시 순서대로 등록
+VIEWS: Dict[str, ViewSpec] = {
+    "프롬프트 작성": ViewSpec(
+        'src.views.prompt_view', 'PromptView', 'prompt_manager', 'render_creation_form'
+    ),
+    "프롬프트 히스토리": ViewSpec(
+        'src.views.history_view', 'HistoryView', 'history_manager', 'render_history'
+    ),
+    "버전 비교": ViewSpec(
+        'src.views.comparison_view', 'ComparisonView', 'test_manager', 'render_comparison'
+    ),
+    "일관성 테스트": ViewSpec(
+        'src.views.consistency_test_view', 'ConsistencyTestView', 'test_manager', 'render_test_form'
+    ),
+    "분석 대시보드": ViewSpec(
+        'src.views.analytics_view', 'AnalyticsView', 'analytics_manager', 'render_analytics'
+    ),
+    "변경 이력": ViewSpec(
+        'src.views.change_log_view', 'ChangeLogView', 'history_manager', 'render_change_logs'
+    ),
+    "성능 지표": ViewSpec(
+        'src.views.metrics_view', 'MetricsView', 'metrics_manager', 'render_metrics',
+        admin_only=True
+    ),
+    "느린 쿼리": ViewSpec(
+        'src.views.query_view', 'QueryView', 'metrics_manager', 'render_queries',
+        admin_only=True
+    ),
+    "메모리 사용량": ViewSpec(
+        'src.views.memory_view', 'MemoryView', 'metrics_manager', 'render_memory',
+        admin_only=True
+    ),
+    "본문 압축": ViewSpec(
+        'src.views.compression_view', 'CompressionView', 'compression_manager', 'render_compression',
+        admin_only=True
+    ),
+    "백업": ViewSpec(
+        'src.views.backup_view', 'BackupView', 'backup_manager', 'render_backups',
+        admin_only=True
+    )
+}
+
+
+def menu_labels(role: Optional[str] = None) -> List[str]:
+    """사이드바 메뉴 목록 (관리자 전용 화면은 관리자에게만)"""
+    return [label for label, spec in VIEWS.items() if can_view(label, role)]
+
+
+def can_view(label: str, role: Optional[str]) -> bool:
+    """역할별 화면 접근 허용 여부"""
+    return not VIEWS[label].admin_only or role == ADMIN_ROLE
+
+
+def load_class(module: str, class_name: str):
+    """모듈을 가져와 클래스 반환 (이미 가져온 모듈은 sys.modules 에서 재사용)"""
+    return getattr(import_module(module), class_name)
+
+
+def create_manager(name: str, database, config):
+    """매니저 생성"""
+    spec = MANAGERS[name]
+    manager_class = load_class(spec.module, spec.class_name)
+    if spec.needs_config:
+        return manager_class(config, database)
+    return manager_class(database)
+
+
+def render_view(label: str, manager):
+    """선택된 메뉴의 화면 렌더링"""
+    spec = VIEWS[label]
+    view = load_class(spec.module, spec.class_name)(manager)
+    getattr(view, spec.render)()
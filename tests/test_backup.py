@@ -0,0 +1,115 @@
+import os
+import sqlite3
+import pytest
+from src.database import backup as backup_module
+from src.database.backup import BackupError, BackupService
+from src.database.database import PromptDatabase
+
+
+def add_prompts(database, count, title='prompt'):
+    for i in range(count):
+        database.save_prompt({
+            'title': f'{title} {i}',
+            'model': 'stub',
+            'version': '1',
+            'category': 'test',
+            'prompt_content': f'{title} content {i} ' * 50,
+            'created_by': 'tester'
+        })
+
+
+def count_prompts(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute('SELECT COUNT(*) FROM prompts').fetchone()[0]
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = PromptDatabase(str(tmp_path / 'prompts.db'))
+    add_prompts(database, 20)
+    return database
+
+
+@pytest.fixture
+def service(database, tmp_path):
+    return BackupService(database.db_path, str(tmp_path / 'backups'), step_pages=4, step_sleep=0, keep=2)
+
+
+def test_database_uses_wal(database):
+    conn = sqlite3.connect(database.db_path)
+    assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+    conn.close()
+
+
+def test_backup_creates_verified_single_file_snapshot(service):
+    result = service.backup()
+
+    assert result.error is None and result.integrity == 'ok'
+    assert os.path.exists(result.path) and not os.path.exists(result.path + '.partial')
+    assert not os.path.exists(result.path + '-wal')
+    assert count_prompts(result.path) == 20
+    assert service.verify(result.path, 'integrity') == 'ok'
+    assert service.last_result is result
+
+
+def test_rotation_keeps_latest_snapshots(service):
+    paths = [service.backup().path for _ in range(3)]
+
+    assert len(set(paths)) == 3
+    assert [backup['path'] for backup in service.list_backups()] == paths[:0:-1]
+
+
+def test_verify_reports_corrupt_snapshot(service, tmp_path):
+    corrupt = tmp_path / 'corrupt.db'
+    corrupt.write_bytes(b'not a database' * 100)
+
+    assert service.verify(str(corrupt)) != 'ok'
+    with pytest.raises(BackupError):
+        service.restore(str(corrupt))
+
+
+def test_restore_replaces_data_and_bumps_versions(database, service):
+    snapshot = service.backup().path
+    add_prompts(database, 5, title='later')
+    before = dict(sqlite3.connect(database.db_path).execute('SELECT scope, version FROM data_versions'))
+
+    result = service.restore(snapshot)
+
+    assert count_prompts(database.db_path) == 20
+    assert count_prompts(result['pre_restore_backup']) == 25
+    assert os.path.exists(snapshot)
+    conn = sqlite3.connect(database.db_path)
+    after = dict(conn.execute('SELECT scope, version FROM data_versions'))
+    assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+    conn.close()
+    assert all(after[scope] > version for scope, version in before.items())
+
+
+def test_busy_rollback_journal_backup_is_abandoned(database, service, monkeypatch):
+    conn = sqlite3.connect(database.db_path)
+    conn.execute('PRAGMA journal_mode=DELETE')
+    conn.close()
+
+    # 단계 사이마다 다른 연결이 쓰면 롤백 저널 모드에서는 복사가 처음부터 다시 시작됨
+    def write_between_steps(seconds):
+        writer = sqlite3.connect(database.db_path)
+        with writer:
+            writer.execute("UPDATE data_versions SET version = version + 1 WHERE scope = 'rules'")
+        writer.close()
+
+    monkeypatch.setattr(backup_module.time, 'sleep', write_between_steps)
+    service.step_sleep = 0.001
+
+    with pytest.raises(BackupError, match='다시 시작'):
+        service.backup()
+    assert service.list_backups() == []
+    assert not [name for name in os.listdir(service.directory) if name.endswith('.partial')]
+
+
+def test_concurrent_backup_is_refused(service):
+    with service._process_lock():
+        with pytest.raises(BackupError):
+            service.backup()
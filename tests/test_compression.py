@@ -0,0 +1,128 @@
+import random
+import sqlite3
+import pytest
+from src.database import compression
+from src.database.compression import (
+    MAGIC,
+    TextCodec,
+    is_compressed,
+    raw_length,
+    raw_length_sql,
+    train_dictionary
+)
+
+TEXT = '요청하신 내용을 검토했습니다. The answer follows the expected format.\n' * 200
+
+
+@pytest.fixture
+def small_min_bytes(monkeypatch):
+    monkeypatch.setattr(compression.settings, 'min_bytes', 64)
+
+
+def test_round_trip_without_dictionary(small_min_bytes):
+    codec = TextCodec(lambda dict_id: None)
+    encoded = codec.encode(TEXT)
+    assert is_compressed(encoded)
+    assert len(encoded) < len(TEXT.encode('utf-8'))
+    assert raw_length(encoded) == len(TEXT.encode('utf-8'))
+    assert codec.decode(encoded) == TEXT
+
+
+def test_round_trip_with_dictionary(small_min_bytes):
+    dictionary = train_dictionary([TEXT, TEXT[::-1], TEXT])
+    codec = TextCodec({7: dictionary}.get)
+    encoded = codec.encode(TEXT, dict_id=7)
+    assert compression.dictionary_id(encoded) == 7
+    # 사전은 ID 로 다시 불러와 풀 수 있어야 함
+    assert TextCodec({7: dictionary}.get).decode(encoded) == TEXT
+
+
+def test_small_or_poorly_compressed_values_are_stored_as_is(small_min_bytes, monkeypatch):
+    codec = TextCodec(lambda dict_id: None)
+    assert codec.encode('short') == 'short'
+    assert codec.encode(None) is None
+
+    rng = random.Random(1)
+    noise = ''.join(chr(rng.randrange(32, 127)) for _ in range(400))
+    monkeypatch.setattr(compression.settings, 'max_ratio', 0.5)
+    assert codec.encode(noise) == noise
+    assert is_compressed(codec.encode(TEXT))
+    assert codec.decode('plain text') == 'plain text'
+
+
+def test_missing_dictionary_raises(small_min_bytes):
+    codec = TextCodec({1: train_dictionary([TEXT, TEXT])}.get)
+    encoded = codec.encode(TEXT, dict_id=1)
+    with pytest.raises(ValueError):
+        TextCodec(lambda dict_id: None).decode(encoded)
+
+
+def test_raw_length_sql_matches_udf(small_min_bytes):
+    codec = TextCodec(lambda dict_id: None)
+    values = [TEXT, codec.encode(TEXT), '한글', None, b'raw-bytes']
+    assert is_compressed(values[1]) and values[1].startswith(MAGIC)
+
+    conn = sqlite3.connect(':memory:')
+    conn.create_function('raw_length', 1, raw_length, deterministic=True)
+    conn.execute('CREATE TABLE t (v)')
+    conn.executemany('INSERT INTO t VALUES (?)', [(value,) for value in values])
+    rows = conn.execute(f'SELECT raw_length(v), {raw_length_sql("v")} FROM t').fetchall()
+    assert all(udf == sql for udf, sql in rows)
+
+
+def journal_state(path):
+    conn = sqlite3.connect(path)
+    try:
+        version = conn.execute("SELECT version FROM data_versions WHERE scope = 'prompts'").fetchone()[0]
+        changes = conn.execute('SELECT COUNT(*) FROM prompt_changes').fetchone()[0]
+        return version, changes
+    finally:
+        conn.close()
+
+
+def test_recompress_leaves_versions_and_change_journal_alone(tmp_path, small_min_bytes, monkeypatch):
+    from src.database.database import PromptDatabase
+    from src.managers.compression_manager import CompressionManager
+
+    database = PromptDatabase(str(tmp_path / 'prompts.db'))
+    for i in range(5):
+        database.save_prompt({
+            'title': f'prompt {i}', 'model': 'stub', 'version': '1', 'category': 'test',
+            'prompt_content': TEXT, 'chatbot_response': TEXT, 'created_by': 'tester'
+        })
+    before = journal_state(database.db_path)
+
+    monkeypatch.setattr(compression.settings, 'enabled', True)
+    result = CompressionManager(database).recompress(pause_sec=0)
+
+    assert result['changed_values'] == 10
+    assert journal_state(database.db_path) == before
+    assert database.get_prompt(1)['prompt_content'] == TEXT
+
+    # 일반 수정은 그대로 기록됨
+    conn = sqlite3.connect(database.db_path)
+    with conn:
+        conn.execute("UPDATE prompts SET title = 'edited' WHERE id = 1")
+    conn.close()
+    version, changes = journal_state(database.db_path)
+    assert version > before[0] and changes == before[1] + 1
+
+
+def test_old_update_triggers_are_replaced(tmp_path):
+    from src.database.database import PromptDatabase
+
+    path = str(tmp_path / 'prompts.db')
+    PromptDatabase(path)
+    conn = sqlite3.connect(path)
+    conn.executescript('''
+        DROP TRIGGER trg_prompts_version_update;
+        CREATE TRIGGER trg_prompts_version_update AFTER UPDATE ON prompts
+        BEGIN UPDATE data_versions SET version = version + 1 WHERE scope = 'prompts'; END;
+    ''')
+    conn.close()
+
+    PromptDatabase(path)
+    conn = sqlite3.connect(path)
+    sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'trg_prompts_version_update'").fetchone()[0]
+    conn.close()
+    assert 'silent_writes' in sql
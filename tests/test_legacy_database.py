@@ -0,0 +1,43 @@
+import sqlite3
+from prompt_database import PromptDatabase as LegacyPromptDatabase
+from src.database.database import PromptDatabase
+from src.managers.duplicate_manager import DuplicateManager
+from src.managers.keyword_manager import KeywordManager
+
+DATA = {
+    'title': '고객 문의 요약', 'description': '상담 기록 요약', 'model': 'stub', 'version': '1',
+    'category': 'test', 'query': '주문 배송 지연 문의',
+    'prompt_content': '다음 상담 기록을 세 줄로 요약해 주세요. 배송 지연 원인과 조치 사항을 포함합니다.',
+    'created_by': 'tester'
+}
+
+
+def rows(path, query):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(query).fetchall()
+    finally:
+        conn.close()
+
+
+def test_legacy_save_indexes_keywords_and_minhash_like_the_new_path(tmp_path):
+    legacy = LegacyPromptDatabase(str(tmp_path / 'legacy.db'))
+    legacy_id = legacy.save_prompt(dict(DATA))
+
+    shared = PromptDatabase(str(tmp_path / 'shared.db'))
+    duplicates = DuplicateManager(shared)
+    shared_id = shared.save_prompt(dict(DATA), minhash=duplicates.minhash(DATA['prompt_content']))
+    KeywordManager(shared).index_prompt(shared_id, DATA)
+
+    for query in (
+        'SELECT term, tf FROM prompt_terms ORDER BY term',
+        'SELECT term, df FROM term_stats ORDER BY term',
+        'SELECT signature FROM prompt_minhash',
+        'SELECT band, bucket FROM prompt_lsh_buckets ORDER BY band'
+    ):
+        assert rows(legacy.db_path, query) == rows(shared.db_path, query), query
+    assert rows(legacy.db_path, 'SELECT COUNT(*) FROM prompt_terms') != [(0,)]
+
+    keywords = KeywordManager(legacy.shared).get_prompt_keywords(legacy_id)
+    assert keywords and all(score > 0 for _, score in keywords)
+    assert [row['id'] for row in DuplicateManager(legacy.shared).find_near_duplicates(DATA['prompt_content'])] == [legacy_id]
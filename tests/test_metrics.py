@@ -0,0 +1,87 @@
+from collections import Counter
+import random
+import numpy as np
+import pytest
+from src.utils.metrics import SCORE_COLUMNS, BatchMetrics
+from src.utils.tokenizer import tokenize
+
+WORDS = ['프롬프트', '답변을', '답변', 'the', 'model', 'returns', 'json', '결과', '확인', 'a', '1', 'ok']
+
+
+def reference_f1(response, expected):
+    """토큰 F1 참조 구현 (이전 score_pair 와 같은 방식)"""
+    response_tokens = Counter(tokenize(response))
+    expected_tokens = Counter(tokenize(expected))
+    common = sum((response_tokens & expected_tokens).values())
+    precision = common / sum(response_tokens.values()) if response_tokens else 0.0
+    recall = common / sum(expected_tokens.values()) if expected_tokens else 0.0
+    return 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+
+
+def reference_rouge_l(response, expected):
+    """ROUGE-L F1 참조 구현 (쌍별 LCS 동적 계획법)"""
+    a, b = tokenize(response), tokenize(expected)
+    if not a or not b:
+        return 0.0
+    previous = [0] * (len(b) + 1)
+    for token in a:
+        current = [0]
+        for j, other in enumerate(b):
+            current.append(previous[j] + 1 if token == other else max(previous[j + 1], current[j]))
+        previous = current
+    lcs = previous[-1]
+    if lcs == 0:
+        return 0.0
+    precision, recall = lcs / len(a), lcs / len(b)
+    return 2 * precision * recall / (precision + recall)
+
+
+def random_pairs(count, seed=7):
+    rng = random.Random(seed)
+
+    def text():
+        words = [rng.choice(WORDS) for _ in range(rng.randint(0, 40))]
+        return ' '.join(word + rng.choice(['', '', ',', '.']) for word in words)
+
+    pairs = []
+    for _ in range(count):
+        response = text()
+        expected = response.upper() if rng.random() < 0.1 else text()
+        pairs.append((response, expected))
+    return pairs
+
+
+def test_matches_reference_implementation():
+    pairs = random_pairs(300)
+    scores = BatchMetrics(chunk_cells=2000).score(*map(list, zip(*pairs)))
+
+    for i, (response, expected) in enumerate(pairs):
+        if not tokenize(expected):
+            assert scores.iloc[i].isna().all()
+            continue
+        assert scores['token_f1'].iloc[i] == pytest.approx(reference_f1(response, expected))
+        assert scores['rouge_l'].iloc[i] == pytest.approx(reference_rouge_l(response, expected))
+        assert scores['exact_match'].iloc[i] == float(tokenize(response) == tokenize(expected))
+
+
+def test_exact_match_ignores_case_and_punctuation():
+    scores = BatchMetrics().score(['Hello,  World!'], ['hello world'])
+    assert scores['exact_match'].tolist() == [1.0]
+
+
+def test_exact_match_compares_beyond_token_limit():
+    shared = ' '.join(['word'] * 20)
+    scores = BatchMetrics(max_tokens=10).score([shared + ' end'], [shared + ' other'])
+    assert scores['exact_match'].tolist() == [0.0]
+
+
+def test_empty_input_and_missing_expected():
+    assert list(BatchMetrics().score([], []).columns) == SCORE_COLUMNS
+
+    scores = BatchMetrics().score(['answer', None], [None, ''])
+    assert np.isnan(scores.to_numpy()).all()
+
+
+def test_length_mismatch_raises():
+    with pytest.raises(ValueError):
+        BatchMetrics().score(['a'], [])
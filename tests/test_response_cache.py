@@ -0,0 +1,86 @@
+import asyncio
+import pytest
+from src.backends.base import ModelRequest, ModelResponse
+from src.backends.stub_backend import StubBackend
+from src.database.database import PromptDatabase
+from src.managers.response_cache import ResponseCache
+from src.managers.test_runner import ConsistencyTestRunner
+
+
+def request(repetition=0, **params):
+    return ModelRequest(model='stub', prompt='say hi', params=params, repetition=repetition)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(PromptDatabase(str(tmp_path / 'prompts.db')))
+
+
+class CountingBackend(StubBackend):
+    def __init__(self):
+        super().__init__(latency_ms=20, rate_per_second=0)
+        self.calls = 0
+
+    async def generate(self, request):
+        self.calls += 1
+        return await super().generate(request)
+
+
+def run(runner, requests, use_cache=True):
+    async def collect():
+        return [result async for result in runner.run(requests, use_cache)]
+    return asyncio.run(collect())
+
+
+def test_deterministic_requests_share_a_key_across_repetitions():
+    assert ResponseCache.make_key(request(0)) == ResponseCache.make_key(request(3))
+    assert ResponseCache.make_key(request(0, temperature=0)) == ResponseCache.make_key(request(3, temperature=0))
+
+
+def test_sampled_requests_are_keyed_by_repetition():
+    assert ResponseCache.make_key(request(0, temperature=0.7)) != ResponseCache.make_key(request(1, temperature=0.7))
+    assert ResponseCache.make_key(request(0, temperature=0.7)) != ResponseCache.make_key(request(0, temperature=0.5))
+
+
+def test_key_ignores_param_order_and_includes_model():
+    first = ModelRequest(model='stub', prompt='p', params={'a': 1, 'b': 2})
+    second = ModelRequest(model='stub', prompt='p', params={'b': 2, 'a': 1})
+    other = ModelRequest(model='other', prompt='p', params={'a': 1, 'b': 2})
+    assert ResponseCache.make_key(first) == ResponseCache.make_key(second)
+    assert ResponseCache.make_key(first) != ResponseCache.make_key(other)
+
+
+def test_get_returns_stored_response(cache):
+    assert cache.get(request()) is None
+    cache.put(request(), ModelResponse(model='stub', text='hello', input_tokens=2, output_tokens=1))
+
+    cached = cache.get(request(repetition=5))
+    assert (cached.text, cached.input_tokens, cached.output_tokens) == ('hello', 2, 1)
+    assert cache.get(request(temperature=0.7)) is None
+
+
+def test_runner_keeps_sampled_repetitions_distinct(cache):
+    runner = ConsistencyTestRunner({'stub': StubBackend(rate_per_second=0)}, cache=cache)
+    requests = [request(i, temperature=0.7) for i in range(4)]
+
+    first = {r['repetition']: r['response'] for r in run(runner, requests)}
+    second = run(runner, requests)
+    assert len(set(first.values())) > 1
+    assert all(r['cached'] and r['response'] == first[r['repetition']] for r in second)
+
+
+def test_runner_calls_backend_once_for_concurrent_identical_requests(cache):
+    backend = CountingBackend()
+    runner = ConsistencyTestRunner({'stub': backend}, cache=cache)
+
+    results = run(runner, [request(i) for i in range(5)])
+    assert backend.calls == 1
+    assert sum(r['cached'] for r in results) == 4
+    assert len({r['response'] for r in results}) == 1
+
+
+def test_stub_treats_missing_temperature_as_deterministic():
+    backend = StubBackend(rate_per_second=0)
+    first = asyncio.run(backend.generate(request(0, temperature=None)))
+    second = asyncio.run(backend.generate(request(1, temperature=None)))
+    assert first.text == second.text
@@ -0,0 +1,69 @@
+import random
+import pytest
+from src.utils.rule_engine import RuleEngine
+
+FRAGMENTS = [
+    'please', 'Please ', 'analyze', 'EXPLAIN', 'describe', 'descri', '예시', 'Example', 'exam',
+    '[', ']', '{', '}', '{{ name }}', '# Output', 'Role:', ' ', '\n', '요약해 주세요', 'text', '.',
+    # IGNORECASE 로는 맞지만 lower() 가 키워드와 다른 유니코드 변형
+    'Pleaſe', 'EXPLAİN', 'ſ', 'İ', 'K', 'EXAMPLE'
+]
+
+
+def legacy_structure(prompt):
+    """규칙 엔진 이전의 구조 검사 (TestManager.validate_prompt_structure)"""
+    return {
+        'has_context': len(prompt.strip()) > 0,
+        'has_instruction': any(keyword in prompt.lower()
+                               for keyword in ['please', 'analyze', 'explain', 'describe']),
+        'has_example': '예시' in prompt or 'example' in prompt.lower(),
+        'has_format_specification': any(char in prompt for char in ['[', ']', '{', '}'])
+    }
+
+
+def test_default_rules_match_legacy_heuristics():
+    engine = RuleEngine()
+    rng = random.Random(3)
+    for _ in range(2000):
+        prompt = ''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 12)))
+        result = engine.evaluate(prompt)
+        legacy = legacy_structure(prompt)
+        assert {name: result[name] for name in legacy} == legacy, prompt
+
+
+@pytest.mark.parametrize('text', ['Pleaſe do it', 'EXPLAİN this', 'DESCRİBE', 'exampſe'])
+def test_unicode_case_variants_do_not_raise(text):
+    result = RuleEngine().evaluate(text)
+    legacy = legacy_structure(text)
+    assert {name: result[name] for name in legacy} == legacy
+
+
+@pytest.mark.parametrize('text, passed', [
+    ('## Output\nRole: reviewer', True),
+    ('[Output]\n**Role**', True),
+    ('Output: json\n# Role #', True),
+    ('  output  \n[ role ]', True),
+    ('Outputs vary\nRole: reviewer', False),
+    ('Output format\nRole:', False),
+    ('Role: reviewer', False),
+])
+def test_section_names_need_a_terminator(text, passed):
+    engine = RuleEngine([{'name': 'sections', 'type': 'sections', 'sections': ['Output', 'Role']}])
+    assert engine.evaluate(text) == {'sections': passed}
+
+
+def test_placeholders_and_token_limit():
+    engine = RuleEngine([
+        {'name': 'any_placeholder', 'type': 'placeholders'},
+        {'name': 'named', 'type': 'placeholders', 'placeholders': ['topic']},
+        {'name': 'short', 'type': 'max_tokens', 'max_tokens': 3}
+    ])
+    assert engine.evaluate('write {{ topic }}') == {'any_placeholder': True, 'named': True, 'short': True}
+    assert engine.evaluate('one two three {{other}}') == {'any_placeholder': True, 'named': False, 'short': False}
+
+
+def test_invalid_rules_raise():
+    with pytest.raises(ValueError):
+        RuleEngine([{'name': 'x', 'type': 'unknown'}])
+    with pytest.raises(ValueError):
+        RuleEngine([{'name': 'x', 'type': 'keywords', 'keywords': []}])
@@ -0,0 +1,35 @@
+import pytest
+from src.database.database import PromptDatabase
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = PromptDatabase(str(tmp_path / 'prompts.db'))
+    for title in ('json 응답 형식', '요약 프롬프트', 'json schema'):
+        database.save_prompt({
+            'title': title, 'model': 'stub', 'version': '1', 'category': 'test',
+            'prompt_content': f'{title} 내용', 'created_by': 'tester'
+        })
+    return database
+
+
+def test_ranked_results_carry_scores(database):
+    results, total = database.search_ranked('json')
+    assert total == 2
+    assert set(results['title']) == {'json 응답 형식', 'json schema'}
+    assert results['score'].notna().all()
+
+
+@pytest.mark.parametrize('term', ['', '   ', '\t\n'])
+def test_blank_term_returns_recent_prompts_with_score_column(database, term):
+    results, total = database.search_ranked(term)
+    assert total == 3
+    assert list(results.columns[:2]) == ['score', 'id']
+    assert results['score'].isna().all()
+
+
+def test_history_page_with_only_id_or_unknown_columns(database):
+    for columns in (['id'], ['no_such_column'], ['title', 'id']):
+        page = database.get_history_page(columns=columns)
+        assert len(page) == 3
+        assert page.columns[0] == 'id'
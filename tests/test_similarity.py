@@ -0,0 +1,60 @@
+import sqlite3
+from src.database.database import PromptDatabase
+from src.managers.similarity_manager import SimilarityManager, VectorIndex
+
+
+def make_prompt(index):
+    return {
+        'title': f'배송 문의 요약 {index}', 'description': '상담 기록 요약', 'model': 'stub',
+        'version': '1', 'category': 'test', 'query': '주문 배송 지연 문의',
+        'prompt_content': f'배송 지연 상담 기록을 요약해 주세요. 사례 {index}',
+        'created_by': 'tester'
+    }
+
+
+def delete_prompt(path, prompt_id):
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute('DELETE FROM prompts WHERE id = ?', (prompt_id,))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def setup(tmp_path, count):
+    database = PromptDatabase(str(tmp_path / 'prompts.db'))
+    manager = SimilarityManager(database)
+    ids = []
+    for index in range(count):
+        data = make_prompt(index)
+        prompt_id = database.save_prompt(data)
+        manager.index_prompt(prompt_id, data)
+        ids.append(prompt_id)
+    return database, manager, ids
+
+
+def test_deleted_prompts_leave_the_index_and_top_k_stays_full(tmp_path):
+    database, manager, ids = setup(tmp_path, 6)
+    manager.find_similar(ids[0], top_k=3)
+
+    for prompt_id in ids[1:3]:
+        delete_prompt(database.db_path, prompt_id)
+
+    results = manager.find_similar(ids[0], top_k=3)
+    found = [row['id'] for row in results]
+    assert len(found) == 3
+    assert not set(found) & set(ids[1:3])
+
+    text_results = manager.find_similar_text('배송 지연 상담 기록 요약', top_k=4)
+    assert [row['id'] for row in text_results] and len(text_results) == 4
+    assert not {row['id'] for row in text_results} & set(ids[1:3])
+
+
+def test_fresh_index_skips_vectors_of_deleted_prompts(tmp_path):
+    database, _, ids = setup(tmp_path, 3)
+    delete_prompt(database.db_path, ids[1])
+
+    index = VectorIndex(database, VectorIndex.for_database(database).vectorizer)
+    index.sync()
+    assert index.get_vector(ids[1]) is None
+    assert index.get_vector(ids[0]) is not None
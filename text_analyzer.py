@@ -1,6 +1,8 @@
 # text_analyzer.py
 import difflib
+from src.utils.instrumentation import instrument_methods
 
+@instrument_methods('legacy_text_analyzer', rows=False)
 class TextAnalyzer:
     @staticmethod
     def count_stats(text):
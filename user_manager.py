@@ -1,37 +1,47 @@
 # user_manager.py
-import pandas as pd
+import csv
 import os
-from datetime import datetime
+from src.database.database import PromptDatabase
 
 class UserManager:
-    def __init__(self, filepath='users.csv'):
+    def __init__(self, db_path='prompts.db', filepath='users.csv'):
+        self.database = PromptDatabase(db_path)
         self.filepath = filepath
-        self.users = self._load_users()
-        
-    def _load_users(self):
-        if os.path.exists(self.filepath):
-            return pd.read_csv(self.filepath)
-        return pd.DataFrame(columns=['user_id', 'username', 'created_at'])
-    
+        self._migrate_csv()
+
+    def _migrate_csv(self):
+        """이전 users.csv 를 사용자 테이블로 한 번만 옮김 (옮긴 파일은 .migrated 로 보관)"""
+        if not os.path.exists(self.filepath):
+            return
+
+        with open(self.filepath, newline='', encoding='utf-8') as f:
+            users = [
+                {'username': row['username'].strip(), 'created_at': row.get('created_at') or None}
+                for row in csv.DictReader(f)
+                if (row.get('username') or '').strip()
+            ]
+        self.database.import_users(users)
+
+        try:
+            os.replace(self.filepath, self.filepath + '.migrated')
+        except FileNotFoundError:
+            # 다른 프로세스가 먼저 옮긴 경우 (등록은 중복 없이 건너뜀)
+            pass
+
     def save_user(self, username):
-        if self.user_exists(username):
+        username = username.strip()
+        if not username:
+            return False, "이름을 입력해주세요."
+
+        if self.database.create_user(username) is None:
             return False, "이미 존재하는 사용자입니다."
-            
-        new_user = {
-            'user_id': len(self.users) + 1,
-            'username': username,
-            'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-        
-        self.users = pd.concat([self.users, pd.DataFrame([new_user])], ignore_index=True)
-        self._save_to_storage()
         return True, "사용자가 성공적으로 등록되었습니다."
-    
+
     def user_exists(self, username):
-        return username in self.users['username'].values
-    
+        return self.database.user_exists(username)
+
+    def get_usernames(self):
+        return self.database.get_usernames()
+
     def get_all_users(self):
-        return self.users
-    
-    def _save_to_storage(self):
-        self.users.to_csv(self.filepath, index=False)
\ No newline at end of file
+        return self.database.get_users()